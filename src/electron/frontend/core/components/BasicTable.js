@@ -116,6 +116,13 @@ export class BasicTable extends LitElement {
             #buttons {
                 margin-top: 10px;
             }
+
+            #pages {
+                display: flex;
+                align-items: center;
+                gap: 10px;
+                margin-top: 10px;
+            }
         `;
     }
 
@@ -133,6 +140,10 @@ export class BasicTable extends LitElement {
         onUpdate,
         editable = true,
         truncated = false,
+        rowCount,
+        getRows,
+        pageSize = 50,
+        onThrow,
     } = {}) {
         super();
         this.name = name ?? "data_table";
@@ -148,9 +159,19 @@ export class BasicTable extends LitElement {
         if (onUpdate) this.onUpdate = onUpdate;
         if (onStatusChange) this.onStatusChange = onStatusChange;
         if (onLoaded) this.onLoaded = onLoaded;
+        if (onThrow) this.onThrow = onThrow;
 
         this.truncated = truncated;
         this.editable = editable && !truncated;
+
+        // Only hold one page of rows if these are requested on demand
+        this.rowCount = rowCount;
+        this.pageSize = pageSize;
+        this.offset = 0;
+        if (getRows) {
+            this.getRows = getRows;
+            this.#loadPage(0);
+        }
     }
 
     #schema = {};
@@ -250,6 +271,23 @@ export class BasicTable extends LitElement {
     status;
     onStatusChange = () => {};
     onLoaded = () => {};
+    onThrow = () => {};
+
+    #loadPage = async (offset) => {
+        try {
+            this.data = await this.getRows(offset, this.pageSize);
+            this.offset = offset;
+            this.requestUpdate();
+        } catch (error) {
+            this.onThrow(error.message);
+        }
+    };
+
+    #getAllData = async () => {
+        if (!this.getRows) return this.#data;
+        const rows = await this.getRows(0, this.rowCount);
+        return rows.map((row) => this.colHeaders.map((col) => row[col] ?? this.#itemProps[col]?.default));
+    };
 
     #getType = (value, { type, data_type } = {}) => {
         let inferred = typeof value;
@@ -367,8 +405,7 @@ export class BasicTable extends LitElement {
     #keys = [];
     #data = [];
 
-    #getTSV = () => {
-        const data = this.#data;
+    #getTSV = (data = this.#data) => {
         let keys = [...this.#keys];
 
         const sections = [
@@ -404,6 +441,12 @@ export class BasicTable extends LitElement {
             }, {})
         );
 
+        // The uploaded rows replace all of the rows that were requested on demand
+        if (this.getRows) {
+            delete this.getRows;
+            this.data = [];
+        }
+
         Object.keys(this.data).forEach((row) => delete this.data[row]); // Delete all previous rows
 
         Object.keys(data).forEach((row) => {
@@ -431,7 +474,9 @@ export class BasicTable extends LitElement {
         this.schema = this.schema; // Always update the schema
         const entries = this.#itemProps;
 
-        if (this.truncated) this.data = this.data.slice(0, 5); // Limit to 5 rows when truncated
+        const paged = !!this.getRows;
+
+        if (this.truncated && !paged) this.data = this.data.slice(0, 5); // Limit to 5 rows when truncated
 
         // Add existing additional properties to the entries variable if necessary
         if (this.#itemSchema.additionalProperties) {
@@ -526,8 +571,11 @@ export class BasicTable extends LitElement {
                       >
                       <nwb-button
                           size="small"
-                          @click=${() => {
-                              const tsv = this.#getTSV();
+                          @click=${async () => {
+                              const data = await this.#getAllData().catch((error) => this.onThrow(error.message));
+                              if (!data) return;
+
+                              const tsv = this.#getTSV(data);
 
                               const element = document.createElement("a");
                               element.setAttribute(
@@ -544,7 +592,27 @@ export class BasicTable extends LitElement {
                       >
                   </div>`
                 : ""}
-            ${this.truncated
+            ${paged
+                ? html`<div id="pages">
+                      <nwb-button
+                          size="small"
+                          ?disabled=${this.offset === 0}
+                          @click=${() => this.#loadPage(Math.max(this.offset - this.pageSize, 0))}
+                          >Previous</nwb-button
+                      >
+                      <small>
+                          Rows ${this.offset + Math.min(data.length, 1)}–${this.offset + data.length} of
+                          ${this.rowCount}
+                      </small>
+                      <nwb-button
+                          size="small"
+                          ?disabled=${this.offset + this.pageSize >= this.rowCount}
+                          @click=${() => this.#loadPage(this.offset + this.pageSize)}
+                          >Next</nwb-button
+                      >
+                  </div>`
+                : ""}
+            ${this.truncated && !paged
                 ? html`<p style="margin: 0; width: 100%; text-align: center; font-size: 150%;">...</p>`
                 : ""}
         `;
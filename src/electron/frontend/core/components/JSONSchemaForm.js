@@ -16,7 +16,7 @@ import { InspectorListItem } from "./InspectorList";
 import { Validator } from "jsonschema";
 import { successHue, warningHue, errorHue } from "./globals";
 import { Button } from "./Button";
-import { isObject } from "../../utils/typecheck";
+import { isObject, isTableSummary } from "../../utils/typecheck";
 
 const encode = (str) => {
     try {
@@ -519,6 +519,11 @@ export class JSONSchemaForm extends LitElement {
                     if (e.argument === null) return;
                 }
 
+                // Allow summaries of tables whose rows are requested one page at a time (see BasicTable)
+                if (e.message.includes("is not of a type(s)")) {
+                    if (resolvedSchema.type === "array" && isTableSummary(resolvedValue)) return;
+                }
+
                 // Allow referring to floats as null (i.e. JSON NaN representation)
                 if (e.message.includes("is not of a type(s)")) {
                     if (resolvedSchema.type === "number") {
@@ -18,7 +18,7 @@ import { merge } from "../../utils/data";
 import { OptionalSection } from "./OptionalSection";
 import { InspectorListItem } from "./InspectorList.js";
 import { renderDateTime, resolveDateTime } from "./DateTimeSelector";
-import { isObject } from "../../utils/typecheck";
+import { isObject, isTableSummary } from "../../utils/typecheck";
 import { resolve } from "../../utils/promises";
 
 const isDevelopment = !!import.meta.env;
@@ -230,8 +230,11 @@ export function createTable(fullPath, { onUpdate, onThrow, overrides = {} }) {
 
     const schemaCopy = structuredClone(schema);
 
+    // Summarized tables have no rows yet, which are requested one page at a time (see BasicTable)
+    const isSummary = isTableSummary(this.value);
+
     // Possibly multiple tables
-    if (isEditableObject(schema, this.value)) {
+    if (!isSummary && isEditableObject(schema, this.value)) {
         // One table with nested tables for each property
         const data = getEditableItems(this.value, this.pattern, { name, schema: schemaCopy }).reduce(
             (acc, { key, value }) => {
@@ -255,7 +258,8 @@ export function createTable(fullPath, { onUpdate, onThrow, overrides = {} }) {
     // Normal table parsing
     const tableMetadata = {
         schema: schemaCopy,
-        data: this.value,
+        data: isSummary ? [] : this.value,
+        rowCount: isSummary ? this.value.row_count : undefined,
 
         ignore: nestedIgnore, // According to schema
 
@@ -11,6 +11,7 @@ import { getRandomSample } from "../../../utils/random";
 import { resolveMetadata } from "../../../utils/data";
 import Swal from "sweetalert2";
 import { createProgressPopup } from "../../../utils/popups";
+import { warmUpInterfaces } from "../../server/index.js";
 
 export class Page extends LitElement {
     // static get styles() {
@@ -41,6 +42,11 @@ export class Page extends LitElement {
     set = (info, rerender = true) => {
         if (info) {
             Object.assign(this.info, info);
+
+            // Import the modules of the interfaces in the open project before they are needed
+            const interfaces = this.info.globalState?.interfaces;
+            if (interfaces) warmUpInterfaces(Object.values(interfaces));
+
             this.onSet();
             if (rerender) this.requestUpdate();
         }
@@ -26,6 +26,21 @@ import { Button } from "../../../Button.js";
 
 import globalIcon from "../../../../../assets/icons/global.svg?raw";
 
+import { baseUrl } from "../../../../server/globals";
+
+// Request one page of the rows of a summarized electrode or unit table
+const getTableRows = async (sessionInfo, table, name, offset, limit) => {
+    const result = await fetch(`${baseUrl}/neuroconv/table`, {
+        method: "POST",
+        headers: { "Content-Type": "application/json" },
+        body: JSON.stringify({ ...sessionInfo, table, interface: name, offset, limit }),
+    }).then((res) => res.json());
+
+    if (result.message) throw new Error(result.message);
+
+    return result.rows;
+};
+
 const parentTableRenderConfig = {
     Electrodes: (metadata) => {
         metadata.schema.description = "Download, modify, and re-upload data to change the electrode information.";
@@ -244,6 +259,13 @@ export class GuidedMetadataPage extends ManagedPage {
 
         resolveMetadata(subject, session, globalState);
 
+        // Summarized tables are paged from the interfaces of this session (as for its conversion)
+        const sourceDataCopy = structuredClone(globalState.results[subject][session].source_data);
+        const sessionInfo = {
+            source_data: merge(globalState.project.SourceData, sourceDataCopy),
+            interfaces: globalState.interfaces,
+        };
+
         const additionalPropertiesToRetitle = ["Ophys.ImageSegmentation"];
 
         const patternPropsToRetitle = ["Ophys.Fluorescence", "Ophys.DfOverF", "Ophys.SegmentationImages"];
@@ -487,6 +509,10 @@ export class GuidedMetadataPage extends ManagedPage {
 
                 const parentName = fullPath[fullPath.length - 1];
 
+                if (metadata.rowCount !== undefined)
+                    metadata.getRows = (offset, limit) =>
+                        getTableRows(sessionInfo, parentName.toLowerCase(), name, offset, limit);
+
                 const tableConfig =
                     tableRenderConfig[name] ?? parentTableRenderConfig[parentName] ?? tableRenderConfig["*"] ?? true;
                 if (typeof tableConfig === "function")
@@ -22,6 +22,33 @@ import Swal from "sweetalert2";
 
 import { baseUrl } from "../../../../server/globals";
 
+// Row definitions of the tables that are summarized for the metadata page
+const summarizedTables = {
+    Electrodes: "#/properties/Ecephys/definitions/Electrode",
+    Units: "#/properties/Ecephys/definitions/Unit",
+};
+
+// Describe the rows of summarized tables, which the metadata page requests one page at a time
+const setSummarizedTableSchemas = (metadata, schema) => {
+    for (let key in summarizedTables) {
+        const tables = metadata.Ecephys?.[key];
+        if (!tables) continue;
+
+        const tablesSchema = schema.properties.Ecephys.properties[key];
+        for (let name in tables) {
+            const { columns, row_count } = tables[name];
+            tablesSchema.properties[name] = {
+                type: "array",
+                minItems: row_count,
+                maxItems: row_count,
+                items: {
+                    allOf: [{ $ref: summarizedTables[key] }, { required: columns }],
+                },
+            };
+        }
+    }
+};
+
 const propsToIgnore = {
     "*": {
         verbose: true,
@@ -105,6 +132,7 @@ export class GuidedSourceDataPage extends ManagedPage {
                         body: JSON.stringify({
                             source_data: sanitize(structuredClone(form.resolved)), // Use resolved values, including global source data
                             interfaces: this.info.globalState.interfaces,
+                            table_format: "summary", // Tables are paged on the metadata page
                         }),
                     })
                         .then((res) => res.json())
@@ -135,6 +163,8 @@ export class GuidedSourceDataPage extends ManagedPage {
 
                     const { results: metadata, schema } = result;
 
+                    setSummarizedTableSchemas(metadata, schema);
+
                     // Merge arrays from generated pipeline data
                     if (info.metadata.__generated) {
                         const generated = info.metadata.__generated;
@@ -112,12 +112,11 @@ export class TimeAlignment extends LitElement {
 
         const { timestamps, errors, metadata } = this.data;
 
+        // Only summaries of the timestamps are provided (first, last, count, rate, gaps and a min/max pyramid)
         const flatTimes = Object.values(timestamps)
-            .map((interfaceTimestamps) => {
-                return [interfaceTimestamps[0], interfaceTimestamps.slice(-1)[0]];
-            })
+            .map((summary) => [summary.first, summary.last])
             .flat()
-            .filter((timestamp) => !isNaN(timestamp));
+            .filter((timestamp) => typeof timestamp === "number" && !isNaN(timestamp));
 
         const minTime = Math.min(...flatTimes);
         const maxTime = Math.max(...flatTimes);
@@ -167,9 +166,9 @@ export class TimeAlignment extends LitElement {
             const hasCompatibleInterfaces = isSortingInterface && metadata[name].compatible.length > 0;
 
             // Render this way if the interface has data
-            if (info.length > 0) {
-                const firstTime = info[0];
-                const lastTime = info[info.length - 1];
+            if (info.count > 0) {
+                const firstTime = info.first;
+                const lastTime = info.last;
 
                 const smallLabel = document.createElement("small");
                 smallLabel.innerText = `${firstTime.toFixed(2)} - ${lastTime.toFixed(2)} sec`;
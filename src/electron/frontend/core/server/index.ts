@@ -9,7 +9,7 @@ import {
 
 import Swal from 'sweetalert2'
 
-import { activateServer, baseUrl, statusBar } from './globals.js';
+import { activateServer, baseUrl, onServerOpen, statusBar } from './globals.js';
 
 // Check if the Flask server is live
 const serverIsLiveStartup = async () => {
@@ -23,6 +23,57 @@ const serverIsLiveStartup = async () => {
     else throw new Error('Error preloading Flask imports')
   })
 
+  const READINESS_POLL_INTERVAL = 1000
+
+  const isFinished = (stage: { status: string }) => stage.status === 'ready' || stage.status === 'failed'
+
+  let readinessRequest: undefined | Promise<any>;
+
+  // Poll the background warm-up of the server until all of its stages have finished
+  const pollReadiness = () => readinessRequest ?? (readinessRequest = (async () => {
+
+    let readiness = await fetch(`${baseUrl}/startup/readiness`).then(res => res.json())
+    while (!Object.values(readiness.stages).every(isFinished)) {
+      await new Promise(resolve => setTimeout(resolve, READINESS_POLL_INTERVAL))
+      readiness = await fetch(`${baseUrl}/startup/readiness`).then(res => res.json())
+    }
+
+    const failed = Object.entries(readiness.stages).filter(([ _, stage ]: [ string, any ]) => stage.status === 'failed')
+    if (failed.length) {
+      statusBar.items[2].status = 'issue'
+      notyf.open({
+        type: "warning",
+        message: `Unable to warm up ${failed.map(([ name ]) => name).join(', ')}. The related features may be slower to load.`,
+      });
+    }
+
+    return readiness
+
+  })().finally(() => readinessRequest = undefined))
+
+  const warmedInterfaces = new Set<string>()
+
+  // Import the modules of the interfaces used by a project in the background, as soon as the server is available
+  export const warmUpInterfaces = (interfaces: string[]) => {
+    const remaining = interfaces.filter(name => !warmedInterfaces.has(name))
+    if (!remaining.length) return
+
+    remaining.forEach(name => warmedInterfaces.add(name))
+
+    return onServerOpen(() => {
+      const query = new URLSearchParams({ interfaces: remaining.join(',') })
+      return fetch(`${baseUrl}/startup/warmup?${query}`, { method: 'POST' })
+        .then(res => {
+          if (res.ok) return pollReadiness()
+          else throw new Error('Error warming up the interfaces of the project')
+        })
+        .catch(error => {
+          remaining.forEach(name => warmedInterfaces.delete(name)) // Retry on the next request
+          console.error(error)
+        })
+    })
+  }
+
 export async function pythonServerOpened() {
 
   // Confirm requests are actually received by the server
@@ -35,6 +86,8 @@ export async function pythonServerOpened() {
     // Update server status and throw a notification
    activateServer()
 
+    pollReadiness().catch(error => console.error(error)) // Track the stages that are still warming up
+
     if (openPythonStatusNotyf) notyf.dismiss(openPythonStatusNotyf)
 
     if (isTestEnvironment) return
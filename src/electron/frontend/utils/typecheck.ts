@@ -7,3 +7,6 @@ export function isNumericString(str: any) {
   }
 
 export const isObject = (item: any) => (item && typeof item === "object" && !Array.isArray(item)) ? true : false;
+
+// Summaries of electrode and unit tables only describe their columns and number of rows, not their values
+export const isTableSummary = (item: any) => isObject(item) && "row_count" in item && !("values" in item);
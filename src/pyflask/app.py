@@ -1,5 +1,8 @@
 """The primary Flask server for the Python backend."""
 
+# Must be imported before anything else to record the full import timeline of the backend
+from startup_profiler import startup_profiler  # isort: skip
+
 import json
 import multiprocessing
 import os
@@ -11,12 +14,14 @@ from os import getpid, kill
 from os.path import isabs
 from pathlib import Path
 from signal import SIGINT
-from typing import Dict, Union
+from typing import Dict, Tuple, Union
 from urllib.parse import unquote
 
 # https://stackoverflow.com/questions/32672596/pyinstaller-loads-script-multiple-times#comment103216434_32677108
 multiprocessing.freeze_support()
 
+startup_profiler.mark("standard library imported")
+
 from flask import Flask, request, send_file, send_from_directory
 from flask_cors import CORS
 from flask_restx import Api, Resource
@@ -34,6 +39,8 @@ from namespaces import (  # neurosift_namespace,
     system_namespace,
 )
 
+startup_profiler.mark("namespaces imported")
+
 # Dictionary to store file paths with their IDs
 neurosift_file_registry = dict()
 
@@ -54,6 +61,9 @@ package_json_file_path = resource_path("package.json" if is_packaged() else "../
 with open(file=package_json_file_path) as fp:
     package_json = json.load(fp=fp)
 
+startup_profiler.log_folder_path = LOG_FOLDER
+startup_profiler.version = package_json["version"]
+
 api = Api(
     version=package_json["version"],
     title="NWB GUIDE API",
@@ -67,6 +77,15 @@ api.add_namespace(dandi_namespace)
 # api.add_namespace(neurosift_namespace)  # TODO: enable later
 api.init_app(flask_app)
 
+startup_profiler.mark("api initialized")
+
+
+# Registered first, since the first matching handler is used
+@api.errorhandler(ValueError)
+def value_error_handler(error: ValueError) -> Tuple[Dict[str, str], int]:
+    """Report invalid requests (e.g. missing or malformed fields) as bad requests."""
+    return {"message": str(error), "type": type(error).__name__}, 400
+
 
 @api.errorhandler(Exception)
 def exception_handler(error: Exception) -> Dict[str, str]:
@@ -171,6 +190,7 @@ if __name__ == "__main__":
 
         # Run the server
         api.logger.info(f"Starting server on port {port}")
+        startup_profiler.mark("server starting")
         flask_app.run(host="127.0.0.1", port=port)
     else:
         raise Exception("No port provided for the NWB GUIDE backend.")
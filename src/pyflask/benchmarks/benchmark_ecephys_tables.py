@@ -0,0 +1,146 @@
+"""
+Benchmark the extraction of the electrode and unit tables shown on the metadata page.
+
+Run from the `src/pyflask` directory:
+
+    python -m benchmarks.benchmark_ecephys_tables [output_path]
+
+The synthetic tutorial data is generated at the specified path (a temporary folder by default) if it does not exist.
+Its recording (384 channels) and sorting are scaled to four probes by repeating their properties.
+"""
+
+import sys
+import tempfile
+from pathlib import Path
+from types import SimpleNamespace
+
+import numpy as np
+from benchmarks.utils import get_spikeglx_phy_info, measure, report
+
+NUMBER_OF_PROBES = 4
+
+
+def legacy_get_electrode_table_json(interface) -> list:
+    """The previous implementation, which fetched each cell with a separate `get_property` call."""
+    from manageNeuroconv.manage_neuroconv import (
+        RECORDING_INTERFACE_PROPERTY_OVERRIDES,
+        get_recording_interface_properties,
+    )
+
+    recording = interface.recording_extractor
+    properties = get_recording_interface_properties(interface)
+
+    table = list()
+    for electrode_id in recording.get_channel_ids():
+        electrode_column = dict()
+        for property_name in properties:
+            if "default" in RECORDING_INTERFACE_PROPERTY_OVERRIDES.get(property_name, dict()):
+                value = RECORDING_INTERFACE_PROPERTY_OVERRIDES[property_name]["default"]
+            else:
+                value = recording.get_property(key=property_name, ids=[electrode_id])[0]
+            electrode_column[property_name] = value
+        table.append(electrode_column)
+
+    return table
+
+
+def legacy_get_unit_table_json(interface) -> list:
+    """The previous implementation, which fetched each cell with a separate `get_property` call."""
+    from manageNeuroconv.manage_neuroconv import (
+        SORTING_INTERFACE_PROPERTY_OVERRIDES,
+        get_sorting_interface_properties,
+    )
+
+    sorting = interface.sorting_extractor
+    properties = get_sorting_interface_properties(interface)
+
+    table = list()
+    for unit_id in sorting.get_unit_ids():
+        unit_column = dict()
+        for property_name in properties:
+            if property_name == "unit_id":
+                value = str(unit_id)
+            elif "default" in SORTING_INTERFACE_PROPERTY_OVERRIDES.get(property_name, dict()):
+                value = SORTING_INTERFACE_PROPERTY_OVERRIDES[property_name]["default"]
+            else:
+                value = sorting.get_property(key=property_name, ids=[unit_id])[0]
+            unit_column[property_name] = value
+        table.append(unit_column)
+
+    return table
+
+
+def scale_recording(recording, factor: int):
+    """A recording with `factor` times the channels of the original one, with repeated properties."""
+    from spikeinterface.core import NumpyRecording
+
+    scaled = NumpyRecording(
+        traces_list=[np.zeros((10, recording.get_num_channels() * factor), dtype="int16")],
+        sampling_frequency=recording.get_sampling_frequency(),
+    )
+    for key in recording.get_property_keys():
+        scaled.set_property(key=key, values=np.concatenate([recording.get_property(key=key)] * factor))
+
+    return scaled
+
+
+def scale_sorting(sorting, factor: int):
+    """A sorting with `factor` times the units of the original one, with repeated properties."""
+    from spikeinterface.core import NumpySorting
+
+    number_of_units = sorting.get_num_units() * factor
+    scaled = NumpySorting.from_unit_dict(
+        units_dict_list=[{unit_id: np.array([0]) for unit_id in range(number_of_units)}],
+        sampling_frequency=sorting.get_sampling_frequency(),
+    )
+    for key in sorting.get_property_keys():
+        scaled.set_property(key=key, values=np.concatenate([sorting.get_property(key=key)] * factor))
+
+    return scaled
+
+
+def main(output_path: Path) -> None:
+    from manageNeuroconv.manage_neuroconv import (
+        get_electrode_columns_json,
+        get_electrode_table_json,
+        get_unit_columns_json,
+        get_unit_table_json,
+        instantiate_custom_converter,
+    )
+    from namespaces.responses import encode_json
+
+    info = get_spikeglx_phy_info(output_path)
+    converter = instantiate_custom_converter(source_data=info["source_data"], interface_class_dict=info["interfaces"])
+
+    recording = converter.data_interface_objects["SpikeGLX"].recording_extractor
+    sorting = converter.data_interface_objects["Phy"].sorting_extractor
+    recording_interface = SimpleNamespace(recording_extractor=scale_recording(recording, factor=NUMBER_OF_PROBES))
+    sorting_interface = SimpleNamespace(sorting_extractor=scale_sorting(sorting, factor=NUMBER_OF_PROBES))
+
+    number_of_channels = recording_interface.recording_extractor.get_num_channels()
+    number_of_units = sorting_interface.sorting_extractor.get_num_units()
+
+    def get_electrodes():
+        return get_electrode_columns_json(recording_interface), get_electrode_table_json(recording_interface)
+
+    def get_units():
+        return get_unit_columns_json(sorting_interface), get_unit_table_json(sorting_interface)
+
+    assert encode_json(get_electrode_table_json(recording_interface)) == encode_json(
+        legacy_get_electrode_table_json(recording_interface)
+    )
+    assert encode_json(get_unit_table_json(sorting_interface)) == encode_json(
+        legacy_get_unit_table_json(sorting_interface)
+    )
+
+    report(
+        f"electrodes, {number_of_channels} channels (legacy)",
+        *measure(lambda: legacy_get_electrode_table_json(recording_interface)),
+    )
+    report(f"electrodes, {number_of_channels} channels (current)", *measure(get_electrodes))
+    report(f"units, {number_of_units} units (legacy)", *measure(lambda: legacy_get_unit_table_json(sorting_interface)))
+    report(f"units, {number_of_units} units (current)", *measure(get_units))
+
+
+if __name__ == "__main__":
+    main(output_path=Path(sys.argv[1]) if len(sys.argv) > 1 else Path(tempfile.mkdtemp()))
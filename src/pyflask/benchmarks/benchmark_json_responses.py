@@ -0,0 +1,72 @@
+"""
+Benchmark the serialization of the `/neuroconv/metadata` response body.
+
+Run from the `src/pyflask` directory:
+
+    python -m benchmarks.benchmark_json_responses [output_path]
+
+The synthetic tutorial data is generated at the specified path (a temporary folder by default) if it does not exist.
+A larger payload is derived from it by repeating the electrode table of the SpikeGLX interface for four probes.
+"""
+
+import copy
+import json
+import sys
+import tempfile
+from collections import deque
+from pathlib import Path
+
+from benchmarks.utils import get_spikeglx_phy_info, measure, report
+
+
+def legacy_replace_nan_with_none(data):
+    """The previous clean-up pass over the results, which copied every container."""
+    if isinstance(data, dict):
+        return {key: legacy_replace_nan_with_none(value) for key, value in data.items()}
+    elif isinstance(data, list):
+        return [legacy_replace_nan_with_none(item) for item in data]
+    elif isinstance(data, (float, int)) and data != data:
+        return None
+    else:
+        return data
+
+
+def legacy_response_body(result: dict) -> str:
+    """Clean up, encode and parse the results in the endpoint, then encode them again in flask_restx."""
+    from neuroconv.utils import NWBMetaDataEncoder
+
+    parsed = json.loads(json.dumps(obj=legacy_replace_nan_with_none(result), cls=NWBMetaDataEncoder))
+    return json.dumps(parsed) + "\n"
+
+
+def get_large_result(result: dict) -> dict:
+    """Repeat the electrode table of the SpikeGLX interface (which holds numpy values) for four probes."""
+    result = copy.deepcopy(result)
+    electrodes = result["results"]["Ecephys"]["Electrodes"]
+    rows = electrodes.pop("SpikeGLX")
+
+    for probe_index in range(4):
+        electrodes[f"SpikeGLX{probe_index}"] = copy.deepcopy(rows)
+
+    return result
+
+
+def main(output_path: Path) -> None:
+    from manageNeuroconv.manage_neuroconv import get_metadata_schema
+    from namespaces.responses import encode_json, iterencode_json
+
+    info = get_spikeglx_phy_info(output_path)
+    result = get_metadata_schema(info["source_data"], info["interfaces"])
+
+    payloads = dict(metadata=result, metadata_four_probes=get_large_result(result))
+
+    for name, payload in payloads.items():
+        assert json.loads(encode_json(payload)) == json.loads(legacy_response_body(payload))
+
+        report(f"{name} (legacy)", *measure(lambda: legacy_response_body(payload)))
+        report(f"{name} (current, buffered)", *measure(lambda: encode_json(payload)))
+        report(f"{name} (current, streamed)", *measure(lambda: deque(iterencode_json(payload), maxlen=0)))
+
+
+if __name__ == "__main__":
+    main(output_path=Path(sys.argv[1]) if len(sys.argv) > 1 else Path(tempfile.mkdtemp()))
@@ -0,0 +1,70 @@
+"""
+Benchmark the resolution of JSON schema references on the metadata schema of a SpikeGLX + Phy converter.
+
+Run from the `src/pyflask` directory:
+
+    python -m benchmarks.benchmark_resolve_references [output_path]
+
+The synthetic tutorial data is generated at the specified path (a temporary folder by default) if it does not exist.
+"""
+
+import copy
+import sys
+import tempfile
+from pathlib import Path
+
+from benchmarks.utils import get_spikeglx_phy_info, measure, report
+
+
+def legacy_resolve_references(schema: dict, root_schema: dict = None) -> dict:
+    """The previous implementation, which created a new `RefResolver` for every reference it met."""
+    from jsonschema import RefResolver
+
+    if root_schema is None:
+        root_schema = schema
+
+    if "$ref" in schema:
+        resolver = RefResolver.from_schema(root_schema)
+        resolved = resolver.resolve(schema["$ref"])[1]
+        return legacy_resolve_references(resolved, root_schema)
+
+    if "properties" in schema:
+        for key, prop_schema in schema["properties"].items():
+            schema["properties"][key] = legacy_resolve_references(prop_schema, root_schema)
+
+    if "patternProperties" in schema:
+        for key, prop_schema in schema["patternProperties"].items():
+            schema["patternProperties"][key] = legacy_resolve_references(prop_schema, root_schema)
+
+    if "items" in schema:
+        schema["items"] = legacy_resolve_references(schema["items"], root_schema)
+
+    return schema
+
+
+def main(output_path: Path) -> None:
+    from manageNeuroconv.manage_neuroconv import (
+        get_metadata_schema,
+        instantiate_custom_converter,
+    )
+    from manageNeuroconv.schemas import resolve_references
+
+    info = get_spikeglx_phy_info(output_path)
+    converter = instantiate_custom_converter(source_data=info["source_data"], interface_class_dict=info["interfaces"])
+
+    schemas = dict(
+        converter_metadata_schema=converter.get_metadata_schema(),
+        guide_metadata_schema=get_metadata_schema(info["source_data"], info["interfaces"])["schema"],
+    )
+
+    for name, schema in schemas.items():
+        assert resolve_references(schema) == legacy_resolve_references(copy.deepcopy(schema))
+
+        # Both are timed including a deep copy, which the legacy implementation required since it modifies its input
+        report(f"{name} (legacy)", *measure(lambda: legacy_resolve_references(copy.deepcopy(schema))))
+        report(f"{name} (current)", *measure(lambda: resolve_references(copy.deepcopy(schema))))
+        report(f"{name} (current, no copy)", *measure(lambda: resolve_references(schema)))
+
+
+if __name__ == "__main__":
+    main(output_path=Path(sys.argv[1]) if len(sys.argv) > 1 else Path(tempfile.mkdtemp()))
@@ -0,0 +1,55 @@
+"""Shared helpers for the backend benchmarks."""
+
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Dict, Tuple
+
+
+def get_test_data_folder_path(output_path: Path) -> Path:
+    """Generate the synthetic SpikeGLX + Phy tutorial data, unless it already exists at the specified location."""
+    from manageNeuroconv import generate_test_data
+
+    output_path = Path(output_path)
+    if not (output_path / "spikeglx").exists() or not (output_path / "phy").exists():
+        generate_test_data(output_path=str(output_path))
+
+    return output_path
+
+
+def get_spikeglx_phy_info(output_path: Path) -> Dict[str, dict]:
+    """The source data and interfaces of a SpikeGLX + Phy session from the tutorial data."""
+    data_folder_path = get_test_data_folder_path(output_path)
+
+    return dict(
+        source_data=dict(
+            SpikeGLX=dict(
+                folder_path=str(data_folder_path / "spikeglx" / "Session1_g0" / "Session1_g0_imec0"),
+                stream_id="imec0.ap",
+            ),
+            Phy=dict(folder_path=str(data_folder_path / "phy")),
+        ),
+        interfaces=dict(SpikeGLX="SpikeGLXRecordingInterface", Phy="PhySortingInterface"),
+    )
+
+
+def measure(function: Callable, repeat: int = 5) -> Tuple[float, float]:
+    """Return the best wall-clock time (in seconds) and the peak traced memory (in MiB) of a function call."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        function()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return min(timings), peak / 1024**2
+
+
+def report(name: str, timing: float, peak_memory: float) -> None:
+    print(f"{name:<50} {timing * 1e3:>10.2f} ms {peak_memory:>10.2f} MiB")
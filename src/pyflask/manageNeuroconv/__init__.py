@@ -1,3 +1,4 @@
+from .checks import check_registry
 from .info import CONVERSION_SAVE_FOLDER_PATH, STUB_SAVE_FOLDER_PATH
 from .manage_neuroconv import (
     autocomplete_format_string,
@@ -8,10 +9,15 @@ from .manage_neuroconv import (
     get_all_converter_info,
     get_all_interface_info,
     get_backend_configuration,
+    get_cache_info,
     get_interface_alignment,
+    get_interface_catalog,
     get_metadata_schema,
     get_source_schema,
+    get_table_window,
+    get_timestamps_window,
     inspect_all,
+    invalidate_converter_cache,
     listen_to_neuroconv_progress_events,
     locate_data,
     progress_handler,
@@ -19,4 +25,7 @@ from .manage_neuroconv import (
     upload_multiple_filesystem_objects_to_dandi,
     upload_project_to_dandi,
     validate_metadata,
+    validate_metadata_batch,
 )
+from .sessions import session_store
+from .warmup import warm_up
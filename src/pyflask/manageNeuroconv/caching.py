@@ -0,0 +1,134 @@
+"""Caching utilities shared by the NeuroConv endpoints."""
+
+import hashlib
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, List, Optional, Tuple
+
+
+def get_fingerprint(obj: Any) -> str:
+    """Compute a stable hash of any JSON-serializable object, irrespective of dictionary key order."""
+    serialized = json.dumps(obj, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha1(serialized.encode("utf-8")).hexdigest()
+
+
+class LRUCache:
+    """
+    A thread-safe, size-bounded, least-recently-used cache that keeps track of its hit rate.
+
+    Entries may also be given a weight (e.g. an estimate of their memory usage in bytes), in which case the cache is
+    additionally bounded by the total weight of its entries. The most recent entry is never evicted for its weight.
+
+    If a maximum idle time is specified (in seconds), entries that have not been used for longer are removed by
+    `expire`, which is also called on each access.
+    """
+
+    def __init__(self, max_size: int = 128, max_weight: Optional[float] = None, max_idle_time: Optional[float] = None):
+        self.max_size = max_size
+        self.max_weight = max_weight
+        self.max_idle_time = max_idle_time
+
+        self._lock = threading.RLock()
+        self._entries = OrderedDict()
+        self._weights = dict()
+        self._last_used = dict()
+        self.total_weight = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            return key in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            self.expire()
+
+            if key not in self._entries:
+                self.misses += 1
+                return default
+
+            self.hits += 1
+            self._entries.move_to_end(key)
+            self._last_used[key] = time.monotonic()
+            return self._entries[key]
+
+    def set(self, key: Hashable, value: Any, weight: float = 0) -> None:
+        with self._lock:
+            self.expire()
+
+            self.total_weight += weight - self._weights.get(key, 0)
+            self._weights[key] = weight
+
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            self._last_used[key] = time.monotonic()
+
+            while len(self._entries) > self.max_size or (
+                self.max_weight is not None and self.total_weight > self.max_weight and len(self._entries) > 1
+            ):
+                self._evict_oldest()
+
+    def expire(self) -> List[Any]:
+        """Remove the entries that have been idle for longer than the maximum idle time, and return their values."""
+        expired = list()
+        if self.max_idle_time is None:
+            return expired
+
+        with self._lock:
+            threshold = time.monotonic() - self.max_idle_time
+            while self._entries and self._last_used[next(iter(self._entries))] < threshold:
+                expired.append(self._evict_oldest())
+
+        return expired
+
+    def _evict_oldest(self) -> Any:
+        evicted_key, evicted_value = self._entries.popitem(last=False)
+        self.total_weight -= self._weights.pop(evicted_key)
+        self._last_used.pop(evicted_key)
+        self.evictions += 1
+        return evicted_value
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        with self._lock:
+            self.total_weight -= self._weights.pop(key, 0)
+            self._last_used.pop(key, None)
+            return self._entries.pop(key, default)
+
+    def items(self) -> List[Tuple[Hashable, Any]]:
+        """A snapshot of the entries, from least to most recently used."""
+        with self._lock:
+            return list(self._entries.items())
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._weights.clear()
+            self._last_used.clear()
+            self.total_weight = 0
+
+    def info(self) -> dict:
+        """Summarize the usage of the cache."""
+        with self._lock:
+            self.expire()
+
+            requests = self.hits + self.misses
+            return dict(
+                size=len(self._entries),
+                max_size=self.max_size,
+                weight=self.total_weight,
+                max_weight=self.max_weight,
+                max_idle_time=self.max_idle_time,
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                hit_rate=self.hits / requests if requests else None,
+            )
@@ -0,0 +1,82 @@
+"""The NWB Inspector checks used to validate metadata, configured once per process."""
+
+import os
+import threading
+from typing import Callable, Dict, Optional
+
+# Either the name of a configuration bundled with the NWB Inspector or the path to a configuration file
+DEFAULT_INSPECTOR_CONFIG = "dandi"
+
+
+class CheckRegistry:
+    """
+    The configured NWB Inspector checks, indexed by name.
+
+    The checks are configured lazily on first use (or during the warm-up) and then shared by all requests. The registry
+    is rebuilt after `invalidate` is called, when the configuration is changed, or when the configuration file (if
+    any) is modified.
+    """
+
+    def __init__(self, config: str = DEFAULT_INSPECTOR_CONFIG):
+        self.config = config
+        self.builds = 0
+
+        self._lock = threading.Lock()
+        self._checks: Optional[Dict[str, Callable]] = None
+        self._config_stamp = None
+
+    def _get_config_stamp(self) -> Optional[tuple]:
+        try:
+            stat = os.stat(self.config)
+        except (OSError, ValueError):  # A bundled configuration
+            return None
+
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get_checks(self) -> Dict[str, Callable]:
+        """Get all configured checks by name, configuring them if needed."""
+        config_stamp = self._get_config_stamp()
+
+        checks = self._checks
+        if checks is not None and config_stamp == self._config_stamp:
+            return checks
+
+        with self._lock:
+            if self._checks is None or config_stamp != self._config_stamp:
+                from nwbinspector import configure_checks, load_config
+
+                check_list = configure_checks(config=load_config(filepath_or_keyword=self.config))
+                self._checks = {check.__name__: check for check in check_list}
+                self._config_stamp = config_stamp
+                self.builds += 1
+
+            return self._checks
+
+    def get(self, check_function_name: str) -> Callable:
+        check_function = self.get_checks().get(check_function_name)
+        if check_function is None:
+            raise ValueError(f"Function {check_function_name} not found in nwbinspector")
+
+        return check_function
+
+    def set_config(self, config: str) -> None:
+        """Use another configuration, rebuilding the registry on next use."""
+        with self._lock:
+            self.config = config
+            self._checks = None
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._checks = None
+
+    def info(self) -> dict:
+        checks = self._checks
+        return dict(
+            config=self.config,
+            configured=checks is not None,
+            number_of_checks=len(checks) if checks is not None else None,
+            builds=self.builds,
+        )
+
+
+check_registry = CheckRegistry()
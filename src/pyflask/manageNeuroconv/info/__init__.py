@@ -1,5 +1,6 @@
 from .sse import format_sse
 from .urls import (
+    CACHE_FOLDER_PATH,
     CONVERSION_SAVE_FOLDER_PATH,
     GUIDE_ROOT_FOLDER,
     STUB_SAVE_FOLDER_PATH,
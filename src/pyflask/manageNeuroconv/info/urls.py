@@ -40,9 +40,11 @@ if is_test_environment:
 
 STUB_SAVE_FOLDER_PATH = Path(GUIDE_ROOT_FOLDER, *data["subfolders"]["preview"])
 CONVERSION_SAVE_FOLDER_PATH = Path(GUIDE_ROOT_FOLDER, *data["subfolders"]["conversions"])
+CACHE_FOLDER_PATH = Path(GUIDE_ROOT_FOLDER, *data["subfolders"]["cache"])
 
 f.close()
 
 # Create all nested home folders
 STUB_SAVE_FOLDER_PATH.mkdir(exist_ok=True, parents=True)
 CONVERSION_SAVE_FOLDER_PATH.mkdir(exist_ok=True, parents=True)
+CACHE_FOLDER_PATH.mkdir(exist_ok=True, parents=True)
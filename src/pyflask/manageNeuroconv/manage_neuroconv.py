@@ -1,15 +1,19 @@
 """Collection of utility functions used by the NeuroConv Flask API."""
 
 import copy
+import gc
 import hashlib
 import inspect
 import json
 import math
 import os
 import re
+import threading
+import time
 import traceback
 import zoneinfo
 from datetime import datetime, timedelta
+from functools import lru_cache, wraps
 from pathlib import Path
 from shutil import copytree, rmtree
 from typing import Any, Dict, List, Optional, Union
@@ -17,7 +21,10 @@ from typing import Any, Dict, List, Optional, Union
 from pynwb import NWBFile
 from tqdm_publisher import TQDMProgressHandler
 
+from .caching import LRUCache, get_fingerprint
+from .checks import check_registry
 from .info import (
+    CACHE_FOLDER_PATH,
     CONVERSION_SAVE_FOLDER_PATH,
     GUIDE_ROOT_FOLDER,
     STUB_SAVE_FOLDER_PATH,
@@ -25,6 +32,17 @@ from .info import (
     resource_path,
 )
 from .info.sse import format_sse
+from .schemas import coercion_plan_cache, get_coercion_plan, resolve_references
+from .sessions import session_store
+from .snapshots import snapshot_writer
+from .timestamps import (
+    get_timestamp_summary,
+    get_timestamp_window,
+    interface_timestamp_cache,
+    is_regular_grid,
+    load_timestamps,
+    timestamp_file_cache,
+)
 
 progress_handler = TQDMProgressHandler()
 
@@ -99,140 +117,82 @@ DTYPE_SCHEMA = {
     "enumLabels": DTYPE_DESCRIPTIONS,
 }
 
+# Electrode and unit tables are sent as a list of rows by default, or (on request) as one array of values per column
+# or as a summary of their columns and size, whose rows are then requested in windows (see `get_table_window`)
+TABLE_FORMATS = ("rows", "columnar", "summary")
 
-def is_path_contained(child, parent):
-    parent = Path(parent)
-    child = Path(child)
+TABLE_TYPES = ("electrodes", "units")
 
-    # Attempt to construct a relative path from parent to child
-    try:
-        child.relative_to(parent)
-        return True
-    except ValueError:
-        return False
 
+INTERFACE_CATALOG_FOLDER_PATH = CACHE_FOLDER_PATH / "interface_catalogs"
+SOURCE_SCHEMA_CACHE_FOLDER_PATH = CACHE_FOLDER_PATH / "source_schemas"
 
-def replace_nan_with_none(data):
-    if isinstance(data, dict):
-        # If it's a dictionary, iterate over its items and replace NaN values with None
-        return {key: replace_nan_with_none(value) for key, value in data.items()}
-    elif isinstance(data, list):
-        # If it's a list, iterate over its elements and replace NaN values with None
-        return [replace_nan_with_none(item) for item in data]
-    elif isinstance(data, (float, int)) and (data != data):
-        return None  # Replace NaN with None
-    else:
-        return data
+source_schema_cache = LRUCache(max_size=64)
+custom_converter_class_cache = LRUCache(max_size=64)
 
+# Live converter instances, bounded by count, by an estimate of the memory they hold (in bytes) and by their idle time
+# (in seconds), since their extractors keep the source files open (which locks them on Windows)
+CONVERTER_CACHE_MAX_SIZE = 8
+CONVERTER_CACHE_MAX_MEMORY = 2 * 1024**3
+CONVERTER_CACHE_MAX_IDLE_TIME = 10 * 60
+converter_cache = LRUCache(
+    max_size=CONVERTER_CACHE_MAX_SIZE,
+    max_weight=CONVERTER_CACHE_MAX_MEMORY,
+    max_idle_time=CONVERTER_CACHE_MAX_IDLE_TIME,
+)
+converter_expiry_timer = None
 
-def resolve_references(schema: dict, root_schema: Optional[dict] = None) -> dict:
-    """
-    Recursively resolve references in a JSON schema based on the root schema.
-
-    Args:
-        schema (dict): The JSON schema to resolve.
-        root_schema (dict): The root JSON schema.
-
-    Returns:
-        dict: The resolved JSON schema.
-    """
-    from jsonschema import RefResolver
+# Held while building a converter, by cache key, so that concurrent requests share a single new instance
+converter_build_locks: Dict[str, threading.Lock] = dict()
+converter_build_locks_lock = threading.Lock()
 
-    if root_schema is None:
-        root_schema = schema
+# Results of the NWB Inspector checks, by check and (normalized) metadata; see `get_validation_cache_key`
+validation_result_cache = LRUCache(max_size=1024)
+NOT_CACHED = object()
 
-    if "$ref" in schema:
-        resolver = RefResolver.from_schema(root_schema)
-        resolved = resolver.resolve(schema["$ref"])[1]
-        return resolve_references(resolved, root_schema)
+# Which recording interfaces each sorting interface can be linked to, by interfaces and source files
+compatibility_cache = LRUCache(max_size=32)
+MAX_COMPATIBILITY_WORKERS = 8
 
-    if "properties" in schema:
-        for key, prop_schema in schema["properties"].items():
-            schema["properties"][key] = resolve_references(prop_schema, root_schema)
+# Default backend configurations, by converter, shape of the metadata and backend (see `get_backend_configuration_key`)
+backend_configuration_cache = LRUCache(max_size=16)
 
-    if "patternProperties" in schema:
-        for key, prop_schema in schema["patternProperties"].items():
-            schema["patternProperties"][key] = resolve_references(prop_schema, root_schema)
+# The metadata layers shared by all files of a conversion, set once per worker process (see `set_metadata_layers`)
+worker_metadata_layers = dict()
+coerced_metadata_layer_cache = LRUCache(max_size=32)
 
-    if "items" in schema:
-        schema["items"] = resolve_references(schema["items"], root_schema)
 
-    return schema
+def is_path_contained(child, parent):
+    parent = Path(parent)
+    child = Path(child)
 
+    # Attempt to construct a relative path from parent to child
+    try:
+        child.relative_to(parent)
+        return True
+    except ValueError:
+        return False
 
-def replace_nan_strings(obj):
-    """Recursively replace string 'NaN' values with float NaN throughout a nested dict/list structure.
 
-    This handles cases where the metadata schema is incomplete (e.g. BrukerTiffSinglePlaneConverter
-    doesn't provide Ophys schema), so schema-based coercion in replace_none_with_nan misses some fields.
-    String 'NaN' values are always JavaScript NaN artifacts from JSON serialization and never valid metadata.
+def replace_none_with_nan(json_object: dict, json_schema: dict, nan_strings: bool = False) -> dict:
     """
-    if isinstance(obj, dict):
-        for key, value in obj.items():
-            if value == "NaN":
-                obj[key] = math.nan
-            else:
-                replace_nan_strings(value)
-    elif isinstance(obj, list):
-        for i, item in enumerate(obj):
-            if item == "NaN":
-                obj[i] = math.nan
-            else:
-                replace_nan_strings(item)
-    return obj
+    Copy a JSON object, replacing None values with NaN where the JSON schema expects a number.
 
-
-def replace_none_with_nan(json_object: dict, json_schema: dict) -> dict:
-    """
-    Recursively search a JSON object and replace None values with NaN where appropriate.
+    The schema is compiled once into a coercion plan that is cached per schema fingerprint.
 
     Args:
-        json_object (dict): The JSON object to search and modify.
-        json_schema (dict): The JSON schema to validate against.
+        json_object (dict): The JSON object to copy and coerce.
+        json_schema (dict): The JSON schema to comply with. References do not need to be resolved.
+        nan_strings (bool): Whether to also replace all 'NaN' strings with NaN, regardless of the schema.
 
     Returns:
-        dict: The modified JSON object with None values replaced by NaN.
+        dict: The modified copy of the JSON object with None values replaced by NaN.
     """
-
-    def coerce_schema_compliance_recursive(obj, schema):
-        if isinstance(obj, dict):
-            for key, value in obj.items():
-                # Coerce on pattern properties as well
-                pattern_properties = schema.get("patternProperties")
-                if pattern_properties:
-                    for pattern, pattern_schema in pattern_properties.items():
-                        regex = re.compile(pattern)
-                        if regex.match(key):
-                            coerce_schema_compliance_recursive(value, pattern_schema)
-
-                # Also check regular properties (not elif — schemas can have both patternProperties and properties)
-                if key in schema.get("properties", {}):
-                    prop_schema = schema["properties"][key]
-                    if prop_schema.get("type") == "number" and not isinstance(value, float):
-                        if value is None or value == "NaN":
-                            obj[key] = math.nan
-                        else:
-                            try:
-                                obj[key] = float(value)
-                            except (ValueError, TypeError):
-                                pass
-                    else:
-                        coerce_schema_compliance_recursive(value, prop_schema)
-        elif isinstance(obj, list):
-            for item in obj:
-                # NEUROCONV PATCH
-                coerce_schema_compliance_recursive(item, schema.get("items", schema if "properties" in schema else {}))
-
-        return obj
-
-    return coerce_schema_compliance_recursive(
-        copy.deepcopy(json_object), resolve_references(copy.deepcopy(json_schema))
-    )
+    return get_coercion_plan(json_schema).apply(json_object, nan_strings=nan_strings)
 
 
 def autocomplete_format_string(info: dict) -> str:
     from neuroconv.tools.path_expansion import construct_path_template
-    from neuroconv.utils.json_schema import NWBMetaDataEncoder
 
     base_directory = info["base_directory"]
     filesystem_entry_path = info["path"]
@@ -261,13 +221,12 @@ def autocomplete_format_string(info: dict) -> str:
 
     all_matched = locate_data(dict(autocomplete=to_locate_info))
 
-    return json.loads(json.dumps(obj=dict(matched=all_matched, format_string=format_string), cls=NWBMetaDataEncoder))
+    return dict(matched=all_matched, format_string=format_string)
 
 
 def locate_data(info: dict) -> dict:
     """Locate data from the specifies directories using fstrings."""
     from neuroconv.tools import LocalPathExpander
-    from neuroconv.utils.json_schema import NWBMetaDataEncoder
 
     expander = LocalPathExpander()
 
@@ -291,7 +250,7 @@ def locate_data(info: dict) -> dict:
 
         organized_output[subject_id][session_id] = item
 
-    return json.loads(json.dumps(obj=organized_output, cls=NWBMetaDataEncoder))
+    return organized_output
 
 
 def module_to_dict(my_module) -> dict:
@@ -376,11 +335,108 @@ def get_all_interface_info() -> dict:
     }
 
 
+def get_app_version() -> str:
+    """Read the GUIDE version from the package.json file."""
+    package_json_file_path = resource_path("package.json" if is_packaged() else "../package.json")
+    with open(file=package_json_file_path) as fp:
+        package_json = json.load(fp=fp)
+
+    return package_json["version"]
+
+
+@lru_cache(maxsize=None)
+def get_library_version(package_name: str) -> Union[str, None]:
+    """Get the installed version of a package without importing it."""
+    from importlib.metadata import PackageNotFoundError, version
+
+    try:
+        return version(package_name)
+    except PackageNotFoundError:
+        return None
+
+
+def get_library_versions(*package_names: str) -> Dict[str, Union[str, None]]:
+    """Get the installed versions of the specified packages without importing them."""
+    return {package_name: get_library_version(package_name) for package_name in package_names}
+
+
+def write_json_atomically(obj: Any, file_path: Path, **kwargs) -> None:
+    """Write a JSON file through a temporary file so that concurrent readers never see a partial file."""
+    file_path.parent.mkdir(exist_ok=True, parents=True)
+
+    temporary_file_path = file_path.with_name(f"{file_path.name}.{os.getpid()}.tmp")
+    with open(file=temporary_file_path, mode="w") as fp:
+        json.dump(obj=obj, fp=fp, **kwargs)
+
+    os.replace(temporary_file_path, file_path)
+
+
+_interface_catalogs = dict()
+
+
+def get_interface_catalog() -> dict:
+    """
+    Get the information of all interfaces and converters available for selection.
+
+    Deriving this information requires importing every format module of NeuroConv, so the result is generated once
+    per NeuroConv and GUIDE version and then persisted in the cache folder; later requests (including in future
+    sessions) are served from that snapshot without importing any interface module.
+    """
+    versions = get_library_versions("neuroconv")
+    catalog_key = f"neuroconv-{versions['neuroconv']}_guide-{get_app_version()}"
+
+    if catalog_key in _interface_catalogs:
+        return _interface_catalogs[catalog_key]
+
+    catalog_file_path = INTERFACE_CATALOG_FOLDER_PATH / f"{catalog_key}.json"
+
+    catalog = None
+    if catalog_file_path.exists():
+        try:
+            with open(file=catalog_file_path, mode="r") as fp:
+                catalog = json.load(fp=fp)
+        except (OSError, ValueError):
+            catalog = None  # Regenerate corrupted snapshots
+
+    if catalog is None:
+        # Normalize to JSON types (e.g. tuples of suffixes) so fresh and persisted catalogs are identical
+        catalog = json.loads(json.dumps(obj={**get_all_interface_info(), **get_all_converter_info()}))
+
+        write_json_atomically(obj=catalog, file_path=catalog_file_path)
+
+        # Remove snapshots from previous versions
+        for stale_file_path in INTERFACE_CATALOG_FOLDER_PATH.glob("*.json"):
+            if stale_file_path != catalog_file_path:
+                stale_file_path.unlink(missing_ok=True)
+
+    _interface_catalogs[catalog_key] = catalog
+
+    return catalog
+
+
 # Combine Multiple Interfaces
-def get_custom_converter(interface_class_dict: dict, alignment_info: Union[dict, None] = None) -> "NWBConverter":
-    from neuroconv import NWBConverter, converters, datainterfaces
+def get_custom_converter(interface_class_dict: dict) -> "NWBConverter":
+    """
+    Get a converter class combining the specified interfaces.
+
+    The same class is returned for the same interface mapping (up to a bounded number of mappings), so that any
+    class-level caching performed by NeuroConv is preserved across requests. Temporal alignment information is
+    therefore not part of the class, but passed to each instance on construction.
+
+    The order of the interfaces is part of the key, since metadata is merged and data is written in that order.
+    """
+    cache_key = tuple(interface_class_dict.items())
+
+    CustomNWBConverter = custom_converter_class_cache.get(cache_key)
+    if CustomNWBConverter is None:
+        CustomNWBConverter = create_custom_converter(interface_class_dict)
+        custom_converter_class_cache.set(cache_key, CustomNWBConverter)
+
+    return CustomNWBConverter
 
-    alignment_info = alignment_info or dict()
+
+def create_custom_converter(interface_class_dict: dict) -> "NWBConverter":
+    from neuroconv import NWBConverter, converters, datainterfaces
 
     class CustomNWBConverter(NWBConverter):
         data_interface_classes = {
@@ -388,10 +444,28 @@ def get_custom_converter(interface_class_dict: dict, alignment_info: Union[dict,
             for custom_name, interface_name in interface_class_dict.items()
         }
 
+        def __init__(self, source_data: Dict[str, dict], verbose: bool = False, alignment_info: Optional[dict] = None):
+            self.alignment_info = alignment_info or dict()
+            self.alignment_errors = None
+            self._alignment_lock = threading.Lock()
+            # Held while the instance is modified (e.g. when adding its data to an NWB file or writing electrode
+            # properties back to its interfaces), since cached instances are shared between request threads
+            self.lock = threading.RLock()
+            self.electrode_properties_updated = False
+            self.table_columns = dict()  # The columns of the electrode and unit tables, by table type and interface
+            self.timestamp_summaries = dict()  # The summaries of the aligned timestamps, by interface
+            self.regular_rates = dict()  # Whether aligned timestamps were replaced by a starting time, by interface
+            super().__init__(source_data=source_data, verbose=verbose)
+
+            for interface in self.data_interface_objects.values():
+                cache_original_timestamps(interface)
+
         # Handle temporal alignment inside the converter
-        # TODO: this currently works off of cross-scoping injection of `alignment_info` - refactor to be more explicit
+        # Only applied once, since cached instances may be aligned again by a later request (e.g. a conversion)
         def temporally_align_data_interfaces(self, metadata=None, conversion_options=None):
-            set_interface_alignment(self, alignment_info=alignment_info)
+            with self._alignment_lock:
+                if self.alignment_errors is None:
+                    self.alignment_errors = set_interface_alignment(self, alignment_info=self.alignment_info)
 
         # From previous issue regarding SpikeGLX not generating previews of correct size
         def add_to_nwbfile(self, nwbfile: NWBFile, metadata, conversion_options: Optional[dict] = None) -> None:
@@ -423,17 +497,220 @@ def get_custom_converter(interface_class_dict: dict, alignment_info: Union[dict,
 def instantiate_custom_converter(
     source_data: Dict, interface_class_dict: Dict, alignment_info: Union[Dict, None] = None
 ) -> "NWBConverter":
-    alignment_info = alignment_info or dict()
+    CustomNWBConverter = get_custom_converter(interface_class_dict=interface_class_dict)
+
+    return CustomNWBConverter(source_data=source_data, alignment_info=alignment_info)
+
+
+def get_source_file_stats(source_data: Any) -> List[list]:
+    """
+    Collect the size and modification time of all paths in the source data.
+
+    The direct contents of folders are included as well, since modifying a file does not update its folder.
+    """
+    stats = list()
+
+    def add_stats(path: Path) -> None:
+        try:
+            stat = path.stat()
+        except OSError:
+            stats.append([str(path), None, None])
+            return
+
+        stats.append([str(path), stat.st_size, stat.st_mtime_ns])
+
+    def collect_recursive(obj: Any, key: str = "") -> None:
+        if isinstance(obj, dict):
+            for key, value in obj.items():
+                collect_recursive(value, key=key)
+        elif isinstance(obj, list):
+            for value in obj:
+                collect_recursive(value, key=key)
+        elif isinstance(obj, str) and obj and key.endswith(("_path", "_paths")):
+            path = Path(obj)
+            add_stats(path)
+            if path.is_dir():
+                for child_path in sorted(path.iterdir()):
+                    add_stats(child_path)
+
+    collect_recursive(source_data)
+
+    return stats
+
+
+def get_converter(
+    source_data: Dict[str, dict],
+    interface_class_dict: Dict[str, str],
+    alignment_info: Optional[dict] = None,
+    state: Optional[Any] = None,
+) -> "NWBConverter":
+    """
+    Get a live converter instance, reusing a cached one built from the same interfaces and (unmodified) source files.
 
-    CustomNWBConverter = get_custom_converter(interface_class_dict=interface_class_dict, alignment_info=alignment_info)
+    Cached instances are shared between requests. They may only be modified in ways that are fully determined by
+    their key: the temporal alignment (applied at most once) and the `state`, a JSON-serializable description of any
+    other modification that the caller applies to a new instance (e.g. edited electrode properties). Any modification
+    (including adding their data to an NWB file) is made while holding the `lock` of the instance.
 
-    return CustomNWBConverter(source_data=source_data)
+    Instances are evicted in least-recently-used order, based on their number and on the growth in resident memory
+    of the process while they were built, and once they have been idle for `CONVERTER_CACHE_MAX_IDLE_TIME`.
+    """
+    import psutil
 
+    source_file_stats = get_source_file_stats(source_data)
+    cache_key = get_fingerprint(
+        dict(
+            interfaces=list(interface_class_dict.items()),
+            source_data=source_data,
+            alignment=alignment_info or dict(),
+            state=state,
+            files=source_file_stats,
+        )
+    )
+
+    converter = converter_cache.get(cache_key)
+    if converter is not None:
+        return converter
+
+    with converter_build_locks_lock:
+        build_lock = converter_build_locks.setdefault(cache_key, threading.Lock())
+
+    with build_lock:
+        # Built by another request in the meantime
+        if cache_key in converter_cache:
+            converter = converter_cache.get(cache_key)
+        if converter is not None:
+            return converter
+
+        process = psutil.Process()
+        memory_before = process.memory_info().rss
+
+        converter = instantiate_custom_converter(
+            source_data=source_data, interface_class_dict=interface_class_dict, alignment_info=alignment_info
+        )
+        converter.cache_key = cache_key
+        converter.interface_class_dict = dict(interface_class_dict)
+        converter.source_file_paths = {path for path, _, _ in source_file_stats}
+
+        converter_cache.set(cache_key, converter, weight=max(process.memory_info().rss - memory_before, 0))
+        schedule_converter_expiry()
+
+    with converter_build_locks_lock:
+        converter_build_locks.pop(cache_key, None)
+
+    return converter
+
+
+def schedule_converter_expiry() -> None:
+    """Periodically release the idle converters, even when no further requests are made."""
+    global converter_expiry_timer
+
+    def expire():
+        global converter_expiry_timer
+
+        if converter_cache.expire():
+            gc.collect()  # Close the files held by any reference cycles of the extractors
+
+        converter_expiry_timer = None
+        if len(converter_cache):
+            schedule_converter_expiry()
+
+    if converter_expiry_timer is not None:
+        return
+
+    converter_expiry_timer = threading.Timer(CONVERTER_CACHE_MAX_IDLE_TIME / 10, expire)
+    converter_expiry_timer.daemon = True
+    converter_expiry_timer.start()
+
+
+def invalidate_converter_cache(
+    interface_class_dict: Optional[Dict[str, str]] = None, source_data: Optional[Dict[str, dict]] = None
+) -> int:
+    """
+    Remove the cached converters (only those combining the specified interfaces, or reading any of the files of the
+    specified source data, if provided) and release the files they hold open.
+    """
+    source_file_paths = None
+    if source_data is not None:
+        source_file_paths = {path for path, _, _ in get_source_file_stats(source_data)}
+
+    removed = 0
+    for cache_key, converter in converter_cache.items():
+        if interface_class_dict is not None and converter.interface_class_dict != interface_class_dict:
+            continue
+        if source_file_paths is not None and converter.source_file_paths.isdisjoint(source_file_paths):
+            continue
+
+        converter_cache.pop(cache_key)
+        removed += 1
+
+    if removed:
+        gc.collect()
+
+    return removed
+
+
+def get_cache_info() -> Dict[str, dict]:
+    """Summarize the usage of the in-memory caches."""
+    return dict(
+        converters=converter_cache.info(),
+        converter_classes=custom_converter_class_cache.info(),
+        source_schemas=source_schema_cache.info(),
+        coercion_plans=coercion_plan_cache.info(),
+        inspector_checks=check_registry.info(),
+        validation_results=validation_result_cache.info(),
+        interface_timestamps=interface_timestamp_cache.info(),
+        timestamp_files=timestamp_file_cache.info(),
+        compatibility=compatibility_cache.info(),
+        backend_configurations=backend_configuration_cache.info(),
+    )
+
+
+def get_source_schema(interface_class_dict: dict, resolved: bool = False) -> dict:
+    """
+    Function used to get schema from a CustomNWBConverter that can handle multiple interfaces.
+
+    Schemas are cached both in memory and on disk, keyed by the (ordered) interfaces and the versions of the
+    libraries that define them. The returned schema is shared with the cache and must not be modified.
+
+    Args:
+        interface_class_dict (dict): A mapping of custom interface names to the names of NeuroConv interfaces.
+        resolved (bool): Whether to return the schema with all references resolved.
+    """
+    cache_key = get_fingerprint(
+        dict(interfaces=list(interface_class_dict.items()), versions=get_library_versions("neuroconv", "pynwb"))
+    )
+
+    cache_entry = source_schema_cache.get(cache_key)
+    if cache_entry is None:
+        cache_entry = load_source_schema_cache_entry(cache_key=cache_key, interface_class_dict=interface_class_dict)
+        source_schema_cache.set(cache_key, cache_entry)
+
+    return cache_entry["resolved" if resolved else "schema"]
+
+
+def load_source_schema_cache_entry(cache_key: str, interface_class_dict: dict) -> dict:
+    """Read the original and resolved source schemas from the disk cache, generating them if not yet present."""
+    cache_file_path = SOURCE_SCHEMA_CACHE_FOLDER_PATH / f"{cache_key}.json"
+
+    if cache_file_path.exists():
+        try:
+            with open(file=cache_file_path, mode="r") as fp:
+                return json.load(fp=fp)
+        except (OSError, ValueError):
+            pass  # Regenerate corrupted entries
 
-def get_source_schema(interface_class_dict: dict) -> dict:
-    """Function used to get schema from a CustomNWBConverter that can handle multiple interfaces."""
     CustomNWBConverter = get_custom_converter(interface_class_dict)
-    return CustomNWBConverter.get_source_schema()
+    schema = json.loads(json.dumps(obj=CustomNWBConverter.get_source_schema()))  # Normalize to JSON types
+    cache_entry = dict(
+        interfaces=interface_class_dict,
+        schema=schema,
+        resolved=resolve_references(schema),
+    )
+
+    write_json_atomically(obj=cache_entry, file_path=cache_file_path)
+
+    return cache_entry
 
 
 def map_interfaces(callback, converter, to_match: Union["BaseDataInterface", None] = None, parent_name=None) -> list:
@@ -456,15 +733,40 @@ def map_interfaces(callback, converter, to_match: Union["BaseDataInterface", Non
     return output
 
 
-def get_metadata_schema(source_data: Dict[str, dict], interfaces: dict) -> Dict[str, dict]:
-    """Function used to fetch the metadata schema from a CustomNWBConverter instantiated from the source_data."""
-    from neuroconv.utils import NWBMetaDataEncoder
+def get_table_formats(table_format: Union[str, Dict[str, str]]) -> Dict[str, str]:
+    """Resolve the format of each table type from a single format, or from a format per table type (rows otherwise)."""
+    table_formats = {table_type: "rows" for table_type in TABLE_TYPES}
 
-    resolved_source_data = replace_none_with_nan(
-        source_data, resolve_references(get_custom_converter(interfaces).get_source_schema())
-    )
+    if isinstance(table_format, dict):
+        for table_type in table_format:
+            if table_type not in TABLE_TYPES:
+                raise ValueError(f"Unknown table type '{table_type}'. Valid types are {', '.join(TABLE_TYPES)}.")
+        table_formats.update(table_format)
+    else:
+        table_formats = {table_type: table_format for table_type in TABLE_TYPES}
 
-    converter = instantiate_custom_converter(resolved_source_data, interfaces)
+    for resolved_format in table_formats.values():
+        if resolved_format not in TABLE_FORMATS:
+            raise ValueError(f"Unknown table format '{resolved_format}'. Valid formats are {', '.join(TABLE_FORMATS)}.")
+
+    return table_formats
+
+
+def get_metadata_schema(
+    source_data: Dict[str, dict], interfaces: dict, table_format: Union[str, Dict[str, str]] = "rows"
+) -> Dict[str, dict]:
+    """
+    Function used to fetch the metadata schema from a CustomNWBConverter instantiated from the source_data.
+
+    The electrode and unit tables are returned as lists of rows, as columnar tables if `table_format` is "columnar", or
+    as summaries (without any values) if `table_format` is "summary". A format may also be given per table type
+    (e.g. `{"units": "summary"}`), the other tables being returned as lists of rows.
+    """
+    table_formats = get_table_formats(table_format)
+
+    resolved_source_data = replace_none_with_nan(source_data, get_source_schema(interfaces, resolved=True))
+
+    converter = get_converter(resolved_source_data, interfaces)
     schema = converter.get_metadata_schema()
     metadata = converter.get_metadata()
 
@@ -500,21 +802,29 @@ def get_metadata_schema(source_data: Dict[str, dict], interfaces: dict) -> Dict[
         else:
             metadata["Ecephys"]["UnitColumns"] = unit_columns
 
-        units_data = resolved_units[name] = get_unit_table_json(sorting_interface)
+        n_units = sorting_interface.sorting_extractor.get_num_units()
 
-        n_units = len(units_data)
-
-        resolved_units_schema["properties"][name] = {
-            "type": "array",
-            "minItems": n_units,
-            "maxItems": n_units,
-            "items": {
-                "allOf": [
-                    {"$ref": "#/properties/Ecephys/definitions/Unit"},
-                    {"required": list(map(lambda info: info["name"], unit_columns))},
-                ]
-            },
-        }
+        if table_formats["units"] == "summary":
+            resolved_units[name] = get_table_summary(unit_columns, n_units)
+            resolved_units_schema["properties"][name] = TABLE_SUMMARY_SCHEMA
+        elif table_formats["units"] == "columnar":
+            unit_table_columns = get_table_columns(converter, "units", name, interface=sorting_interface)
+            resolved_units[name] = get_columnar_table(unit_table_columns, unit_columns)
+            resolved_units_schema["properties"][name] = get_columnar_table_schema(unit_columns, n_units)
+        else:
+            unit_table_columns = get_table_columns(converter, "units", name, interface=sorting_interface)
+            resolved_units[name] = assemble_table_rows(unit_table_columns)
+            resolved_units_schema["properties"][name] = {
+                "type": "array",
+                "minItems": n_units,
+                "maxItems": n_units,
+                "items": {
+                    "allOf": [
+                        {"$ref": "#/properties/Ecephys/definitions/Unit"},
+                        {"required": list(map(lambda info: info["name"], unit_columns))},
+                    ]
+                },
+            }
 
         resolved_units_schema["required"].append(name)
 
@@ -534,21 +844,29 @@ def get_metadata_schema(source_data: Dict[str, dict], interfaces: dict) -> Dict[
         else:
             ecephys_metadata["ElectrodeColumns"] = electrode_columns
 
-        electrode_data = resolved_electrodes[name] = get_electrode_table_json(recording_interface)
-
-        n_electrodes = len(electrode_data)
+        n_electrodes = recording_interface.recording_extractor.get_num_channels()
 
-        resolved_electrodes_schema["properties"][name] = {
-            "type": "array",
-            "minItems": n_electrodes,
-            "maxItems": n_electrodes,
-            "items": {
-                "allOf": [
-                    {"$ref": "#/properties/Ecephys/definitions/Electrode"},
-                    {"required": list(map(lambda info: info["name"], electrode_columns))},
-                ]
-            },
-        }
+        if table_formats["electrodes"] == "summary":
+            resolved_electrodes[name] = get_table_summary(electrode_columns, n_electrodes)
+            resolved_electrodes_schema["properties"][name] = TABLE_SUMMARY_SCHEMA
+        elif table_formats["electrodes"] == "columnar":
+            electrode_table_columns = get_table_columns(converter, "electrodes", name, interface=recording_interface)
+            resolved_electrodes[name] = get_columnar_table(electrode_table_columns, electrode_columns)
+            resolved_electrodes_schema["properties"][name] = get_columnar_table_schema(electrode_columns, n_electrodes)
+        else:
+            electrode_table_columns = get_table_columns(converter, "electrodes", name, interface=recording_interface)
+            resolved_electrodes[name] = assemble_table_rows(electrode_table_columns)
+            resolved_electrodes_schema["properties"][name] = {
+                "type": "array",
+                "minItems": n_electrodes,
+                "maxItems": n_electrodes,
+                "items": {
+                    "allOf": [
+                        {"$ref": "#/properties/Ecephys/definitions/Electrode"},
+                        {"required": list(map(lambda info: info["name"], electrode_columns))},
+                    ]
+                },
+            }
 
         resolved_electrodes_schema["required"].append(name)
 
@@ -703,31 +1021,16 @@ def get_metadata_schema(source_data: Dict[str, dict], interfaces: dict) -> Dict[
         if device_def:
             device_def["additionalProperties"] = True
 
-    # TODO: generalize logging stuff
-    log_base = GUIDE_ROOT_FOLDER / "logs"
-    log_base.mkdir(exist_ok=True)
-    with open(file=log_base / "file_metadata_page_schema.json", mode="w") as fp:
-        json.dump(obj=dict(schema=schema), fp=fp, cls=NWBMetaDataEncoder, indent=2)
-    with open(file=log_base / "file_metadata_page_results.json", mode="w") as fp:
-        json.dump(obj=dict(results=metadata), fp=fp, cls=NWBMetaDataEncoder, indent=2)
+    # Written in the background (if sampled) so that the response does not wait for the disk
+    if snapshot_writer.should_sample():
+        snapshot_writer.submit("file_metadata_page", dict(schema=dict(schema=schema), results=dict(results=metadata)))
 
-    return json.loads(
-        json.dumps(obj=replace_nan_with_none(dict(results=metadata, schema=schema)), cls=NWBMetaDataEncoder)
-    )
+    return dict(results=metadata, schema=schema)
 
 
 def get_check_function(check_function_name: str) -> callable:
-    """Function used to fetch an arbitrary NWB Inspector function."""
-    from nwbinspector import configure_checks, load_config
-
-    dandi_check_list = configure_checks(config=load_config(filepath_or_keyword="dandi"))
-    dandi_check_registry = {check.__name__: check for check in dandi_check_list}
-
-    check_function: callable = dandi_check_registry.get(check_function_name)
-    if check_function is None:
-        raise ValueError(f"Function {check_function_name} not found in nwbinspector")
-
-    return check_function
+    """Function used to fetch an arbitrary NWB Inspector function, as configured for DANDI."""
+    return check_registry.get(check_function_name)
 
 
 def run_check_function(check_function: callable, arg: dict) -> dict:
@@ -745,41 +1048,71 @@ def run_check_function(check_function: callable, arg: dict) -> dict:
     return output
 
 
-def validate_subject_metadata(
-    subject_metadata: dict, check_function_name: str, timezone: Optional[str] = None
-):  # -> Union[None, InspectorMessage, List[InspectorMessage]]:
-    """Function used to validate subject metadata."""
-    import pytz
+def parse_metadata_datetime(value: Any, timezone: Optional[str] = None) -> Any:
+    """Parse an ISO-formatted datetime string from the metadata, in the specified timezone."""
+    if not isinstance(value, str):
+        return value
+
+    parsed = datetime.fromisoformat(value)
+    if timezone is not None:
+        parsed = parsed.replace(tzinfo=zoneinfo.ZoneInfo(timezone))
+
+    return parsed
+
+
+def create_subject(subject_metadata: dict, timezone: Optional[str] = None) -> "Subject":
     from pynwb.file import Subject
 
-    check_function = get_check_function(check_function_name)
+    subject_metadata = dict(subject_metadata)
+    if "date_of_birth" in subject_metadata:
+        subject_metadata["date_of_birth"] = parse_metadata_datetime(subject_metadata["date_of_birth"], timezone)
 
-    if isinstance(subject_metadata.get("date_of_birth"), str):
-        subject_metadata["date_of_birth"] = datetime.fromisoformat(subject_metadata["date_of_birth"])
-        if timezone is not None:
-            subject_metadata["date_of_birth"] = subject_metadata["date_of_birth"].replace(
-                tzinfo=zoneinfo.ZoneInfo(timezone)
-            )
+    return Subject(**subject_metadata)
+
+
+def create_mock_nwbfile(nwbfile_metadata: dict, timezone: Optional[str] = None) -> "NWBFile":
+    from pynwb.testing.mock.file import mock_NWBFile
+
+    nwbfile_metadata = dict(nwbfile_metadata)
+    if "session_start_time" in nwbfile_metadata:
+        nwbfile_metadata["session_start_time"] = parse_metadata_datetime(
+            nwbfile_metadata["session_start_time"], timezone
+        )
+
+    return mock_NWBFile(**nwbfile_metadata)
+
+
+def validate_subject_metadata(
+    subject_metadata: dict, check_function: Union[str, callable], timezone: Optional[str] = None
+):  # -> Union[None, InspectorMessage, List[InspectorMessage]]:
+    """Function used to validate subject metadata, with a check function or its name."""
+    if isinstance(check_function, str):
+        check_function = get_check_function(check_function)
 
-    return run_check_function(check_function, Subject(**subject_metadata))
+    return run_check_function(check_function, create_subject(subject_metadata, timezone))
 
 
 def validate_nwbfile_metadata(
-    nwbfile_metadata: dict, check_function_name: str, timezone: Optional[str] = None
+    nwbfile_metadata: dict, check_function: Union[str, callable], timezone: Optional[str] = None
 ):  # -> Union[None, InspectorMessage, List[InspectorMessage]]:
-    """Function used to validate NWBFile metadata."""
-    from pynwb.testing.mock.file import mock_NWBFile
+    """Function used to validate NWBFile metadata, with a check function or its name."""
+    if isinstance(check_function, str):
+        check_function = get_check_function(check_function)
 
-    check_function = get_check_function(check_function_name)
+    return run_check_function(check_function, create_mock_nwbfile(nwbfile_metadata, timezone))
 
-    if isinstance(nwbfile_metadata.get("session_start_time"), str):
-        nwbfile_metadata["session_start_time"] = datetime.fromisoformat(nwbfile_metadata["session_start_time"])
-        if timezone is not None:
-            nwbfile_metadata["session_start_time"] = nwbfile_metadata["session_start_time"].replace(
-                tzinfo=zoneinfo.ZoneInfo(timezone)
-            )
 
-    return run_check_function(check_function, mock_NWBFile(**nwbfile_metadata))
+def get_validation_cache_key(check_function_name: str, metadata_fingerprint: str, timezone: Optional[str]) -> tuple:
+    """
+    Identify the result of a check on some metadata.
+
+    The metadata is identified by its fingerprint, which does not depend on the order of its keys. The version of the
+    NWB Inspector and the generation of the check registry (which is rebuilt when its configuration changes) are
+    included as well.
+    """
+    import nwbinspector
+
+    return (check_function_name, metadata_fingerprint, timezone, nwbinspector.__version__, check_registry.builds)
 
 
 def validate_metadata(
@@ -787,28 +1120,136 @@ def validate_metadata(
     check_function_name: str,
     timezone: Optional[str] = None,
 ) -> dict:
-    """Function used to validate data using an arbitrary NWB Inspector function."""
-    from nwbinspector import InspectorOutputJSONEncoder
+    """
+    Function used to validate data using an arbitrary NWB Inspector function.
+
+    Results are cached, so that validating the same metadata again does not build any pynwb object.
+    """
     from pynwb.file import NWBFile, Subject
 
     check_function = get_check_function(check_function_name)
 
+    cache_key = get_validation_cache_key(check_function_name, get_fingerprint(metadata), timezone)
+    result = validation_result_cache.get(cache_key, NOT_CACHED)
+    if result is not NOT_CACHED:
+        return result
+
     if issubclass(check_function.neurodata_type, Subject):
-        result = validate_subject_metadata(metadata, check_function_name, timezone)
+        result = validate_subject_metadata(metadata, check_function, timezone)
     elif issubclass(check_function.neurodata_type, NWBFile):
-        result = validate_nwbfile_metadata(metadata, check_function_name, timezone)
+        result = validate_nwbfile_metadata(metadata, check_function, timezone)
     else:
         raise ValueError(
             f"Function {check_function_name} with neurodata_type {check_function.neurodata_type} "
             "is not supported by this function!"
         )
 
-    return json.loads(json.dumps(result, cls=InspectorOutputJSONEncoder))
+    validation_result_cache.set(cache_key, result)
+
+    return result
+
+
+def is_check_for(check_function: callable, neurodata_type: type) -> bool:
+    check_type = check_function.neurodata_type
+    return isinstance(check_type, type) and issubclass(check_type, neurodata_type)
+
+
+def validate_metadata_batch(
+    metadata: Dict[str, dict],
+    checks: Optional[Union[Dict[str, Dict[str, List[str]]], Dict[str, List[str]]]] = None,
+    timezone: Optional[str] = None,
+    max_workers: int = 1,
+) -> Dict[str, Dict[str, list]]:
+    """
+    Validate the Subject and NWBFile metadata of a page with many NWB Inspector functions at once.
+
+    Each pynwb object is only built once and shared by all of its checks, and only if some of their results are not
+    cached yet (see `validate_metadata`).
+
+    Args:
+        metadata (dict): The metadata to validate, by section (`Subject` and/or `NWBFile`).
+        checks (dict, optional): The checks to run for each section, either as a list of check names or as a mapping
+            of each field to the names of its checks. All DANDI-configured checks of each section are run by default.
+        timezone (str, optional): The timezone of the datetimes in the metadata.
+        max_workers (int): The number of threads running the checks. These are mostly pure Python, so running them
+            sequentially (the default) is usually fastest.
+
+    Returns:
+        dict: The messages of each section, grouped by field (or by check name if no fields were specified).
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from pynwb.file import NWBFile, Subject
+
+    section_types = dict(Subject=(Subject, create_subject), NWBFile=(NWBFile, create_mock_nwbfile))
+
+    unknown_sections = set(metadata) - set(section_types)
+    if unknown_sections:
+        raise ValueError(f"Cannot validate the metadata of {', '.join(sorted(unknown_sections))}.")
+
+    checks = checks or dict()
+
+    tasks = list()  # The section, group, check function and cache key of each check to run
+    for section, section_metadata in metadata.items():
+        neurodata_type, _ = section_types[section]
+        metadata_fingerprint = get_fingerprint(section_metadata)
+
+        section_checks = checks.get(section)
+        if section_checks is None:
+            section_checks = [
+                name for name, check in check_registry.get_checks().items() if is_check_for(check, neurodata_type)
+            ]
+
+        if isinstance(section_checks, dict):
+            grouped_check_names = section_checks
+        else:
+            grouped_check_names = {check_name: [check_name] for check_name in section_checks}
+
+        for group, check_names in grouped_check_names.items():
+            for check_name in [check_names] if isinstance(check_names, str) else check_names:
+                # Generic checks (without a neurodata type) may be requested for any section
+                check_function = get_check_function(check_name)
+                if check_function.neurodata_type is not None and not is_check_for(check_function, neurodata_type):
+                    raise ValueError(f"Function {check_name} cannot validate the {section} metadata.")
+
+                cache_key = get_validation_cache_key(check_name, metadata_fingerprint, timezone)
+                tasks.append((section, group, check_function, cache_key))
+
+    # Results are shared with `validate_metadata`, and pynwb objects are only built for sections with uncached checks
+    outputs = [validation_result_cache.get(cache_key, NOT_CACHED) for _, _, _, cache_key in tasks]
+    uncached_tasks = [index for index, output in enumerate(outputs) if output is NOT_CACHED]
+
+    neurodata_objects = dict()
+    for section in {tasks[index][0] for index in uncached_tasks}:
+        _, create_object = section_types[section]
+        neurodata_objects[section] = create_object(metadata[section], timezone)
+
+    def run_task(index: int) -> Any:
+        section, _, check_function, cache_key = tasks[index]
+        output = run_check_function(check_function, neurodata_objects[section])
+        validation_result_cache.set(cache_key, output)
+        return output
+
+    if max_workers > 1 and len(uncached_tasks) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            uncached_outputs = list(executor.map(run_task, uncached_tasks))
+    else:
+        uncached_outputs = [run_task(index) for index in uncached_tasks]
+
+    for index, output in zip(uncached_tasks, uncached_outputs):
+        outputs[index] = output
+
+    results = {section: dict() for section in metadata}
+    for (section, group, _, _), output in zip(tasks, outputs):
+        messages = results[section].setdefault(group, [])
+        if output is not None:
+            messages.extend(output if isinstance(output, list) else [output])
+
+    return results
 
 
 def set_interface_alignment(converter: dict, alignment_info: dict) -> dict:
 
-    import numpy as np
     from neuroconv.datainterfaces.ecephys.basesortingextractorinterface import (
         BaseSortingExtractorInterface,
     )
@@ -833,11 +1274,9 @@ def set_interface_alignment(converter: dict, alignment_info: dict) -> dict:
         try:
             if method == "timestamps":
 
-                # Open the input file for reading
-                # Can be .txt, .csv, .tsv, etc.
-                # But timestamps must be scalars separated by newline characters
-                with open(file=value, mode="r") as io:
-                    aligned_timestamps = np.array([float(line.strip()) for line in io.readlines()])
+                # Can be .npy, raw float64 values (.bin, .raw or .f64), or text (.txt, .csv, .tsv, etc.)
+                # But text timestamps must be scalars separated by newline characters
+                aligned_timestamps = load_timestamps(file_path=value)
 
                 # Special case for sorting interfaces; to set timestamps they must have a recording registered
                 must_set_mock_recording = (
@@ -847,7 +1286,7 @@ def set_interface_alignment(converter: dict, alignment_info: dict) -> dict:
                 if must_set_mock_recording is True:
                     sorting_extractor = interface.sorting_extractor
                     sampling_frequency = sorting_extractor.get_sampling_frequency()
-                    end_frame = timestamps_array.shape[0]
+                    end_frame = aligned_timestamps.shape[0]
                     mock_recording_interface = MockRecordingInterface(
                         sampling_frequency=sampling_frequency,
                         durations=[end_frame / sampling_frequency],
@@ -855,14 +1294,14 @@ def set_interface_alignment(converter: dict, alignment_info: dict) -> dict:
                     )
                     interface.register_recording(recording_interface=mock_recording_interface)
 
-                interface.set_aligned_timestamps(aligned_timestamps=aligned_timestamps)
+                converter.regular_rates[name] = set_aligned_timestamps(interface, aligned_timestamps)
 
             # Special case for sorting interfaces; a recording interface to be converted may be registered/linked
             elif method == "linked":
                 interface.register_recording(converter.data_interface_objects[value])
 
             elif method == "start":
-                interface.set_aligned_starting_time(aligned_starting_time=value)
+                converter.regular_rates[name] = set_aligned_starting_time(interface, value)
 
         except Exception as e:
             errors[name] = str(e)
@@ -870,7 +1309,96 @@ def set_interface_alignment(converter: dict, alignment_info: dict) -> dict:
     return errors
 
 
-def get_compatible_interfaces(info: dict) -> dict:
+def get_shiftable_recording(interface) -> Optional["BaseRecording"]:
+    """The recording of an interface, if its timestamps are only defined by a starting time and sampling rate."""
+    from neuroconv.datainterfaces.ecephys.baserecordingextractorinterface import (
+        BaseRecordingExtractorInterface,
+    )
+
+    if not isinstance(interface, BaseRecordingExtractorInterface):
+        return None
+
+    recording = interface.recording_extractor
+    if any(recording.has_time_vector(segment_index=index) for index in range(recording.get_num_segments())):
+        return None
+
+    return recording
+
+
+def set_aligned_timestamps(interface, aligned_timestamps: "np.ndarray") -> dict:
+    """
+    Align the timestamps of an interface, replacing them by a starting time when they match its sampling rate.
+
+    Regular timestamps are then neither held in memory nor written to the NWB file. This applies to single-segment
+    recordings, whose other timestamps would be written in full.
+
+    Returns:
+        dict: Whether the timestamps were `regular` (and thus replaced), the `rate` and `starting_time` used instead,
+            the number of `saved_bytes`, and the time taken by the analysis (in seconds).
+    """
+    start_time = time.perf_counter()
+    report = dict(regular=False, rate=None, starting_time=None, saved_bytes=0)
+
+    recording = get_shiftable_recording(interface)
+    if recording is not None and recording.get_num_segments() == 1:
+        rate = recording.get_sampling_frequency()
+        if len(aligned_timestamps) == recording.get_num_samples() and is_regular_grid(aligned_timestamps, rate):
+            starting_time = float(aligned_timestamps[0])
+            recording.shift_times(starting_time - recording.get_start_time())
+            report.update(regular=True, rate=rate, starting_time=starting_time, saved_bytes=aligned_timestamps.nbytes)
+
+    if not report["regular"]:
+        interface.set_aligned_timestamps(aligned_timestamps=aligned_timestamps)
+
+    report["analysis_time"] = time.perf_counter() - start_time
+    return report
+
+
+def set_aligned_starting_time(interface, aligned_starting_time: float) -> dict:
+    """
+    Align the starting time of an interface, without ever creating its timestamps when they are regular.
+
+    NeuroConv shifts the timestamps of recordings by setting new ones, which are then held in memory and written in
+    full unless found to be regular again; shifting the starting time of their segments avoids both.
+
+    Returns:
+        dict: The same report as `set_aligned_timestamps`.
+    """
+    import numpy as np
+
+    start_time = time.perf_counter()
+    report = dict(regular=False, rate=None, starting_time=None, saved_bytes=0)
+
+    recording = get_shiftable_recording(interface)
+    if recording is not None:
+        recording.shift_times(aligned_starting_time)
+
+        number_of_samples = sum(recording.get_num_samples(index) for index in range(recording.get_num_segments()))
+        report.update(
+            regular=True,
+            rate=recording.get_sampling_frequency(),
+            starting_time=recording.get_start_time(segment_index=0),
+            saved_bytes=number_of_samples * np.dtype("float64").itemsize,
+        )
+    else:
+        interface.set_aligned_starting_time(aligned_starting_time=aligned_starting_time)
+
+    report["analysis_time"] = time.perf_counter() - start_time
+    return report
+
+
+def get_compatibility_matrix(info: dict) -> Dict[str, dict]:
+    """
+    Find the recording interfaces that each sorting interface can be linked to, once per interfaces and source files.
+
+    Registering recordings modifies the sorting interfaces, so this uses a separate converter instance. The sorting
+    interfaces are independent and are evaluated in parallel threads; the recordings of each are tried in turn.
+
+    Returns:
+        dict: The `compatible` recording interfaces of each sorting interface, the `timings` of each attempt (in
+            seconds, by sorting and recording interface), and whether the result was `cached`.
+    """
+    from concurrent.futures import ThreadPoolExecutor
 
     from neuroconv.datainterfaces.ecephys.baserecordingextractorinterface import (
         BaseRecordingExtractorInterface,
@@ -879,51 +1407,167 @@ def get_compatible_interfaces(info: dict) -> dict:
         BaseSortingExtractorInterface,
     )
 
-    converter = instantiate_custom_converter(source_data=info["source_data"], interface_class_dict=info["interfaces"])
+    source_data, interface_class_dict = info["source_data"], info["interfaces"]
+    cache_key = get_fingerprint(
+        dict(
+            interfaces=tuple(interface_class_dict.items()),
+            source_data=source_data,
+            files=get_source_file_stats(source_data),
+        )
+    )
 
-    compatible = {}
+    matrix = compatibility_cache.get(cache_key)
+    if matrix is not None:
+        return dict(matrix, cached=True)
 
-    for name, interface in converter.data_interface_objects.items():
+    converter = instantiate_custom_converter(source_data=source_data, interface_class_dict=interface_class_dict)
 
-        is_sorting = isinstance(interface, BaseSortingExtractorInterface)
+    sorting_interfaces = {
+        name: interface
+        for name, interface in converter.data_interface_objects.items()
+        if isinstance(interface, BaseSortingExtractorInterface)
+    }
+    recording_interfaces = {
+        name: interface
+        for name, interface in converter.data_interface_objects.items()
+        if isinstance(interface, BaseRecordingExtractorInterface)
+    }
 
-        if is_sorting is True:
-            compatible[name] = []
+    def find_compatible_recordings(sorting_interface) -> tuple:
+        compatible = list()
+        timings = dict()
 
         # If at least one recording and sorting interface is selected on the formats page
         # Then it is possible the two could be linked (the sorting was applied to the recording)
         # But there are very strict conditions from SpikeInterface determining compatibility
         # Those conditions are not easily exposed so we just 'try' to register them and skip on error
-        sibling_recording_interfaces = {
-            interface_key: interface
-            for interface_key, interface in converter.data_interface_objects.items()
-            if isinstance(interface, BaseRecordingExtractorInterface)
-        }
-
-        for recording_interface_key, recording_interface in sibling_recording_interfaces.items():
+        for recording_name, recording_interface in recording_interfaces.items():
+            start_time = time.perf_counter()
             try:
-                interface.register_recording(recording_interface=recording_interface)
-                compatible[name].append(recording_interface_key)
+                sorting_interface.register_recording(recording_interface=recording_interface)
+                compatible.append(recording_name)
             except Exception:
                 pass
+            timings[recording_name] = time.perf_counter() - start_time
 
-    return compatible
+        return compatible, timings
 
+    number_of_workers = min(len(sorting_interfaces), MAX_COMPATIBILITY_WORKERS)
+    if number_of_workers > 1 and recording_interfaces:
+        with ThreadPoolExecutor(max_workers=number_of_workers) as executor:
+            results = list(executor.map(find_compatible_recordings, sorting_interfaces.values()))
+    else:
+        results = [find_compatible_recordings(interface) for interface in sorting_interfaces.values()]
 
-def get_interface_alignment(info: dict) -> dict:
+    matrix = dict(
+        compatible={name: compatible for name, (compatible, _) in zip(sorting_interfaces, results)},
+        timings={name: timings for name, (_, timings) in zip(sorting_interfaces, results)},
+    )
+    compatibility_cache.set(cache_key, matrix)
+
+    return dict(matrix, cached=False)
+
+
+def cache_original_timestamps(interface) -> None:
+    """
+    Read the original timestamps of a temporal interface from the disk cache, and only compute them when missing.
+
+    Computing them may require decoding or scanning all source files (e.g. for videos); the cache is keyed by the
+    interface class, its source data and the size and modification time of its source files. Both the timestamps shown
+    for the alignment and the alignment itself (e.g. shifting the original timestamps) go through this method.
+
+    Recordings without a time vector are skipped, since their timestamps are cheaply computed from the sampling rate.
+    """
+    from neuroconv.basetemporalalignmentinterface import BaseTemporalAlignmentInterface
+
+    if not isinstance(interface, BaseTemporalAlignmentInterface):
+        return
+
+    if get_shiftable_recording(interface) is not None:
+        return
+
+    interface_class = type(interface)
+    get_original_timestamps = interface.get_original_timestamps
+
+    @wraps(get_original_timestamps)
+    def get_cached_original_timestamps(*args, **kwargs):
+        cache_key = get_fingerprint(
+            dict(
+                interface=f"{interface_class.__module__}.{interface_class.__qualname__}",
+                source_data=interface.source_data,
+                files=get_source_file_stats(interface.source_data),
+                arguments=[args, kwargs],
+                versions=get_library_versions("neuroconv"),
+            )
+        )
+
+        timestamps = interface_timestamp_cache.get(cache_key)
+        if timestamps is None:
+            timestamps = get_original_timestamps(*args, **kwargs)
+            interface_timestamp_cache.set(cache_key, timestamps)
 
+        return timestamps
+
+    interface.get_original_timestamps = get_cached_original_timestamps
+
+
+def get_interface_timestamps(interface) -> Optional["np.ndarray"]:
+    """Get the timestamps of a temporal interface, or None if it has none (or cannot provide them)."""
     from neuroconv.basetemporalalignmentinterface import BaseTemporalAlignmentInterface
+
+    if not isinstance(interface, BaseTemporalAlignmentInterface):
+        return None
+
+    # Note: it is technically possible to have a BaseTemporalAlignmentInterface that has not yet implemented
+    # the `get_timestamps` method; try to get this but skip on error
+    try:
+        interface_timestamps = interface.get_timestamps()
+        if len(interface_timestamps) == 1:
+            interface_timestamps = interface_timestamps[0]
+
+        # Some interfaces, such as video or audio, may return a list of arrays
+        # corresponding to each file of their `file_paths` input
+        # Note: GUIDE only currently supports single files for these interfaces
+        # Thus, unpack only the first array
+        if isinstance(interface_timestamps, list):
+            interface_timestamps = interface_timestamps[0]
+
+        return interface_timestamps
+    except Exception:
+        return None
+
+
+def get_aligned_converter(info: dict) -> "NWBConverter":
+    """Get the (cached) converter of an alignment request, with its temporal alignment applied."""
+    converter = get_converter(
+        source_data=info["source_data"],
+        interface_class_dict=info["interfaces"],
+        alignment_info=info.get("alignment", dict()),
+    )
+    converter.temporally_align_data_interfaces()
+
+    return converter
+
+
+def get_interface_alignment(info: dict) -> dict:
+    """
+    Summarize the aligned timestamps of each interface, along with the options available to align them.
+
+    The timestamps themselves are never returned, only their summaries (see `get_timestamp_summary`), which are
+    computed once per converter. Windows of timestamps at full resolution are available from `get_timestamps_window`.
+    """
     from neuroconv.datainterfaces.ecephys.basesortingextractorinterface import (
         BaseSortingExtractorInterface,
     )
 
-    alignment_info = info.get("alignment", dict())
+    info = session_store.resolve(info)
 
-    converter = instantiate_custom_converter(source_data=info["source_data"], interface_class_dict=info["interfaces"])
+    converter = get_aligned_converter(info)
 
-    compatibility = get_compatible_interfaces(info)
+    compatibility_matrix = get_compatibility_matrix(info)
+    compatibility = compatibility_matrix["compatible"]
 
-    errors = set_interface_alignment(converter=converter, alignment_info=alignment_info)
+    errors = converter.alignment_errors
 
     metadata = dict()
     timestamps = dict()
@@ -938,32 +1582,45 @@ def get_interface_alignment(info: dict) -> dict:
         if is_sorting is True:
             metadata[name]["compatible"] = compatibility.get(name, None)
 
-        if not isinstance(interface, BaseTemporalAlignmentInterface):
-            timestamps[name] = []
-            continue
-
-        # Note: it is technically possible to have a BaseTemporalAlignmentInterface that has not yet implemented
-        # the `get_timestamps` method; try to get this but skip on error
-        try:
-            interface_timestamps = interface.get_timestamps()
-            if len(interface_timestamps) == 1:
-                interface_timestamps = interface_timestamps[0]
-
-            # Some interfaces, such as video or audio, may return a list of arrays
-            # corresponding to each file of their `file_paths` input
-            # Note: GUIDE only currently supports single files for these interfaces
-            # Thus, unpack only the first array
-            if isinstance(interface_timestamps, list):
-                interface_timestamps = interface_timestamps[0]
+        summary = converter.timestamp_summaries.get(name)
+        if summary is None:
+            summary = converter.timestamp_summaries[name] = get_timestamp_summary(get_interface_timestamps(interface))
 
-            timestamps[name] = interface_timestamps.tolist()
-        except Exception:
-            timestamps[name] = []
+        timestamps[name] = summary
 
     return dict(
         metadata=metadata,
         timestamps=timestamps,
         errors=errors,
+        compatibility=dict(timings=compatibility_matrix["timings"], cached=compatibility_matrix["cached"]),
+        regular_rates=converter.regular_rates,
+    )
+
+
+def get_timestamps_window(info: dict) -> Dict[str, Any]:
+    """
+    Get a window of the aligned timestamps of an interface at full resolution.
+
+    Args:
+        info (dict): The same request as for the alignment (or a reference to its session), along with:
+            interface (str): The name of the interface.
+            offset (int, optional): The position of the first timestamp of the window.
+            start_time (float, optional): The first time of the window, if no offset is provided.
+            stop_time (float, optional): The (excluded) last time of the window, if no offset is provided.
+            limit (int): The maximum number of timestamps in the window.
+    """
+    info = session_store.resolve(info)
+
+    converter = get_aligned_converter(info)
+    interface_timestamps = get_interface_timestamps(get_interface_by_name(converter, info["interface"]))
+
+    offset = info.get("offset")
+    return get_timestamp_window(
+        interface_timestamps,
+        offset=None if offset is None else int(offset),
+        limit=int(info.get("limit", 10_000)),
+        start_time=info.get("start_time"),
+        stop_time=info.get("stop_time"),
     )
 
 
@@ -1067,11 +1724,14 @@ def create_file(
                         progress_bar_options=progress_bar_options,
                     )
 
+        # Only set full backend configuration if running a full conversion
+        # Resolved before the watermark is added, so that the default configuration is shared with the configuration page
+        backend_configuration = None
+        if run_stub_test is False:
+            backend_configuration = update_backend_configuration(info, converter=converter, metadata=metadata)
+
         # Add GUIDE watermark
-        package_json_file_path = resource_path("package.json" if is_packaged() else "../package.json")
-        with open(file=package_json_file_path) as fp:
-            package_json = json.load(fp=fp)
-        app_version = package_json["version"]
+        app_version = get_app_version()
         metadata["NWBFile"]["source_script"] = f"Created using NWB GUIDE v{app_version}"
         metadata["NWBFile"]["source_script_file_name"] = neuroconv.__file__  # Must be included to be valid
 
@@ -1083,11 +1743,14 @@ def create_file(
             backend=backend,
         )
 
-        # Only set full backend configuration if running a full conversion
-        if run_stub_test is False:
-            run_conversion_kwargs.update(dict(backend_configuration=update_backend_configuration(info)))
+        if backend_configuration is not None:
+            run_conversion_kwargs.update(dict(backend_configuration=backend_configuration))
 
-        converter.run_conversion(**run_conversion_kwargs)
+        with converter.lock:
+            converter.run_conversion(**run_conversion_kwargs)
+
+        # The source files are no longer needed by the worker that converted them
+        invalidate_converter_cache(source_data=info["source_data"])
 
     except Exception as e:
         if log_url:
@@ -1104,25 +1767,82 @@ def create_file(
         raise e
 
 
-def update_backend_configuration(info: dict) -> dict:
+def get_metadata_shape(metadata: Any, key: Optional[str] = None) -> Any:
+    """
+    Reduce metadata to what determines the datasets of the in-memory NWB file: its structure and the names of objects.
+
+    All other values (e.g. descriptions or dates) are replaced by their type.
+    """
+    if isinstance(metadata, dict):
+        return {key: get_metadata_shape(value, key=key) for key, value in metadata.items()}
+    if isinstance(metadata, list):
+        return [get_metadata_shape(item) for item in metadata]
+    if key == "name":
+        return metadata
+    return type(metadata).__name__
+
+
+def get_backend_configuration_key(converter, metadata: dict, backend: str) -> str:
+    """
+    Identify a default backend configuration by the converter (i.e. its interfaces, source files and state), the shape
+    of the metadata and the backend.
+    """
+    return get_fingerprint(dict(converter=converter.cache_key, metadata=get_metadata_shape(metadata), backend=backend))
+
+
+def get_cached_backend_configuration(converter, metadata: dict, backend: str) -> "BackendConfiguration":
+    """
+    Get the default backend configuration of a converter, which is cached until its source files change.
 
+    Computing it requires adding all data to an in-memory NWB file. The returned configuration is shared with the
+    cache and must not be modified.
+    """
     from neuroconv.tools.nwb_helpers import (
         get_default_backend_configuration,
         make_nwbfile_from_metadata,
     )
 
+    cache_key = get_backend_configuration_key(converter, metadata, backend)
+
+    backend_configuration = backend_configuration_cache.get(cache_key)
+    if backend_configuration is not None:
+        return backend_configuration
+
+    with converter.lock:
+        # Computed by another request in the meantime
+        if cache_key in backend_configuration_cache:
+            backend_configuration = backend_configuration_cache.get(cache_key)
+        if backend_configuration is not None:
+            return backend_configuration
+
+        # Adding the data may modify the metadata, which is also used for the conversion itself
+        metadata = copy.deepcopy(metadata)
+
+        nwbfile = make_nwbfile_from_metadata(metadata=metadata)
+        converter.add_to_nwbfile(nwbfile, metadata=metadata)
+
+        backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend=backend)
+        backend_configuration_cache.set(cache_key, backend_configuration)
+
+    return backend_configuration
+
+
+def update_backend_configuration(info: dict, converter=None, metadata: Optional[dict] = None) -> dict:
+    """
+    Apply the backend configuration of the frontend to (a copy of) the default one.
+
+    The converter and metadata of the conversion are resolved from `info` unless provided.
+    """
     PROPS_TO_IGNORE = ["full_shape"]
 
     info_from_frontend = info.get("configuration", {})
     backend = info_from_frontend.get("backend", "hdf5")
     backend_configuration_from_frontend = info_from_frontend.get("results", {}).get(backend, {})
 
-    converter, metadata, __ = get_conversion_info(info)
+    if converter is None or metadata is None:
+        converter, metadata, __ = get_conversion_info(info)
 
-    nwbfile = make_nwbfile_from_metadata(metadata=metadata)
-    converter.add_to_nwbfile(nwbfile, metadata=metadata)
-
-    backend_configuration = get_default_backend_configuration(nwbfile=nwbfile, backend=backend)
+    backend_configuration = copy.deepcopy(get_cached_backend_configuration(converter, metadata, backend=backend))
 
     for location_in_file, dataset_configuration in backend_configuration_from_frontend.items():
         for key, value in dataset_configuration.items():
@@ -1135,8 +1855,6 @@ def update_backend_configuration(info: dict) -> dict:
 
 def get_backend_configuration(info: dict) -> dict:
 
-    import numpy as np
-
     PROPS_TO_REMOVE = [
         # Immutable
         "object_id",
@@ -1145,18 +1863,12 @@ def get_backend_configuration(info: dict) -> dict:
         "dtype",
     ]
 
+    info = session_store.resolve(info)
     info["overwrite"] = True  # Always overwrite the file
 
     backend = info.get("backend", "hdf5")
     configuration = update_backend_configuration(info)
 
-    def custom_encoder(obj):
-        if isinstance(obj, np.ndarray):
-            return obj.tolist()
-        if isinstance(obj, np.dtype):
-            return str(obj)
-        raise TypeError(f"Object of type {obj.__class__.__name__} is not JSON serializable")
-
     # Provide metadata on configuration dictionary
     configuration_dict = configuration.dict()
 
@@ -1164,9 +1876,7 @@ def get_backend_configuration(info: dict) -> dict:
     for key, dataset in configuration_dict["dataset_configurations"].items():
         itemsizes[key] = dataset["dtype"].itemsize
 
-    serialized = json.loads(json.dumps(configuration_dict, default=custom_encoder))
-
-    dataset_configurations = serialized["dataset_configurations"]  # Only provide dataset configurations
+    dataset_configurations = configuration_dict["dataset_configurations"]  # Only provide dataset configurations
 
     for dataset in dataset_configurations.values():
         for key in PROPS_TO_REMOVE:
@@ -1199,11 +1909,115 @@ def get_conversion_path_info(info: dict) -> dict:
     return dict(file=resolved_output_path, directory=resolved_output_directory, default=default_output_directory)
 
 
+def set_metadata_layers(metadata_layers: Optional[dict]) -> None:
+    """Initialize a conversion worker with the metadata layers shared by all files (see `get_metadata_layers`)."""
+    worker_metadata_layers.clear()
+    worker_metadata_layers.update(metadata_layers or dict())
+    coerced_metadata_layer_cache.clear()
+
+
+def get_metadata_layers(info: dict) -> List[tuple]:
+    """
+    Get the layers that make up the metadata of a file, from the most general to the most specific.
+
+    The metadata of a file may be split into a project template and subject-level overrides, which are shared by all
+    files of a conversion, and its own session-level overrides (`metadata`). The shared layers are provided as
+    `{"project": {...}, "subjects": {<subject>: {...}}}`, either in `metadata_layers` or (within conversion workers) by
+    `set_metadata_layers`, and the subject layer of a file is selected by its `subject`.
+
+    Returns:
+        list: Pairs of a key identifying each layer that is reused across files (None for the others, such as the
+            session layer or any layers provided with the request) and the layer itself.
+    """
+    is_shared = "metadata_layers" not in info
+    metadata_layers = info["metadata_layers"] if not is_shared else worker_metadata_layers
+
+    layers = list()
+    if metadata_layers.get("project"):
+        layers.append(("project" if is_shared else None, metadata_layers["project"]))
+
+    subject = info.get("subject")
+    if subject is not None:
+        subject_layers = metadata_layers.get("subjects", dict())
+        if subject not in subject_layers:
+            raise ValueError(f"No metadata layer was provided for the subject '{subject}'.")
+        layers.append((f"subjects/{subject}" if is_shared else None, subject_layers[subject]))
+
+    layers.append((None, info.get("metadata", dict())))
+
+    return layers
+
+
+def copy_json_containers(json_object: Any) -> Any:
+    """Copy all dictionaries and lists of a JSON object, sharing all other values."""
+    if isinstance(json_object, dict):
+        return {key: copy_json_containers(value) for key, value in json_object.items()}
+    if isinstance(json_object, list):
+        return [copy_json_containers(item) for item in json_object]
+    return json_object
+
+
+def merge_metadata_layers(base: Any, override: Any) -> Any:
+    """
+    Merge a metadata layer over a copy of another: dictionaries are merged recursively, other values are replaced.
+
+    The returned metadata shares no containers with the base, but does share them with the override.
+    """
+    if not isinstance(base, dict) or not isinstance(override, dict):
+        return override
+
+    merged = {
+        key: merge_metadata_layers(value, override[key]) if key in override else copy_json_containers(value)
+        for key, value in base.items()
+    }
+    for key, value in override.items():
+        if key not in base:
+            merged[key] = value
+
+    return merged
+
+
+def resolve_metadata_layers(layers: List[tuple], metadata_schema: dict) -> dict:
+    """
+    Coerce each metadata layer to comply with the schema and merge them, from the most general to the most specific.
+
+    Coercion only depends on the location of each value, so coercing the layers separately matches coercing their merged
+    result. The coerced (and merged) layers with a key are therefore reused across all files of a worker.
+
+    Returns:
+        dict: The resolved metadata, which shares no containers with the layers and can be modified freely.
+    """
+    plan = get_coercion_plan(metadata_schema)
+
+    # The leading layers with a key are reused; start from the most specific of them that is already resolved
+    shared_keys = list()
+    for key, _ in layers:
+        if key is None:
+            break
+        shared_keys.append(key)
+
+    resolved = None
+    start = 0
+    for count in range(len(shared_keys), 0, -1):
+        cached = coerced_metadata_layer_cache.get((tuple(shared_keys[:count]), id(plan)))
+        if cached is not None and cached[0] is plan:
+            resolved, start = cached[1], count
+            break
+
+    for index in range(start, len(layers)):
+        coerced = plan.apply(get_metadata_with_table_rows(layers[index][1]), nan_strings=True)
+        resolved = coerced if resolved is None else merge_metadata_layers(resolved, coerced)
+
+        if index < len(shared_keys):
+            coerced_metadata_layer_cache.set((tuple(shared_keys[: index + 1]), id(plan)), (plan, resolved))
+
+    # The session layer is never reused, so the result never shares containers with a cached layer
+    return resolved
+
+
 def get_conversion_info(info: dict) -> dict:
     """Function used to organize the required information for conversion."""
 
-    from neuroconv import NWBConverter
-
     path_info = get_conversion_path_info(info)
     resolved_output_path = path_info["file"]
     resolved_output_directory = path_info["directory"]
@@ -1216,18 +2030,25 @@ def get_conversion_info(info: dict) -> dict:
     resolved_output_path.parent.mkdir(exist_ok=True, parents=True)  # Ensure all parent directories exist
 
     resolved_source_data = replace_none_with_nan(
-        info["source_data"], resolve_references(get_custom_converter(info["interfaces"]).get_source_schema())
+        info["source_data"], get_source_schema(info["interfaces"], resolved=True)
     )
 
-    converter = instantiate_custom_converter(
+    metadata_layers = get_metadata_layers(info)
+
+    # The electrode tables are written back to the recording interfaces, so their contents are part of the cache key
+    original_ecephys_metadata = [layer.get("Ecephys", dict()) for _, layer in metadata_layers]
+    converter = get_converter(
         source_data=resolved_source_data,
         interface_class_dict=info["interfaces"],
         alignment_info=info.get("alignment", dict()),
+        state=dict(
+            electrodes=[layer.get("Electrodes") for layer in original_ecephys_metadata],
+            electrode_columns=[layer.get("ElectrodeColumns") for layer in original_ecephys_metadata],
+        ),
     )
 
-    # Ensure Ophys NaN values are resolved
-    resolved_metadata = replace_none_with_nan(info["metadata"], resolve_references(converter.get_metadata_schema()))
-    replace_nan_strings(resolved_metadata)
+    # Ensure Ophys NaN values are resolved (columnar tables, see `get_columnar_table`, are accepted as well)
+    resolved_metadata = resolve_metadata_layers(metadata_layers, converter.get_metadata_schema())
 
     ecephys_metadata = resolved_metadata.get("Ecephys")
 
@@ -1261,32 +2082,19 @@ def get_conversion_info(info: dict) -> dict:
 
             shared_electrode_columns = ecephys_metadata["ElectrodeColumns"]
 
-            for interface_name, interface_electrode_results in ecephys_metadata["Electrodes"].items():
-                name_split = interface_name.split(" — ")
-
-                if len(name_split) == 1:
-                    sub_interface = name_split[0]
-                elif len(name_split) == 2:
-                    sub_interface, sub_sub_interface = name_split
-
-                interface_or_subconverter = converter.data_interface_objects[sub_interface]
-
-                if isinstance(interface_or_subconverter, NWBConverter):
-                    subconverter = interface_or_subconverter
-
-                    update_recording_properties_from_table_as_json(
-                        recording_interface=subconverter.data_interface_objects[sub_sub_interface],
-                        electrode_table_json=interface_electrode_results,
-                        electrode_column_info=shared_electrode_columns,
-                    )
-                else:
-                    interface = interface_or_subconverter
+            # Cached converters already hold the properties from the same electrode tables
+            with converter.lock:
+                if not converter.electrode_properties_updated:
+                    for interface_name, interface_electrode_results in ecephys_metadata["Electrodes"].items():
+                        written = update_recording_properties_from_table_as_json(
+                            recording_interface=get_interface_by_name(converter, interface_name),
+                            electrode_table_json=interface_electrode_results,
+                            electrode_column_info=shared_electrode_columns,
+                        )
+                        if written:
+                            converter.table_columns.pop(("electrodes", interface_name), None)
 
-                    update_recording_properties_from_table_as_json(
-                        recording_interface=interface,
-                        electrode_table_json=interface_electrode_results,
-                        electrode_column_info=shared_electrode_columns,
-                    )
+                    converter.electrode_properties_updated = True
 
             ecephys_metadata["Electrodes"] = [
                 {"name": entry["name"], "description": entry["description"]} for entry in shared_electrode_columns
@@ -1352,7 +2160,14 @@ def convert_all_to_nwb(
     request_id: Optional[str],
     max_workers: int = 1,
     log_url: Optional[str] = None,
+    metadata_layers: Optional[dict] = None,
 ) -> List[str]:
+    """
+    Convert multiple files in parallel worker processes.
+
+    The metadata shared by the files may be provided once as `metadata_layers` (see `get_metadata_layers`), in which
+    case the `metadata` of each file only holds its own overrides. The shared layers are sent to each worker only once.
+    """
 
     from concurrent.futures import ProcessPoolExecutor, as_completed
 
@@ -1369,11 +2184,18 @@ def convert_all_to_nwb(
 
     futures = []
     file_paths = []
+    source_data_per_file = []
 
-    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=set_metadata_layers, initargs=(metadata_layers,)
+    ) as executor:
 
         for file_info in files:
 
+            # Resolved here, since the sessions are only stored in this process
+            file_info = session_store.resolve(file_info)
+            source_data_per_file.append(file_info["source_data"])
+
             futures.append(
                 executor.submit(
                     convert_to_nwb,
@@ -1398,7 +2220,11 @@ def convert_all_to_nwb(
             output_filepath = future.result()
             file_paths.append(output_filepath)
 
-        return file_paths
+    # Release the source files held by the converters of the previous pages
+    for source_data in source_data_per_file:
+        invalidate_converter_cache(source_data=source_data)
+
+    return file_paths
 
 
 def upload_multiple_filesystem_objects_to_dandi(**kwargs) -> list[Path]:
@@ -1658,7 +2484,7 @@ def inspect_all(url, payload) -> dict:
         header=header, messages=messages, text="\n".join(nwbinspector.format_messages(messages=messages))
     )
 
-    return json.loads(json.dumps(obj=json_report, cls=nwbinspector.InspectorOutputJSONEncoder))
+    return json_report
 
 
 def _aggregate_symlinks_in_new_directory(paths, reason="", folder_path=None) -> Path:
@@ -1834,17 +2660,132 @@ def map_dtype(dtype: str) -> str:
         return dtype
 
 
-def get_property_dtype(extractor, property_name: str, ids: list, extra_props: dict) -> str:
+def get_property_dtype(property_name: str, values: Any, extra_props: dict) -> str:
+    """Get the data type of a property from the full column of its values, unless overridden."""
     if property_name in extra_props:
         dtype = extra_props[property_name]["data_type"]
     else:
-        dtype = str(extractor.get_property(key=property_name, ids=ids).dtype)
+        dtype = str(values.dtype)
 
-    # return type(recording.get_property(key=property_name)[0]).__name__.replace("_", "")
-    # return dtype
     return map_dtype(dtype)
 
 
+def get_property_column(property_name: str, values: Any, number_of_rows: int, extra_props: dict) -> list:
+    """Get all values of a property as Python objects, using the default value of overridden properties."""
+    if "default" in extra_props.get(property_name, dict()):
+        return [extra_props[property_name]["default"]] * number_of_rows
+
+    # First axis is always channels (or units) in SpikeInterface
+    return values.tolist()
+
+
+def assemble_table_rows(columns: Dict[str, list]) -> List[Dict[str, Any]]:
+    """Assemble the rows of a table from its columns."""
+    names = list(columns)
+    return [dict(zip(names, row)) for row in zip(*columns.values())]
+
+
+def get_columnar_table(columns: Dict[str, list], column_info: List[Dict[str, Any]]) -> Dict[str, list]:
+    """
+    Encode a table with the name and data type of each column listed once, followed by the values of each column.
+
+    For example, `{"columns": ["channel_name", "gain_to_uV"], "data_types": ["str", "float64"], "values": [["AP0",
+    "AP1"], [2.3, 2.3]]}` holds the same information as `[{"channel_name": "AP0", "gain_to_uV": 2.3}, ...]`.
+    """
+    data_types = {column["name"]: column["data_type"] for column in column_info}
+
+    return dict(
+        columns=list(columns),
+        data_types=[data_types.get(name, "str") for name in columns],
+        values=[list(column_values) for column_values in columns.values()],
+    )
+
+
+def get_columnar_table_schema(column_info: List[Dict[str, Any]], number_of_rows: int) -> dict:
+    return {
+        "type": "object",
+        "properties": {
+            "columns": {"type": "array", "items": {"type": "string"}},
+            "data_types": {"type": "array", "items": DTYPE_SCHEMA},
+            "values": {
+                "type": "array",
+                "items": {"type": "array", "minItems": number_of_rows, "maxItems": number_of_rows},
+            },
+        },
+        "required": ["columns", "data_types", "values"],
+    }
+
+
+def get_table_summary(column_info: List[Dict[str, Any]], number_of_rows: int) -> Dict[str, Any]:
+    """Describe a table by the name and data type of each column and its number of rows, without any values."""
+    return dict(
+        columns=[column["name"] for column in column_info],
+        data_types=[column["data_type"] for column in column_info],
+        row_count=number_of_rows,
+    )
+
+
+TABLE_SUMMARY_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "columns": {"type": "array", "items": {"type": "string"}},
+        "data_types": {"type": "array", "items": DTYPE_SCHEMA},
+        "row_count": {"type": "integer", "minimum": 0},
+    },
+    "required": ["columns", "data_types", "row_count"],
+}
+
+
+def is_table_summary(table: Any) -> bool:
+    return isinstance(table, dict) and "row_count" in table and "values" not in table
+
+
+def is_columnar_table(table: Any) -> bool:
+    return isinstance(table, dict) and "columns" in table and "values" in table
+
+
+def get_table_rows(table: Union[List[Dict[str, Any]], Dict[str, list]]) -> List[Dict[str, Any]]:
+    """Get the rows of a table that is either a list of rows or a columnar table."""
+    if not is_columnar_table(table):
+        return table
+
+    names, values = table["columns"], table["values"]
+    if len(names) != len(values):
+        raise ValueError(f"The columnar table lists {len(names)} columns but provides values for {len(values)}.")
+    if len({len(column_values) for column_values in values}) > 1:
+        raise ValueError("All columns of a columnar table must have the same number of values.")
+
+    return assemble_table_rows(dict(zip(names, values)))
+
+
+def get_metadata_with_table_rows(metadata: dict) -> dict:
+    """
+    Convert any columnar electrode or unit tables in the metadata to lists of rows.
+
+    Table summaries are removed, since their values were never edited (the interfaces keep their current properties).
+    The input is not modified; the metadata is returned as-is if all tables are already lists of rows.
+    """
+    ecephys_metadata = metadata.get("Ecephys")
+    if not isinstance(ecephys_metadata, dict):
+        return metadata
+
+    converted_ecephys_metadata = dict()
+    for key in ("Electrodes", "Units"):
+        tables = ecephys_metadata.get(key)
+        if not isinstance(tables, dict):
+            continue
+
+        if any(is_columnar_table(table) or is_table_summary(table) for table in tables.values()):
+            converted_ecephys_metadata[key] = {
+                name: get_table_rows(table) for name, table in tables.items() if not is_table_summary(table)
+            }
+
+    if not converted_ecephys_metadata:
+        return metadata
+
+    return {**metadata, "Ecephys": {**ecephys_metadata, **converted_ecephys_metadata}}
+
+
 # Ecephys Helper Functions
 def get_recording_interface_properties(recording_interface) -> Dict[str, Any]:
     """A convenience function for uniformly excluding certain properties of the provided recording extractor."""
@@ -1895,9 +2836,6 @@ def get_unit_columns_json(interface) -> List[Dict[str, Any]]:
         if data_type:
             property_data_types[property_name] = data_type
 
-    sorting_extractor = interface.sorting_extractor
-    unit_ids = sorting_extractor.get_unit_ids()
-
     unit_columns = [
         dict(
             name=property_name,
@@ -1905,61 +2843,42 @@ def get_unit_columns_json(interface) -> List[Dict[str, Any]]:
             data_type=property_data_types.get(
                 property_name,
                 get_property_dtype(
-                    extractor=sorting_extractor,
-                    property_name=property_name,
-                    ids=[unit_ids[0]],
-                    extra_props=SORTING_INTERFACE_PROPERTY_OVERRIDES,
+                    property_name=property_name, values=values, extra_props=SORTING_INTERFACE_PROPERTY_OVERRIDES
                 ),
             ),
         )
-        for property_name in properties.keys()
+        for property_name, values in properties.items()
     ]
 
-    return json.loads(json.dumps(obj=unit_columns))
-
-
-def get_unit_table_json(interface) -> List[Dict[str, Any]]:
-    """
-    A convenience function for collecting and organizing the property values of the underlying sorting extractor.
-    """
-
-    from neuroconv.utils import NWBMetaDataEncoder
+    return unit_columns
 
-    sorting = interface.sorting_extractor
 
+def get_unit_table_columns(interface) -> Dict[str, list]:
+    """Collect the values of each property of the underlying sorting extractor, as shown in the unit table."""
     properties = get_sorting_interface_properties(interface)
 
-    unit_ids = sorting.get_unit_ids()
-
-    table = list()
-    for unit_id in unit_ids:
+    unit_ids = interface.sorting_extractor.get_unit_ids()
 
-        unit_column = dict()
-
-        for property_name in properties:
-
-            if property_name == "unit_id":
-                sorting_property_value = str(unit_id)  # Insert unit_id to view
+    columns = dict()
+    for property_name, values in properties.items():
+        if property_name == "unit_id":
+            columns[property_name] = [str(unit_id) for unit_id in unit_ids]  # Insert unit_id to view
+        else:
+            columns[property_name] = get_property_column(
+                property_name=property_name,
+                values=values,
+                number_of_rows=len(unit_ids),
+                extra_props=SORTING_INTERFACE_PROPERTY_OVERRIDES,
+            )
 
-            # elif property_name == "unit_name":
-            #     sorting_property_value = str(unit_id) # By default, unit_name is unit_id (str)
+    return columns
 
-            elif property_name in SORTING_INTERFACE_PROPERTY_OVERRIDES:
-                try:
-                    sorting_property_value = SORTING_INTERFACE_PROPERTY_OVERRIDES[property_name][
-                        "default"
-                    ]  # Get default value
-                except:
-                    sorting_property_value = sorting.get_property(key=property_name, ids=[unit_id])[0]
-            else:
-                sorting_property_value = sorting.get_property(key=property_name, ids=[unit_id])[
-                    0  # First axis is always units in SI
-                ]  # Since only fetching one unit at a time, use trivial zero-index
-            unit_column.update({property_name: sorting_property_value})
-        table.append(unit_column)
-    table_as_json = json.loads(json.dumps(table, cls=NWBMetaDataEncoder))
 
-    return table_as_json
+def get_unit_table_json(interface) -> List[Dict[str, Any]]:
+    """
+    A convenience function for collecting and organizing the property values of the underlying sorting extractor.
+    """
+    return assemble_table_rows(get_unit_table_columns(interface))
 
 
 def get_electrode_columns_json(interface) -> List[Dict[str, Any]]:
@@ -1985,21 +2904,15 @@ def get_electrode_columns_json(interface) -> List[Dict[str, Any]]:
     # default_column_metadata =  interface.get_metadata()["Ecephys"]["ElectrodeColumns"]["properties"] # NOTE: This doesn't exist...
     # property_descriptions = {column_name: column_fields["description"] for column_name, column_fields in default_column_metadata}
 
-    recording_extractor = interface.recording_extractor
-    channel_ids = recording_extractor.get_channel_ids()
-
     electrode_columns = [
         dict(
             name=property_name,
             description=property_descriptions.get(property_name, "No description."),
             data_type=get_property_dtype(
-                extractor=recording_extractor,
-                property_name=property_name,
-                ids=[channel_ids[0]],
-                extra_props=RECORDING_INTERFACE_PROPERTY_OVERRIDES,
+                property_name=property_name, values=values, extra_props=RECORDING_INTERFACE_PROPERTY_OVERRIDES
             ),
         )
-        for property_name in properties.keys()
+        for property_name, values in properties.items()
     ]
 
     # TODO: uncomment when neuroconv supports contact vectors (probe interface)
@@ -2016,127 +2929,269 @@ def get_electrode_columns_json(interface) -> List[Dict[str, Any]]:
     #         )
     #     )
 
-    return json.loads(json.dumps(obj=electrode_columns))
+    return electrode_columns
+
+
+def get_electrode_table_columns(interface) -> Dict[str, list]:
+    """Collect the values of each property of the underlying recording extractor, as shown in the electrode table."""
+    properties = get_recording_interface_properties(interface)
+
+    number_of_channels = interface.recording_extractor.get_num_channels()
+
+    return {
+        property_name: get_property_column(
+            property_name=property_name,
+            values=values,
+            number_of_rows=number_of_channels,
+            extra_props=RECORDING_INTERFACE_PROPERTY_OVERRIDES,
+        )
+        for property_name, values in properties.items()
+    }
 
 
 def get_electrode_table_json(interface) -> List[Dict[str, Any]]:
     """
     A convenience function for collecting and organizing the property values of the underlying recording extractor.
     """
+    return assemble_table_rows(get_electrode_table_columns(interface))
 
-    from neuroconv.utils import NWBMetaDataEncoder
 
-    recording = interface.recording_extractor
+def get_interface_by_name(converter, interface_name: str) -> "BaseDataInterface":
+    """Find an interface by its name in the metadata, which is `<subconverter> — <interface>` within subconverters."""
+    from neuroconv import NWBConverter
 
-    properties = get_recording_interface_properties(interface)
+    interface = converter
+    for name in interface_name.split(" — "):
+        if not isinstance(interface, NWBConverter) or name not in interface.data_interface_objects:
+            raise ValueError(f"The interface '{interface_name}' is not part of the converter.")
+        interface = interface.data_interface_objects[name]
 
-    electrode_ids = recording.get_channel_ids()
-
-    table = list()
-    for electrode_id in electrode_ids:
-        electrode_column = dict()
-        for property_name in properties:
-            if property_name in RECORDING_INTERFACE_PROPERTY_OVERRIDES:
-                try:
-                    recording_property_value = RECORDING_INTERFACE_PROPERTY_OVERRIDES[property_name][
-                        "default"
-                    ]  # Get default value
-                except:
-                    recording_property_value = recording.get_property(key=property_name, ids=[electrode_id])[0]
-            else:
-                recording_property_value = recording.get_property(key=property_name, ids=[electrode_id])[
-                    0  # First axis is always electodes in SI
-                ]  # Since only fetching one electrode at a time, use trivial zero-index
-            electrode_column.update({property_name: recording_property_value})
-        table.append(electrode_column)
-    table_as_json = json.loads(json.dumps(table, cls=NWBMetaDataEncoder))
+    return interface
+
+
+def get_table_columns(converter, table_type: str, interface_name: str, interface=None) -> Dict[str, list]:
+    """
+    Get the columns of the electrode or unit table of an interface, which are only collected once per converter.
+
+    The returned columns are shared between requests and must not be modified.
+    """
+    if table_type not in TABLE_TYPES:
+        raise ValueError(f"Unknown table type '{table_type}'. Valid types are {', '.join(TABLE_TYPES)}.")
+
+    key = (table_type, interface_name)
+    columns = converter.table_columns.get(key)
+    if columns is None:
+        if interface is None:
+            interface = get_interface_by_name(converter, interface_name)
+
+        if table_type == "electrodes":
+            columns = get_electrode_table_columns(interface)
+        else:
+            columns = get_unit_table_columns(interface)
+
+        converter.table_columns[key] = columns
+
+    return columns
+
+
+def is_missing_value(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def get_sorted_row_indices(values: list, row_indices: List[int], descending: bool = False) -> List[int]:
+    """Sort the row indices by the values of a column, always placing missing values last."""
+    present = [index for index in row_indices if not is_missing_value(values[index])]
+    missing = [index for index in row_indices if is_missing_value(values[index])]
+
+    try:
+        present.sort(key=values.__getitem__, reverse=descending)
+    except TypeError:  # Values of mixed types are compared by their text
+        present.sort(key=lambda index: str(values[index]), reverse=descending)
+
+    return present + missing
+
+
+def get_table_window(info: dict) -> Dict[str, Any]:
+    """
+    Get a window of rows from the electrode or unit table of an interface, after sorting and filtering the whole table.
+
+    Args:
+        info (dict): The `source_data` and `interfaces` of the converter (as for the metadata), along with:
+            table (str): Either "electrodes" or "units".
+            interface (str): The name of the interface, as in the metadata.
+            offset (int): The position of the first row of the window among the sorted and filtered rows.
+            limit (int): The maximum number of rows in the window.
+            sort_by (str, optional): The column to sort the rows by; the original order is kept otherwise.
+            descending (bool): Sort in descending order.
+            filters (dict, optional): Only keep rows whose value in each of the columns contains the text (ignoring
+                case) mapped to it.
+
+    Returns:
+        dict: The window of rows, along with the number of rows in the table before and after filtering, and the
+            positions of the rows of the window in the original table.
+    """
+    offset = int(info.get("offset", 0))
+    limit = int(info.get("limit", 100))
+    if offset < 0 or limit < 0:
+        raise ValueError("The offset and limit of a table window cannot be negative.")
+
+    interfaces = info["interfaces"]
+    resolved_source_data = replace_none_with_nan(info["source_data"], get_source_schema(interfaces, resolved=True))
+
+    # Shares the converter (and its table columns) with the metadata request
+    converter = get_converter(resolved_source_data, interfaces)
+    columns = get_table_columns(converter, table_type=info.get("table", "electrodes"), interface_name=info["interface"])
+
+    row_count = len(next(iter(columns.values()), []))
+    row_indices = list(range(row_count))
+
+    for column_name, text in (info.get("filters") or dict()).items():
+        if column_name not in columns:
+            raise ValueError(f"Cannot filter the table by the unknown column '{column_name}'.")
+
+        text = str(text).lower()
+        values = columns[column_name]
+        row_indices = [index for index in row_indices if text in str(values[index]).lower()]
+
+    sort_by = info.get("sort_by")
+    if sort_by is not None:
+        if sort_by not in columns:
+            raise ValueError(f"Cannot sort the table by the unknown column '{sort_by}'.")
+
+        row_indices = get_sorted_row_indices(columns[sort_by], row_indices, descending=info.get("descending", False))
+
+    window_indices = row_indices[offset : offset + limit]
+    window_columns = {name: [values[index] for index in window_indices] for name, values in columns.items()}
+
+    return dict(
+        columns=list(columns),
+        row_count=row_count,
+        filtered_row_count=len(row_indices),
+        offset=offset,
+        indices=window_indices,
+        rows=assemble_table_rows(window_columns),
+    )
+
+
+def get_table_property_columns(
+    table_json: List[Dict[str, Any]], ids: list, column_data_types: Dict[str, str]
+) -> Dict[str, tuple]:
+    """
+    Reorganize the rows of a table into the ids and values of the cells present in each column.
+
+    The rows are matched to the provided ids in order. Properties without column information are skipped.
+    """
+    columns = dict()
+    for row_id, row in zip(ids, table_json):
+        for property_name, value in row.items():
+            if property_name not in column_data_types:  # Skip data with missing column information
+                continue
+
+            column_ids, column_values = columns.setdefault(property_name, (list(), list()))
+            column_ids.append(row_id)
+            column_values.append(value)
+
+    return columns
+
+
+def are_property_values_equal(first: "np.ndarray", second: "np.ndarray") -> bool:
+    import numpy as np
+
+    if first.shape != second.shape or first.dtype.kind != second.dtype.kind:
+        return False
+
+    try:
+        return np.array_equal(first, second, equal_nan=True)
+    except TypeError:  # NaN is not defined for the dtype (e.g. strings)
+        return np.array_equal(first, second)
 
-    return table_as_json
+
+def set_property_column(extractor, property_name: str, values: "np.ndarray", ids: list, all_ids: "np.ndarray") -> bool:
+    """
+    Write the values of a property for the specified ids with a single call, unless they are unchanged.
+
+    Returns whether the property was written.
+    """
+    import numpy as np
+
+    is_full_column = len(ids) == len(all_ids) and np.array_equal(np.asarray(ids), all_ids)
+
+    if property_name in extractor.get_property_keys():
+        current_values = extractor.get_property(key=property_name)
+        if not is_full_column:
+            current_values = current_values[extractor.ids_to_indices(ids)]
+
+        if are_property_values_equal(current_values, values):
+            return False
+
+    extractor.set_property(key=property_name, values=values, ids=None if is_full_column else ids)
+
+    return True
 
 
 def update_recording_properties_from_table_as_json(
     recording_interface, electrode_column_info: dict, electrode_table_json: List[Dict[str, Any]]
-):
-    import numpy as np
+) -> List[str]:
+    """
+    Write the edited electrode table back to the recording extractor, with one call per modified column.
 
-    # # Extract contact vector properties
-    properties = get_recording_interface_properties(recording_interface)
+    Returns the names of the properties that were written.
+    """
+    import numpy as np
 
-    # TODO: uncomment and adapt when neuroconv supports contact vectors (probe interface)
-    # contact_vector = properties.pop("contact_vector", None)
-    # contact_vector_dtypes = {}
-    # if contact_vector is not None:
-    #     # Remove names from contact vector from the electrode_column_info and add to reconstructed_contact_vector_info
-    #     contact_vector_dtypes = contact_vector.dtype
-    #     # contact_vector_dtypes = { property_name: next((item for item in electrode_column_info if item['name'] == property_name), None)["data_type"] for property_name in contact_vector.dtype.names}
-    #     # Remove contact vector properties from electrode_column_info
-    #     for property_name in contact_vector.dtype.names:
-    #         found = next((item for item in electrode_column_info if item["name"] == property_name), None)
-    #         if found:
-    #             electrode_column_info.remove(found)
+    # TODO: adapt when neuroconv supports contact vectors (probe interface)
 
     # Organize dtypes
     electrode_column_data_types = {column["name"]: column["data_type"] for column in electrode_column_info}
-    # electrode_column_data_types["contact_vector"] = contact_vector_dtypes  # Provide contact vector information
 
     recording_extractor = recording_interface.recording_extractor
     channel_ids = recording_extractor.get_channel_ids()
 
-    # TODO: uncomment when neuroconv supports contact vectors (probe interface)
-    # property_names = recording_extractor.get_property_keys()
-    # if "contact_vector" in property_names:
-    #     modified_contact_vector = np.array(recording_extractor.get_property(key="contact_vector"))  # copy
-    #     contact_vector_property_names = list(modified_contact_vector.dtype.names)
-
-    for entry_index, entry in enumerate(electrode_table_json):
-        electrode_properties = dict(entry)  # copy
-        # channel_name = electrode_properties.pop("channel_name", None)
-        for property_name, property_value in electrode_properties.items():
-            if property_name not in electrode_column_data_types:  # Skip data with missing column information
-                continue
-            # TODO: uncomment when neuroconv supports contact vectors (probe interface)
-            # elif property_name in contact_vector_property_names:
-            #     property_index = contact_vector_property_names.index(property_name)
-            #     modified_contact_vector[entry_index][property_index] = property_value
-            else:
-                recording_extractor.set_property(
-                    key=property_name,
-                    values=np.array([property_value], dtype=electrode_column_data_types[property_name]),
-                    ids=[channel_ids[entry_index]],  # Assume rows match indices of channel list
-                )
+    # Assume rows match indices of channel list
+    columns = get_table_property_columns(
+        table_json=electrode_table_json, ids=channel_ids, column_data_types=electrode_column_data_types
+    )
 
-    # TODO: uncomment when neuroconv supports contact vectors (probe interface)
-    # if "contact_vector" in property_names:
-    #     recording_extractor.set_property(key="contact_vector", values=modified_contact_vector)
+    written = list()
+    for property_name, (ids, values) in columns.items():
+        typed_values = np.array(values, dtype=electrode_column_data_types[property_name])
+        if set_property_column(recording_extractor, property_name, values=typed_values, ids=ids, all_ids=channel_ids):
+            written.append(property_name)
+
+    return written
 
 
 def update_sorting_properties_from_table_as_json(
     sorting_interface, unit_column_info: dict, unit_table_json: List[Dict[str, Any]]
-):
+) -> List[str]:
+    """
+    Write the edited unit table back to the sorting extractor, with one call per modified column.
+
+    Returns the names of the properties that were written.
+    """
     import numpy as np
 
     unit_column_data_types = {column["name"]: column["data_type"] for column in unit_column_info}
+    unit_column_data_types.pop("unit_id", None)  # NOTE: Is called unit_name in the actual units table
 
     sorting_extractor = sorting_interface.sorting_extractor
+    all_unit_ids = sorting_extractor.get_unit_ids()
+    unit_ids = [int(entry["unit_id"]) for entry in unit_table_json]
 
-    for entry_index, entry in enumerate(unit_table_json):
-        unit_properties = dict(entry)  # copy
-
-        unit_id = unit_properties.pop("unit_id", None)  # NOTE: Is called unit_name in the actual units table
-
-        for property_name, property_value in unit_properties.items():
+    columns = get_table_property_columns(
+        table_json=unit_table_json, ids=unit_ids, column_data_types=unit_column_data_types
+    )
 
-            if property_name == "unit_id":
-                continue  # Already controlling unit_id with the above variable
+    written = list()
+    for property_name, (ids, values) in columns.items():
+        if property_name in SORTING_INTERFACE_PROPERTIES_TO_RECAST:
+            # Should allow the array to go through
+            typed_values = np.empty(len(values), dtype="object")
+            typed_values[:] = values
+        else:
+            typed_values = np.array(values, dtype=unit_column_data_types[property_name])
 
-            dtype = unit_column_data_types[property_name]
-            if property_name in SORTING_INTERFACE_PROPERTIES_TO_RECAST:
-                property_value = [property_value]
-                dtype = "object"  # Should allow the array to go through
+        if set_property_column(sorting_extractor, property_name, values=typed_values, ids=ids, all_ids=all_unit_ids):
+            written.append(property_name)
 
-            sorting_extractor.set_property(
-                key=property_name,
-                values=np.array([property_value], dtype=dtype),
-                ids=[int(unit_id)],
-                # ids=[unit_id]
-            )
+    return written
@@ -0,0 +1,295 @@
+"""Utilities for working with the JSON schemas provided by NeuroConv."""
+
+import math
+import re
+from typing import Any, Dict, List, Optional
+from urllib.parse import unquote
+
+from .caching import LRUCache, get_fingerprint
+
+DEFINITION_KEYWORDS = ("definitions", "$defs")
+
+coercion_plan_cache = LRUCache(max_size=64)
+
+# The only keywords that are traversed when resolving references (others, like `allOf`, are left untouched)
+SUBSCHEMA_MAPPING_KEYWORDS = ("properties", "patternProperties")
+
+
+def escape_json_pointer_token(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def unescape_json_pointer_token(token: str) -> str:
+    return token.replace("~1", "/").replace("~0", "~")
+
+
+class ReferenceResolver:
+    """
+    Resolve the `$ref` entries of a JSON schema against its root schema.
+
+    All `definitions` and `$defs` of the root schema are indexed once on construction, and each reference is resolved
+    only once; later occurrences share the same resolved subschema instead of copying it. References that would
+    recurse into themselves are left in place (as the original `$ref` node) to guarantee termination.
+
+    The input schemas are never modified; new dictionaries are only created along the paths that contain references.
+    """
+
+    def __init__(self, root_schema: dict):
+        self.root_schema = root_schema
+
+        self._definitions: Dict[str, Any] = dict()
+        self._index_definitions(root_schema, pointer="#")
+
+        self._resolved_references: Dict[str, Any] = dict()
+        self._resolving_references = set()
+        self._resolved_nodes: Dict[int, tuple] = dict()
+        self._fallback_resolver = None
+
+    def _index_definitions(self, schema: Any, pointer: str) -> None:
+        if isinstance(schema, dict):
+            for key, value in schema.items():
+                child_pointer = f"{pointer}/{escape_json_pointer_token(key)}"
+                if key in DEFINITION_KEYWORDS and isinstance(value, dict):
+                    for name, definition in value.items():
+                        self._definitions[f"{child_pointer}/{escape_json_pointer_token(name)}"] = definition
+                self._index_definitions(value, pointer=child_pointer)
+        elif isinstance(schema, list):
+            for index, value in enumerate(schema):
+                self._index_definitions(value, pointer=f"{pointer}/{index}")
+
+    def lookup(self, reference: str) -> Any:
+        """Find the (unresolved) target of a reference."""
+        if reference in self._definitions:
+            return self._definitions[reference]
+
+        if reference.startswith("#"):
+            target = self.root_schema
+            for token in unquote(reference[1:]).split("/")[1:]:
+                token = unescape_json_pointer_token(token)
+                target = target[int(token)] if isinstance(target, list) else target[token]
+            return target
+
+        # Non-local references (e.g. to other documents) are handed to jsonschema
+        if self._fallback_resolver is None:
+            from jsonschema import RefResolver
+
+            self._fallback_resolver = RefResolver.from_schema(self.root_schema)
+
+        return self._fallback_resolver.resolve(reference)[1]
+
+    def _resolve_reference(self, node: dict) -> Any:
+        reference = node["$ref"]
+
+        if reference in self._resolved_references:
+            return self._resolved_references[reference]
+
+        # Cycle detected: stop here and keep the reference as-is
+        if reference in self._resolving_references:
+            return node
+
+        self._resolving_references.add(reference)
+        try:
+            resolved = self.resolve(self.lookup(reference))
+        finally:
+            self._resolving_references.discard(reference)
+
+        self._resolved_references[reference] = resolved
+        return resolved
+
+    def resolve(self, schema: Any) -> Any:
+        """Resolve all references within `properties`, `patternProperties`, and `items` of the given schema."""
+        if not isinstance(schema, dict):
+            return schema
+
+        if "$ref" in schema:
+            return self._resolve_reference(schema)
+
+        # Subtrees shared between multiple locations are only resolved once
+        node_id = id(schema)
+        if node_id in self._resolved_nodes:
+            return self._resolved_nodes[node_id][1]
+
+        resolved = schema
+        for keyword in SUBSCHEMA_MAPPING_KEYWORDS:
+            subschemas = schema.get(keyword)
+            if not isinstance(subschemas, dict):
+                continue
+
+            resolved_subschemas = {key: self.resolve(subschema) for key, subschema in subschemas.items()}
+            if any(resolved_subschemas[key] is not subschema for key, subschema in subschemas.items()):
+                if resolved is schema:
+                    resolved = dict(schema)
+                resolved[keyword] = resolved_subschemas
+
+        if "items" in schema:
+            resolved_items = self.resolve(schema["items"])
+            if resolved_items is not schema["items"]:
+                if resolved is schema:
+                    resolved = dict(schema)
+                resolved["items"] = resolved_items
+
+        # Keep a reference to the original node so that its id cannot be reused while this resolver is alive
+        self._resolved_nodes[node_id] = (schema, resolved)
+
+        return resolved
+
+
+def resolve_references(schema: dict, root_schema: Optional[dict] = None) -> dict:
+    """
+    Resolve references in a JSON schema based on the root schema.
+
+    Args:
+        schema (dict): The JSON schema to resolve.
+        root_schema (dict): The root JSON schema. Defaults to the schema itself.
+
+    Returns:
+        dict: The resolved JSON schema. Resolved subschemas may be shared between multiple locations.
+    """
+    return ReferenceResolver(root_schema=root_schema if root_schema is not None else schema).resolve(schema)
+
+
+class CoercionPlan:
+    """
+    The parts of a (resolved) JSON schema that determine how a JSON payload is coerced to comply with it.
+
+    Attributes:
+        numeric_properties (set): Names of the properties with a `number` type.
+        properties (dict): The plans of the remaining properties.
+        patterns (list): Pairs of compiled `patternProperties` expressions and their plans.
+        items (CoercionPlan): The plan for the items of an array.
+    """
+
+    __slots__ = ("numeric_properties", "properties", "patterns", "items")
+
+    def __init__(self):
+        self.numeric_properties = set()
+        self.properties: Dict[str, "CoercionPlan"] = dict()
+        self.patterns: List[tuple] = list()
+        self.items: Optional["CoercionPlan"] = None
+
+    def apply(self, json_object: Any, nan_strings: bool = False) -> Any:
+        """Return a coerced copy of the JSON object; see `coerce_json` for details."""
+        return coerce_json(json_object, plan=self, nan_strings=nan_strings)
+
+
+# Copies the payload without any schema-based coercion
+EMPTY_COERCION_PLAN = CoercionPlan()
+EMPTY_COERCION_PLAN.items = EMPTY_COERCION_PLAN
+
+
+def compile_coercion_plan(schema: dict) -> CoercionPlan:
+    """Compile a resolved JSON schema into a reusable coercion plan."""
+    compiled_plans = dict()
+
+    def compile_recursive(schema: Any) -> CoercionPlan:
+        if not isinstance(schema, dict) or not schema:
+            return EMPTY_COERCION_PLAN
+
+        # Resolved subschemas may be shared, and recursive references may point back to a parent
+        schema_id = id(schema)
+        if schema_id in compiled_plans:
+            return compiled_plans[schema_id]
+
+        plan = compiled_plans[schema_id] = CoercionPlan()
+
+        for pattern, pattern_schema in (schema.get("patternProperties") or dict()).items():
+            plan.patterns.append((re.compile(pattern), compile_recursive(pattern_schema)))
+
+        for key, property_schema in (schema.get("properties") or dict()).items():
+            if isinstance(property_schema, dict) and property_schema.get("type") == "number":
+                plan.numeric_properties.add(key)
+            else:
+                plan.properties[key] = compile_recursive(property_schema)
+
+        # NEUROCONV PATCH: arrays without an `items` schema are coerced like the schema itself if it has properties
+        if "items" in schema:
+            plan.items = compile_recursive(schema["items"])
+        elif "properties" in schema:
+            plan.items = plan
+        else:
+            plan.items = EMPTY_COERCION_PLAN
+
+        return plan
+
+    return compile_recursive(schema)
+
+
+def coerce_number(value: Any) -> Any:
+    """Coerce the value of a `number` property to a float, representing missing values as NaN."""
+    if isinstance(value, float):
+        return value
+
+    if value is None or value == "NaN":
+        return math.nan
+
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return value
+
+
+def coerce_json(
+    json_object: Any,
+    plan: CoercionPlan = EMPTY_COERCION_PLAN,
+    nan_strings: bool = False,
+) -> Any:
+    """
+    Copy a JSON object while coercing it according to a plan, in a single pass.
+
+    Args:
+        json_object: The JSON object to copy and coerce. It is not modified.
+        plan (CoercionPlan): The plan compiled from the JSON schema of the object.
+        nan_strings (bool): Replace all 'NaN' strings with float NaN. These are JavaScript NaN artifacts from JSON
+            serialization and never valid metadata; this also covers fields missing from incomplete schemas
+            (e.g. BrukerTiffSinglePlaneConverter doesn't provide an Ophys schema).
+
+    Returns:
+        The coerced copy of the JSON object.
+    """
+
+    def coerce_recursive(obj: Any, plan: CoercionPlan) -> Any:
+        if isinstance(obj, dict):
+            result = dict()
+            for key, value in obj.items():
+                matched = False
+
+                # Coerce on pattern properties as well
+                for regex, pattern_plan in plan.patterns:
+                    if regex.match(key):
+                        value = coerce_recursive(value, pattern_plan)
+                        matched = True
+
+                # Also check regular properties (schemas can have both patternProperties and properties)
+                if key in plan.numeric_properties:
+                    value = coerce_number(value)
+                    if not matched and isinstance(value, (dict, list)):
+                        value = coerce_recursive(value, EMPTY_COERCION_PLAN)
+                elif key in plan.properties:
+                    value = coerce_recursive(value, plan.properties[key])
+                elif not matched:
+                    value = coerce_recursive(value, EMPTY_COERCION_PLAN)
+
+                result[key] = value
+            return result
+
+        if isinstance(obj, list):
+            return [coerce_recursive(item, plan.items) for item in obj]
+
+        if nan_strings and obj == "NaN":
+            return math.nan
+
+        return obj
+
+    return coerce_recursive(json_object, plan)
+
+
+def get_coercion_plan(schema: dict) -> CoercionPlan:
+    """Get the coercion plan of a (possibly unresolved) JSON schema, compiling it only once per schema fingerprint."""
+    fingerprint = get_fingerprint(schema)
+
+    plan = coercion_plan_cache.get(fingerprint)
+    if plan is None:
+        plan = compile_coercion_plan(resolve_references(schema))
+        coercion_plan_cache.set(fingerprint, plan)
+
+    return plan
@@ -0,0 +1,258 @@
+"""Versioned session states, which clients update with JSON patches (RFC 6902) instead of re-uploading them."""
+
+import copy
+import threading
+import time
+import uuid
+from typing import Any, Dict, List, Optional
+
+from .caching import LRUCache
+from .schemas import unescape_json_pointer_token
+
+# Sessions are kept in memory only; clients create a session again if theirs was evicted (or the server restarted)
+MAX_SESSIONS = 128
+
+# Request fields that refer to a stored session, rather than being part of its state
+SESSION_REFERENCE_KEYS = ("session_id", "session_version")
+
+
+class SessionNotFoundError(KeyError):
+    pass
+
+
+class SessionVersionConflictError(ValueError):
+    pass
+
+
+def parse_json_pointer(pointer: str) -> List[str]:
+    if pointer == "":
+        return []
+
+    if not isinstance(pointer, str) or not pointer.startswith("/"):
+        raise ValueError(f"Invalid JSON pointer '{pointer}'.")
+
+    return [unescape_json_pointer_token(token) for token in pointer[1:].split("/")]
+
+
+def get_array_index(array: list, token: str, allow_end: bool = False) -> int:
+    """Parse a token of a JSON pointer as an index of an array (or its end, as `-` or its length, when adding)."""
+    if allow_end and token == "-":
+        return len(array)
+
+    if not token.isdigit() or (token != "0" and token.startswith("0")):
+        raise ValueError(f"Invalid array index '{token}'.")
+
+    index = int(token)
+    if index > len(array) or (index == len(array) and not allow_end):
+        raise ValueError(f"The array index {index} is out of range.")
+
+    return index
+
+
+def apply_json_patch(document: Any, patch: List[Dict[str, Any]]) -> Any:
+    """
+    Apply a JSON patch (RFC 6902) to a JSON document.
+
+    The document is never modified. Only the containers along the modified paths are copied, so the patched document
+    shares all unmodified parts with the original one. If any operation fails, a ValueError is raised.
+    """
+    root = document
+
+    # The containers created while applying this patch, which can therefore be modified in place
+    owned_containers = set()
+
+    def get_value(pointer: str) -> Any:
+        value = root
+        for token in parse_json_pointer(pointer):
+            if isinstance(value, dict):
+                if token not in value:
+                    raise ValueError(f"The path '{pointer}' does not exist.")
+                value = value[token]
+            elif isinstance(value, list):
+                value = value[get_array_index(value, token)]
+            else:
+                raise ValueError(f"The path '{pointer}' does not exist.")
+        return value
+
+    def get_owned_parent(tokens: List[str], pointer: str) -> Any:
+        """Copy the containers along the path (unless already owned) and return the parent of its last token."""
+        nonlocal root
+
+        if id(root) not in owned_containers:
+            root = copy.copy(root)
+            owned_containers.add(id(root))
+
+        parent = root
+        for token in tokens[:-1]:
+            if isinstance(parent, dict):
+                if token not in parent:
+                    raise ValueError(f"The path '{pointer}' does not exist.")
+                key = token
+            elif isinstance(parent, list):
+                key = get_array_index(parent, token)
+            else:
+                raise ValueError(f"The path '{pointer}' does not exist.")
+
+            child = parent[key]
+            if not isinstance(child, (dict, list)):
+                raise ValueError(f"The path '{pointer}' does not exist.")
+
+            if id(child) not in owned_containers:
+                child = parent[key] = copy.copy(child)
+                owned_containers.add(id(child))
+
+            parent = child
+
+        if not isinstance(parent, (dict, list)):
+            raise ValueError(f"The path '{pointer}' does not exist.")
+
+        return parent
+
+    def add(pointer: str, value: Any) -> None:
+        nonlocal root
+
+        tokens = parse_json_pointer(pointer)
+        if not tokens:
+            root = value
+            return
+
+        parent = get_owned_parent(tokens, pointer)
+        if isinstance(parent, list):
+            parent.insert(get_array_index(parent, tokens[-1], allow_end=True), value)
+        else:
+            parent[tokens[-1]] = value
+
+    def remove(pointer: str) -> Any:
+        tokens = parse_json_pointer(pointer)
+        if not tokens:
+            raise ValueError("The whole document cannot be removed.")
+
+        parent = get_owned_parent(tokens, pointer)
+        if isinstance(parent, list):
+            return parent.pop(get_array_index(parent, tokens[-1]))
+
+        if tokens[-1] not in parent:
+            raise ValueError(f"The path '{pointer}' does not exist.")
+        return parent.pop(tokens[-1])
+
+    for operation in patch:
+        if not isinstance(operation, dict):
+            raise ValueError("Each operation of a JSON patch must be an object.")
+
+        op = operation.get("op")
+        path = operation.get("path")
+        if path is None:
+            raise ValueError(f"The '{op}' operation is missing its 'path'.")
+
+        if op in ("add", "replace", "test") and "value" not in operation:
+            raise ValueError(f"The '{op}' operation at '{path}' is missing its 'value'.")
+        if op in ("move", "copy") and "from" not in operation:
+            raise ValueError(f"The '{op}' operation at '{path}' is missing its 'from' path.")
+
+        if op == "add":
+            add(path, operation["value"])
+        elif op == "remove":
+            remove(path)
+        elif op == "replace":
+            get_value(path)  # Must exist
+            if path:
+                remove(path)
+            add(path, operation["value"])
+        elif op == "move":
+            from_path = operation["from"]
+            if path.startswith(f"{from_path}/"):
+                raise ValueError(f"Cannot move '{from_path}' into one of its own children.")
+            if from_path != path:
+                add(path, remove(from_path))
+        elif op == "copy":
+            # Copied so that later operations on either location cannot affect the other
+            add(path, copy.deepcopy(get_value(operation["from"])))
+        elif op == "test":
+            if get_value(path) != operation["value"]:
+                raise ValueError(f"The test of the value at '{path}' failed.")
+        else:
+            raise ValueError(f"Unknown JSON patch operation '{op}'.")
+
+    return root
+
+
+class Session:
+    """A version of the state of a session, which is replaced (never modified) on each update."""
+
+    __slots__ = ("session_id", "version", "document", "updated")
+
+    def __init__(self, session_id: str, version: int, document: Any):
+        self.session_id = session_id
+        self.version = version
+        self.document = document
+        self.updated = time.time()
+
+    def info(self) -> dict:
+        return dict(session_id=self.session_id, version=self.version)
+
+
+class SessionStore:
+    """
+    Keep the latest state of each session in memory, so that requests can refer to them instead of re-uploading them.
+
+    Each update is a JSON patch against a specific version of the state, and is rejected if that version is not the
+    latest one (i.e. another update was applied in the meantime). The least recently used sessions are evicted first.
+    """
+
+    def __init__(self, max_sessions: int = MAX_SESSIONS):
+        self._sessions = LRUCache(max_size=max_sessions)
+        self._lock = threading.Lock()
+
+    def create(self, document: Any) -> dict:
+        session = Session(session_id=uuid.uuid4().hex, version=0, document=document)
+        self._sessions.set(session.session_id, session)
+        return session.info()
+
+    def get(self, session_id: str, version: Optional[int] = None) -> Session:
+        session = self._sessions.get(session_id)
+        if session is None:
+            raise SessionNotFoundError(f"The session '{session_id}' does not exist.")
+
+        if version is not None and version != session.version:
+            raise SessionVersionConflictError(
+                f"The session '{session_id}' is at version {session.version}, not {version}."
+            )
+
+        return session
+
+    def patch(self, session_id: str, patch: List[Dict[str, Any]], base_version: int) -> dict:
+        """Apply a JSON patch to the specified version of the state of a session, creating its next version."""
+        with self._lock:
+            session = self.get(session_id, version=base_version)
+
+            document = apply_json_patch(session.document, patch)
+            updated_session = Session(session_id=session_id, version=session.version + 1, document=document)
+            self._sessions.set(session_id, updated_session)
+
+        return updated_session.info()
+
+    def delete(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id) is not None
+
+    def resolve(self, info: dict) -> dict:
+        """
+        Merge a request with the state of the session it refers to (by `session_id`), if any.
+
+        Fields of the request take precedence over those of the session. If `session_version` is provided as well, the
+        request is rejected unless it matches the latest version of the session.
+        """
+        if "session_id" not in info:
+            return info
+
+        session = self.get(info["session_id"], version=info.get("session_version"))
+        if not isinstance(session.document, dict):
+            raise ValueError(f"The state of the session '{session.session_id}' is not an object.")
+
+        request = {key: value for key, value in info.items() if key not in SESSION_REFERENCE_KEYS}
+        return {**session.document, **request}
+
+    def info(self) -> dict:
+        return self._sessions.info()
+
+
+session_store = SessionStore()
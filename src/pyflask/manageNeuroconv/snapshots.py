@@ -0,0 +1,133 @@
+"""Optional snapshots of large endpoint payloads, written to the log folder on a background thread."""
+
+import json
+import os
+import queue
+import random
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .info import GUIDE_ROOT_FOLDER
+
+# Fraction of requests (between 0 and 1) whose payloads are saved; snapshots are disabled by default
+SNAPSHOT_SAMPLE_RATE_ENVIRONMENT_VARIABLE = "NWB_GUIDE_SNAPSHOT_SAMPLE_RATE"
+
+SNAPSHOT_FOLDER_PATH = GUIDE_ROOT_FOLDER / "logs" / "snapshots"
+
+
+def get_default_sample_rate() -> float:
+    try:
+        sample_rate = float(os.environ.get(SNAPSHOT_SAMPLE_RATE_ENVIRONMENT_VARIABLE, 0))
+    except ValueError:
+        return 0.0
+
+    return min(max(sample_rate, 0.0), 1.0)
+
+
+class SnapshotWriter:
+    """
+    Write sampled snapshots of payloads to rotating JSON files without blocking the request that produced them.
+
+    Snapshots are queued for a single daemon thread; when the queue is full (i.e. the disk cannot keep up), new
+    snapshots are dropped instead of waiting. Only the most recent `max_files` snapshot files are kept.
+
+    The submitted payloads are serialized later on, so they must not be modified after submission.
+    """
+
+    def __init__(
+        self,
+        folder_path: Path = SNAPSHOT_FOLDER_PATH,
+        sample_rate: Optional[float] = None,
+        max_files: int = 20,
+        max_queue_size: int = 4,
+    ):
+        self.folder_path = Path(folder_path)
+        self.sample_rate = get_default_sample_rate() if sample_rate is None else sample_rate
+        self.max_files = max_files
+
+        self.written = 0
+        self.dropped = 0
+        self.failed = 0
+
+        self._lock = threading.Lock()
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_rate > 0
+
+    def should_sample(self) -> bool:
+        """Decide whether the payloads of the current request are saved."""
+        return self.enabled and (self.sample_rate >= 1 or random.random() < self.sample_rate)
+
+    def submit(self, name: str, payloads: Dict[str, Any]) -> bool:
+        """
+        Queue a snapshot, which writes each payload to `<timestamp>_<name>_<key>.json`.
+
+        Returns whether the snapshot was queued.
+        """
+        self._ensure_thread()
+
+        timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S-%f")
+        try:
+            self._queue.put_nowait((f"{timestamp}_{name}", payloads))
+        except queue.Full:
+            self.dropped += 1
+            return False
+
+        return True
+
+    def flush(self) -> None:
+        """Block until all queued snapshots have been written."""
+        if self._thread is not None:
+            self._queue.join()
+
+    def _ensure_thread(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="snapshot-writer", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            prefix, payloads = self._queue.get()
+            try:
+                self._write(prefix, payloads)
+                self.written += 1
+            except Exception:
+                self.failed += 1
+            finally:
+                self._queue.task_done()
+
+    def _write(self, prefix: str, payloads: Dict[str, Any]) -> None:
+        from neuroconv.utils import NWBMetaDataEncoder
+
+        self.folder_path.mkdir(exist_ok=True, parents=True)
+
+        for key, payload in payloads.items():
+            with open(file=self.folder_path / f"{prefix}_{key}.json", mode="w") as fp:
+                json.dump(obj=payload, fp=fp, cls=NWBMetaDataEncoder, indent=2)
+
+        self._rotate()
+
+    def _rotate(self) -> None:
+        # Timestamped names sort chronologically
+        file_paths = sorted(self.folder_path.glob("*.json"))
+        for file_path in file_paths[: max(len(file_paths) - self.max_files, 0)]:
+            file_path.unlink(missing_ok=True)
+
+    def info(self) -> dict:
+        return dict(
+            enabled=self.enabled,
+            sample_rate=self.sample_rate,
+            queued=self._queue.qsize(),
+            written=self.written,
+            dropped=self.dropped,
+            failed=self.failed,
+        )
+
+
+snapshot_writer = SnapshotWriter()
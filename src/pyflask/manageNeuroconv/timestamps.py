@@ -0,0 +1,415 @@
+"""Loading and compact summaries of the timestamps of temporal interfaces, which are far too large to be sent in full."""
+
+import math
+import os
+import shutil
+import threading
+import uuid
+import warnings
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import numpy as np
+
+from .caching import get_fingerprint
+from .info import CACHE_FOLDER_PATH
+
+# Timestamps are scanned in chunks of this many samples, so that no full-size temporary array is ever allocated
+CHUNK_SIZE = 2**20
+
+# The number of bins of the finest and coarsest levels of the min/max pyramid
+MAX_PYRAMID_BINS = 1024
+MIN_PYRAMID_BINS = 16
+
+# The relative deviation of the intervals between timestamps that still counts as a regular sampling rate
+RATE_TOLERANCE = 1e-6
+
+# The maximum deviation of timestamps from a regular grid (as a fraction of its interval) for them to be replaced by a
+# starting time and rate when aligning
+REGULAR_GRID_TOLERANCE = 1e-3
+
+# Intervals longer than this many times the typical interval are reported as gaps
+GAP_FACTOR = 2.0
+MAX_GAPS = 100
+
+# The maximum number of timestamps in a full-resolution window
+MAX_WINDOW_SIZE = 100_000
+
+# Timestamp files holding raw little-endian float64 values; other files (except .npy) are parsed as text
+BINARY_TIMESTAMP_FILE_SUFFIXES = (".bin", ".raw", ".f64")
+
+# Parsed text files, saved as .npy so that they are only parsed once (see `timestamp_file_cache`)
+TIMESTAMP_FILE_CACHE_FOLDER_PATH = CACHE_FOLDER_PATH / "timestamp_files"
+MAX_TIMESTAMP_FILE_CACHE_BYTES = 1024**3
+
+# Text files are parsed in blocks of this many bytes
+TEXT_BLOCK_SIZE = 2**24
+
+# The original timestamps of interfaces (e.g. decoded from videos), saved as .npy files
+INTERFACE_TIMESTAMP_CACHE_FOLDER_PATH = CACHE_FOLDER_PATH / "interface_timestamps"
+MAX_INTERFACE_TIMESTAMP_CACHE_BYTES = 2 * 1024**3
+
+
+def get_typical_interval(timestamps: np.ndarray) -> Optional[float]:
+    """The median interval between the first timestamps, which is robust to a few gaps or outliers."""
+    if len(timestamps) < 2:
+        return None
+
+    intervals = np.diff(np.asarray(timestamps[: CHUNK_SIZE + 1], dtype="float64"))
+    interval = float(np.nanmedian(intervals)) if not np.isnan(intervals).all() else math.nan
+
+    return interval if math.isfinite(interval) and interval > 0 else None
+
+
+def get_pyramid_levels(
+    timestamps: np.ndarray, max_bins: int = MAX_PYRAMID_BINS, min_bins: int = MIN_PYRAMID_BINS
+) -> List[Dict[str, Any]]:
+    """
+    Compute a level-of-detail pyramid of the minimum and maximum timestamp in consecutive bins of samples.
+
+    The finest level has at most `max_bins` bins; each coarser level halves the number of bins, down to `min_bins`.
+    Levels are ordered from the coarsest to the finest. The last bin of a level may hold fewer samples.
+    """
+    count = len(timestamps)
+    if count == 0:
+        return []
+
+    samples_per_bin = max(math.ceil(count / max_bins), 1)
+    number_of_bins = math.ceil(count / samples_per_bin)
+
+    minima = np.empty(number_of_bins, dtype="float64")
+    maxima = np.empty(number_of_bins, dtype="float64")
+
+    # Whole chunks of bins at a time, ignoring missing (NaN) timestamps
+    bins_per_chunk = max(CHUNK_SIZE // samples_per_bin, 1)
+    for first_bin in range(0, number_of_bins, bins_per_chunk):
+        last_bin = min(first_bin + bins_per_chunk, number_of_bins)
+        chunk = np.asarray(timestamps[first_bin * samples_per_bin : last_bin * samples_per_bin], dtype="float64")
+
+        whole_bins = len(chunk) // samples_per_bin
+        bins = chunk[: whole_bins * samples_per_bin].reshape(whole_bins, samples_per_bin)
+        minima[first_bin : first_bin + whole_bins] = np.fmin.reduce(bins, axis=1)
+        maxima[first_bin : first_bin + whole_bins] = np.fmax.reduce(bins, axis=1)
+
+        if whole_bins < last_bin - first_bin:  # The last, partial bin
+            minima[last_bin - 1] = np.fmin.reduce(chunk[whole_bins * samples_per_bin :])
+            maxima[last_bin - 1] = np.fmax.reduce(chunk[whole_bins * samples_per_bin :])
+
+    levels = [dict(samples_per_bin=samples_per_bin, min=minima.tolist(), max=maxima.tolist())]
+
+    while len(minima) > min_bins:
+        samples_per_bin *= 2
+        if len(minima) % 2 == 1:  # The last bin has no pair
+            minima = np.append(minima, minima[-1])
+            maxima = np.append(maxima, maxima[-1])
+
+        minima = np.fmin(minima[0::2], minima[1::2])
+        maxima = np.fmax(maxima[0::2], maxima[1::2])
+        levels.append(dict(samples_per_bin=samples_per_bin, min=minima.tolist(), max=maxima.tolist()))
+
+    return levels[::-1]
+
+
+def get_timestamp_summary(
+    timestamps: Optional[np.ndarray],
+    max_bins: int = MAX_PYRAMID_BINS,
+    min_bins: int = MIN_PYRAMID_BINS,
+    rate_tolerance: float = RATE_TOLERANCE,
+    gap_factor: float = GAP_FACTOR,
+    max_gaps: int = MAX_GAPS,
+) -> Dict[str, Any]:
+    """
+    Summarize timestamps without ever copying all of them, so that memory-mapped arrays stay on disk.
+
+    Returns:
+        dict: The `count`, `first` and `last` timestamps, along with:
+            rate (float or None): The sampling rate, if the timestamps are regularly spaced (without any gap).
+            interval (float or None): The typical (median) interval between timestamps.
+            gaps (list): The first `max_gaps` intervals longer than `gap_factor` times the typical one, as their
+                `index` (the sample after the gap), `start` and `stop`.
+            gap_count (int): The total number of gaps.
+            levels (list): The min/max pyramid, from the coarsest to the finest level (see `get_pyramid_levels`).
+    """
+    count = 0 if timestamps is None else len(timestamps)
+    summary = dict(count=count, first=None, last=None, rate=None, interval=None, gaps=[], gap_count=0, levels=[])
+    if count == 0:
+        return summary
+
+    summary["first"] = float(timestamps[0])
+    summary["last"] = float(timestamps[-1])
+    summary["levels"] = get_pyramid_levels(timestamps, max_bins=max_bins, min_bins=min_bins)
+
+    interval = get_typical_interval(timestamps)
+    if interval is None:
+        return summary
+
+    summary["interval"] = interval
+
+    is_regular = True
+    gaps = summary["gaps"]
+    for start in range(0, count - 1, CHUNK_SIZE):
+        # Overlap by one sample, so that the interval across chunks is included
+        intervals = np.diff(np.asarray(timestamps[start : start + CHUNK_SIZE + 1], dtype="float64"))
+
+        if is_regular and not (np.abs(intervals - interval) <= rate_tolerance * interval).all():
+            is_regular = False
+
+        gap_indices = np.flatnonzero(intervals > gap_factor * interval)
+        summary["gap_count"] += len(gap_indices)
+        for index in gap_indices[: max(max_gaps - len(gaps), 0)]:
+            index = start + int(index)
+            gaps.append(dict(index=index + 1, start=float(timestamps[index]), stop=float(timestamps[index + 1])))
+
+    if is_regular:
+        summary["rate"] = 1.0 / interval
+
+    return summary
+
+
+def is_regular_grid(timestamps: np.ndarray, rate: float, tolerance: float = REGULAR_GRID_TOLERANCE) -> bool:
+    """Whether all timestamps are within `tolerance` sampling intervals of `first + index / rate`."""
+    count = len(timestamps)
+    if count == 0 or not rate > 0:
+        return False
+
+    first = float(timestamps[0])
+    max_deviation = tolerance / rate
+
+    for start in range(0, count, CHUNK_SIZE):
+        chunk = np.asarray(timestamps[start : start + CHUNK_SIZE], dtype="float64")
+        expected = first + np.arange(start, start + len(chunk)) / rate
+
+        # Missing (NaN) timestamps are never within the tolerance
+        if not (np.abs(chunk - expected) <= max_deviation).all():
+            return False
+
+    return True
+
+
+def get_timestamp_window(
+    timestamps: Optional[np.ndarray],
+    offset: Optional[int] = None,
+    limit: int = MAX_WINDOW_SIZE,
+    start_time: Optional[float] = None,
+    stop_time: Optional[float] = None,
+) -> Dict[str, Any]:
+    """
+    Get a window of timestamps at full resolution, either by the position of its first sample or by a time range.
+
+    A time range (`start_time` inclusive, `stop_time` exclusive) assumes that the timestamps are sorted. At most
+    `limit` timestamps (capped at `MAX_WINDOW_SIZE`) are returned, along with the position of the first one.
+    """
+    count = 0 if timestamps is None else len(timestamps)
+
+    if limit < 0:
+        raise ValueError("The limit of a timestamp window cannot be negative.")
+    limit = min(limit, MAX_WINDOW_SIZE)
+
+    if offset is not None:
+        if start_time is not None or stop_time is not None:
+            raise ValueError("A timestamp window is specified either by its offset or by a time range, not both.")
+        if offset < 0:
+            raise ValueError("The offset of a timestamp window cannot be negative.")
+        start, stop = offset, offset + limit
+    else:
+        start = 0 if start_time is None or count == 0 else int(np.searchsorted(timestamps, start_time, side="left"))
+        stop = count if stop_time is None or count == 0 else int(np.searchsorted(timestamps, stop_time, side="left"))
+        stop = min(stop, start + limit)
+
+    start, stop = min(start, count), min(stop, count)
+    window = [] if count == 0 else np.asarray(timestamps[start:stop], dtype="float64").tolist()
+
+    return dict(count=count, offset=start, timestamps=window)
+
+
+def parse_timestamps_text(file_path: Union[str, Path], block_size: int = TEXT_BLOCK_SIZE) -> np.ndarray:
+    """Parse a text file with one timestamp per line, a block at a time, without creating a Python float for each."""
+    blocks = list()
+    remainder = b""
+
+    with open(file=file_path, mode="rb") as io:
+        while True:
+            data = io.read(block_size)
+            text = remainder + data
+
+            if data:  # Only parse complete lines, and keep the last (possibly partial) one for the next block
+                end = text.rfind(b"\n") + 1
+                text, remainder = text[:end], text[end:]
+
+            if text.strip():
+                # Older versions of NumPy only warn about (and stop at) unparsable values
+                with warnings.catch_warnings():
+                    warnings.simplefilter("error", DeprecationWarning)
+                    try:
+                        blocks.append(np.fromstring(text, dtype="float64", sep=" "))
+                    except (ValueError, DeprecationWarning):
+                        raise ValueError(f"The timestamps file '{file_path}' must only contain one number per line.")
+
+            if not data:
+                break
+
+    return np.concatenate(blocks) if blocks else np.empty(0, dtype="float64")
+
+
+def get_timestamps_file_cache_key(file_path: Path) -> str:
+    """The key of a parsed text file in the cache, which is its path, size and modification time."""
+    stat = file_path.stat()
+    return get_fingerprint(dict(path=str(file_path.resolve()), size=stat.st_size, mtime=stat.st_mtime_ns))
+
+
+def load_timestamps(file_path: Union[str, Path], cache: Optional["TimestampCache"] = None) -> np.ndarray:
+    """
+    Load the timestamps of a file as a one-dimensional float64 array.
+
+    The file can be a `.npy` file, raw little-endian float64 values (see `BINARY_TIMESTAMP_FILE_SUFFIXES`), or text
+    with one timestamp per line (e.g. .txt, .csv or .tsv). Text files are parsed once, and kept in a size-capped
+    cache (`timestamp_file_cache` by default). All files are memory-mapped (copy-on-write, so the files themselves are
+    never modified) instead of being read in memory, unless their values have to be converted to float64.
+    """
+    file_path = Path(file_path)
+    suffix = file_path.suffix.lower()
+
+    if suffix == ".npy":
+        timestamps = np.load(file_path, mmap_mode="c")
+    elif suffix in BINARY_TIMESTAMP_FILE_SUFFIXES:
+        if file_path.stat().st_size % 8 != 0:
+            raise ValueError(f"The size of the binary timestamps file '{file_path}' is not a multiple of 8 bytes.")
+        if file_path.stat().st_size == 0:  # Empty files cannot be memory-mapped
+            return np.empty(0, dtype="float64")
+        timestamps = np.memmap(file_path, dtype="<f8", mode="c")
+    else:
+        cache = timestamp_file_cache if cache is None else cache
+        cache_key = get_timestamps_file_cache_key(file_path)
+
+        timestamps = cache.get(cache_key)
+        if timestamps is None:
+            timestamps = parse_timestamps_text(file_path)
+            cache.set(cache_key, timestamps)
+
+    if timestamps.ndim == 2 and 1 in timestamps.shape:  # A single row or column
+        timestamps = timestamps.reshape(-1)
+    if timestamps.ndim != 1:
+        raise ValueError(f"The timestamps of '{file_path}' must be one-dimensional, not of shape {timestamps.shape}.")
+
+    return timestamps if timestamps.dtype == np.float64 else timestamps.astype("float64")
+
+
+class TimestampCache:
+    """
+    A disk-backed, size-capped cache of timestamps, which are memory-mapped (copy-on-write) when read back.
+
+    Each entry is a folder holding either a single array (`timestamps.npy`) or a list of arrays (`timestamps_<i>.npy`),
+    whose modification time is updated on each access. When the total size of the entries exceeds `max_bytes`, the
+    least recently used ones are removed; the most recent entry is never removed for its size.
+    """
+
+    def __init__(
+        self,
+        folder_path: Union[str, Path] = INTERFACE_TIMESTAMP_CACHE_FOLDER_PATH,
+        max_bytes: int = MAX_INTERFACE_TIMESTAMP_CACHE_BYTES,
+    ):
+        self.folder_path = Path(folder_path)
+        self.max_bytes = max_bytes
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Union[np.ndarray, List[np.ndarray], None]:
+        entry_path = self.folder_path / key
+
+        try:
+            if (entry_path / "timestamps.npy").exists():
+                timestamps = np.load(entry_path / "timestamps.npy", mmap_mode="c")
+            else:
+                file_paths = sorted(entry_path.glob("timestamps_*.npy"), key=lambda path: int(path.stem.split("_")[1]))
+                if not file_paths:
+                    self.misses += 1
+                    return None
+                timestamps = [np.load(file_path, mmap_mode="c") for file_path in file_paths]
+
+            os.utime(entry_path)
+        except (OSError, ValueError):  # Evicted by another process in the meantime
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return timestamps
+
+    def set(self, key: str, timestamps: Union[np.ndarray, List[np.ndarray]]) -> bool:
+        """Save the timestamps, if they are a numeric array or a list of them. Returns whether they were saved."""
+        arrays = timestamps if isinstance(timestamps, (list, tuple)) else [timestamps]
+        if not all(isinstance(array, np.ndarray) and array.dtype.kind in "iuf" for array in arrays):
+            return False
+
+        # Written to a temporary folder first, so that concurrent readers never see a partial entry
+        self.folder_path.mkdir(exist_ok=True, parents=True)
+        temporary_path = self.folder_path / f"{key}.{uuid.uuid4().hex}.tmp"
+        temporary_path.mkdir()
+
+        if isinstance(timestamps, np.ndarray):
+            np.save(temporary_path / "timestamps.npy", timestamps)
+        else:
+            for index, array in enumerate(arrays):
+                np.save(temporary_path / f"timestamps_{index}.npy", array)
+
+        try:
+            os.replace(temporary_path, self.folder_path / key)
+        except OSError:  # Saved by another request in the meantime
+            shutil.rmtree(temporary_path, ignore_errors=True)
+
+        self._evict(keep=key)
+        return True
+
+    def _get_entries(self) -> List[tuple]:
+        """The (modification time, size, path) of each entry."""
+        entries = list()
+        for entry_path in self.folder_path.iterdir():
+            if entry_path.suffix == ".tmp" or not entry_path.is_dir():
+                continue
+
+            try:
+                size = sum(file_path.stat().st_size for file_path in entry_path.iterdir())
+                entries.append((entry_path.stat().st_mtime, size, entry_path))
+            except OSError:
+                continue
+
+        return entries
+
+    def _evict(self, keep: str) -> None:
+        with self._lock:
+            entries = sorted(self._get_entries(), key=lambda entry: entry[0])
+            total_size = sum(size for _, size, _ in entries)
+
+            for _, size, entry_path in entries:
+                if total_size <= self.max_bytes:
+                    break
+                if entry_path.name == keep:
+                    continue
+
+                shutil.rmtree(entry_path, ignore_errors=True)
+                total_size -= size
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            shutil.rmtree(self.folder_path, ignore_errors=True)
+
+    def info(self) -> dict:
+        entries = self._get_entries() if self.folder_path.exists() else []
+        return dict(
+            size=len(entries),
+            total_bytes=sum(size for _, size, _ in entries),
+            max_bytes=self.max_bytes,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+        )
+
+
+interface_timestamp_cache = TimestampCache()
+timestamp_file_cache = TimestampCache(
+    folder_path=TIMESTAMP_FILE_CACHE_FOLDER_PATH, max_bytes=MAX_TIMESTAMP_FILE_CACHE_BYTES
+)
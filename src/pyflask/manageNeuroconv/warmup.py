@@ -0,0 +1,216 @@
+"""Background warm-up of the heavy libraries used by the NeuroConv endpoints."""
+
+import importlib
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Imported in order; the first request to any NeuroConv endpoint otherwise pays for all of these
+CORE_MODULES = [
+    "numpy",
+    "pynwb",
+    "hdmf",
+    "neuroconv",
+    "neuroconv.datainterfaces",
+    "neuroconv.converters",
+    "neuroconv.tools.nwb_helpers",
+    "spikeinterface",
+    "nwbinspector",
+]
+
+CORE_STAGE = "core"
+INTERFACES_STAGE = "interfaces"
+INSPECTOR_STAGE = "inspector"
+
+PENDING = "pending"
+RUNNING = "running"
+READY = "ready"
+FAILED = "failed"
+
+
+def import_core_libraries() -> dict:
+    """Import the libraries shared by every NeuroConv endpoint."""
+    for module_name in CORE_MODULES:
+        importlib.import_module(module_name)
+
+    return dict(modules=CORE_MODULES)
+
+
+def import_interface_modules(interface_names: Iterable[str]) -> dict:
+    """
+    Import the format-specific modules required by the specified interfaces or converters.
+
+    Most interfaces only import their extractor (and its reading library) on first use,
+    so the extractor class and source schema of each one is requested ahead of time.
+    """
+    from neuroconv import converters, datainterfaces
+
+    warmed = []
+    failed = {}
+    for interface_name in interface_names:
+        interface_class = getattr(datainterfaces, interface_name, getattr(converters, interface_name, None))
+        if interface_class is None:
+            failed[interface_name] = "Interface not found in NeuroConv."
+            continue
+
+        # Converters expose their interfaces as a class attribute
+        classes_to_warm = [interface_class, *getattr(interface_class, "data_interface_classes", dict()).values()]
+
+        try:
+            for class_to_warm in classes_to_warm:
+                if hasattr(class_to_warm, "get_extractor_class"):
+                    class_to_warm.get_extractor_class()
+                class_to_warm.get_source_schema()
+            warmed.append(interface_name)
+        except Exception as exception:
+            failed[interface_name] = str(exception)
+
+    return dict(interfaces=warmed, errors=failed)
+
+
+def configure_inspector_checks() -> dict:
+    """Build the NWB Inspector check registry used to validate metadata."""
+    from .checks import check_registry
+
+    checks = check_registry.get_checks()
+
+    return dict(number_of_checks=len(checks))
+
+
+class WarmUp:
+    """
+    Run the warm-up stages in order on a background thread and track their status.
+
+    Stages are executed sequentially (core libraries always first) so that the heavy imports do not compete with
+    each other for the import lock. Callers may wait on the future returned when a stage is scheduled.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._stages: Dict[str, dict] = dict()
+        self._futures: Dict[str, Future] = dict()
+        self._listeners: List[Callable[[str, dict], None]] = list()
+
+        # Interfaces whose modules were imported (in order), and the errors of those that could not be (yet)
+        self._warmed_interfaces: Dict[str, None] = dict()
+        self._interface_errors: Dict[str, str] = dict()
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    def add_listener(self, callback: Callable[[str, dict], None]) -> None:
+        """Register a callback that receives the name and status of each stage when it finishes."""
+        self._listeners.append(callback)
+
+    def _run_stage(self, name: str, function: Callable[[], dict]) -> dict:
+        stage = self._stages[name]
+        stage.update(status=RUNNING, started=datetime.now().isoformat())
+
+        start_time = time.perf_counter()
+        try:
+            stage["details"] = function()
+            stage["status"] = READY
+        except Exception as exception:
+            stage.update(status=FAILED, error=str(exception), traceback=traceback.format_exc())
+        finally:
+            stage.update(finished=datetime.now().isoformat(), duration=round(time.perf_counter() - start_time, 6))
+
+        for callback in self._listeners:
+            try:
+                callback(name, dict(stage))
+            except Exception:
+                pass
+
+        return stage
+
+    def _schedule(self, name: str, function: Callable[[], dict]) -> Future:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="warmup")
+
+            # The details of a rescheduled stage are kept until its next run replaces them
+            previous_stage = self._stages.get(name, dict())
+            self._stages[name] = dict(
+                status=PENDING,
+                scheduled=datetime.now().isoformat(),
+                started=None,
+                finished=None,
+                duration=None,
+                error=None,
+                details=previous_stage.get("details"),
+            )
+            future = self._futures[name] = self._executor.submit(self._run_stage, name, function)
+
+        return future
+
+    def start(self) -> Future:
+        """Schedule the core and inspector stages (once), returning the future of the core stage."""
+        with self._lock:
+            if CORE_STAGE in self._futures:
+                return self._futures[CORE_STAGE]
+
+        core_future = self._schedule(CORE_STAGE, import_core_libraries)
+        self._schedule(INSPECTOR_STAGE, configure_inspector_checks)
+
+        return core_future
+
+    def _import_interface_modules(self, interface_names: List[str]) -> dict:
+        """Import the modules of the interfaces not yet warmed, and merge the results with those of previous runs."""
+        with self._lock:
+            remaining = [name for name in interface_names if name not in self._warmed_interfaces]
+
+        results = import_interface_modules(remaining)
+
+        with self._lock:
+            self._warmed_interfaces.update(dict.fromkeys(results["interfaces"]))
+            self._interface_errors.update(results["errors"])
+            for name in results["interfaces"]:
+                self._interface_errors.pop(name, None)
+
+            return dict(interfaces=list(self._warmed_interfaces), errors=dict(self._interface_errors))
+
+    def warm_interfaces(self, interface_names: Iterable[str]) -> Future:
+        """
+        Schedule the import of the modules used by the interfaces in the open project.
+
+        Interfaces are only marked as warmed once their modules were imported, so that failed ones are retried by later
+        calls. The stage reports the interfaces warmed (and the errors) across all calls.
+        """
+        if not self.started:
+            self.start()
+
+        with self._lock:
+            remaining = [name for name in interface_names if name not in self._warmed_interfaces]
+
+            if not remaining and INTERFACES_STAGE in self._futures:
+                return self._futures[INTERFACES_STAGE]
+
+        return self._schedule(INTERFACES_STAGE, lambda: self._import_interface_modules(remaining))
+
+    def wait(self, name: str, timeout: Optional[float] = None) -> Optional[dict]:
+        """Block until the specified stage has finished; returns None if it was never scheduled."""
+        future = self._futures.get(name)
+        if future is None:
+            return None
+
+        return future.result(timeout=timeout)
+
+    def get_readiness(self) -> dict:
+        """Summarize the status and timing of each stage."""
+        with self._lock:
+            stages = {name: {key: value for key, value in stage.items()} for name, stage in self._stages.items()}
+
+        for stage in stages.values():
+            stage.pop("traceback", None)
+
+        ready = bool(stages) and all(stage["status"] == READY for stage in stages.values())
+
+        return dict(started=self.started, ready=ready, stages=stages)
+
+
+warm_up = WarmUp()
@@ -4,23 +4,31 @@ from flask import Response, request
 from flask_restx import Namespace, Resource, reqparse
 from manageNeuroconv import (
     autocomplete_format_string,
+    check_registry,
     convert_all_to_nwb,
-    get_all_converter_info,
-    get_all_interface_info,
     get_backend_configuration,
+    get_cache_info,
     get_interface_alignment,
+    get_interface_catalog,
     get_metadata_schema,
     get_source_schema,
+    get_table_window,
+    get_timestamps_window,
     inspect_all,
+    invalidate_converter_cache,
     listen_to_neuroconv_progress_events,
     locate_data,
     progress_handler,
+    session_store,
     upload_folder_to_dandi,
     upload_multiple_filesystem_objects_to_dandi,
     upload_project_to_dandi,
     validate_metadata,
+    validate_metadata_batch,
 )
 
+from .responses import json_response
+
 neuroconv_namespace = Namespace("neuroconv", description="Neuroconv neuroconv_namespace for the NWB GUIDE.")
 
 parser = reqparse.RequestParser()
@@ -31,13 +39,7 @@ parser.add_argument("interfaces", type=str, action="split", help="Interfaces can
 class AllInterfaces(Resource):
     @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
     def get(self):
-        # return get_all_interface_info()
-        # return get_all_converter_info()
-
-        return {
-            **get_all_interface_info(),
-            **get_all_converter_info(),
-        }
+        return get_interface_catalog()
 
 
 @neuroconv_namespace.route("/schema")
@@ -51,25 +53,39 @@ class Schemas(Resource):
 class LocateData(Resource):
     @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
     def post(self):
-        return locate_data(neuroconv_namespace.payload)
+        return json_response(locate_data(neuroconv_namespace.payload))
 
 
 @neuroconv_namespace.route("/locate/autocomplete")
 class AutoCompleteFormatString(Resource):
     @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
     def post(self):
-        return autocomplete_format_string(neuroconv_namespace.payload)
+        return json_response(autocomplete_format_string(neuroconv_namespace.payload))
 
 
 @neuroconv_namespace.route("/metadata")
 class Metadata(Resource):
     @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
     def post(self):
-        return get_metadata_schema(
-            neuroconv_namespace.payload.get("source_data"), neuroconv_namespace.payload.get("interfaces")
+        return json_response(
+            get_metadata_schema(
+                neuroconv_namespace.payload.get("source_data"),
+                neuroconv_namespace.payload.get("interfaces"),
+                table_format=neuroconv_namespace.payload.get("table_format", "rows"),
+            )
         )
 
 
+@neuroconv_namespace.route("/table")
+class Table(Resource):
+    @neuroconv_namespace.doc(
+        description="Get a sorted and filtered window of rows from the electrode or unit table of an interface.",
+        responses={200: "Success", 400: "Bad Request", 500: "Internal server error"},
+    )
+    def post(self):
+        return json_response(get_table_window(neuroconv_namespace.payload))
+
+
 @neuroconv_namespace.route("/convert")
 class Convert(Resource):
     @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
@@ -89,14 +105,89 @@ class Convert(Resource):
 class Alignment(Resource):
     @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
     def post(self):
-        return get_interface_alignment(neuroconv_namespace.payload)
+        return json_response(get_interface_alignment(neuroconv_namespace.payload))
+
+
+@neuroconv_namespace.route("/alignment/timestamps")
+class AlignmentTimestamps(Resource):
+    @neuroconv_namespace.doc(
+        description="Get a window of the aligned timestamps of an interface at full resolution.",
+        responses={200: "Success", 400: "Bad Request", 500: "Internal server error"},
+    )
+    def post(self):
+        # Only holds numbers
+        return json_response(get_timestamps_window(neuroconv_namespace.payload), stream=True)
 
 
 @neuroconv_namespace.route("/configuration")
 class GetBackendConfiguration(Resource):
     @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
     def post(self):
-        return get_backend_configuration(neuroconv_namespace.payload)
+        return json_response(get_backend_configuration(neuroconv_namespace.payload))
+
+
+@neuroconv_namespace.route("/cache")
+class Caches(Resource):
+    @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
+    def get(self):
+        return get_cache_info()
+
+    @neuroconv_namespace.doc(
+        description="Remove the cached converters (only those combining the interfaces in the payload, if provided).",
+        responses={200: "Success", 400: "Bad Request", 500: "Internal server error"},
+    )
+    def delete(self):
+        payload = request.get_json(silent=True) or dict()
+        return dict(removed=invalidate_converter_cache(payload.get("interfaces")))
+
+
+@neuroconv_namespace.route("/sessions")
+class Sessions(Resource):
+    @neuroconv_namespace.doc(
+        description="Store the state of a session (e.g. the payload of a conversion), so that requests can refer to it.",
+        responses={200: "Success", 400: "Bad Request", 500: "Internal server error"},
+    )
+    def post(self):
+        return session_store.create(neuroconv_namespace.payload)
+
+    @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
+    def get(self):
+        return session_store.info()
+
+
+@neuroconv_namespace.route("/sessions/<string:session_id>")
+class Session(Resource):
+    @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
+    def get(self, session_id: str):
+        session = session_store.get(session_id)
+        # Sessions are only ever created and patched from JSON
+        return json_response(dict(**session.info(), document=session.document), stream=True)
+
+    @neuroconv_namespace.doc(
+        description=(
+            "Apply a JSON patch (RFC 6902) to the specified version of the state of a session. "
+            "Fails with a SessionVersionConflictError if that version is no longer the latest one."
+        ),
+        responses={200: "Success", 400: "Bad Request", 500: "Internal server error"},
+    )
+    def patch(self, session_id: str):
+        payload = neuroconv_namespace.payload
+        if not isinstance(payload, dict):
+            raise ValueError("The body of a session patch must be an object with a 'patch' and a 'version'.")
+
+        missing_fields = [field for field in ("patch", "version") if field not in payload]
+        if missing_fields:
+            raise ValueError(f"The session patch is missing its {' and '.join(map(repr, missing_fields))} field(s).")
+        if not isinstance(payload["patch"], list):
+            raise ValueError("The 'patch' of a session patch must be a list of JSON patch operations.")
+        if not isinstance(payload["version"], int) or isinstance(payload["version"], bool):
+            raise ValueError("The 'version' of a session patch must be an integer.")
+
+        return session_store.patch(session_id, patch=payload["patch"], base_version=payload["version"])
+
+    @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
+    def delete(self, session_id: str):
+        return dict(removed=session_store.delete(session_id))
 
 
 validate_parser = neuroconv_namespace.parser()
@@ -111,7 +202,40 @@ class Validate(Resource):
     @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
     def post(self):
         args = validate_parser.parse_args()
-        return validate_metadata(args.get("parent"), args.get("function_name"), args.get("timezone"))
+        return json_response(validate_metadata(args.get("parent"), args.get("function_name"), args.get("timezone")))
+
+
+@neuroconv_namespace.route("/validate/batch")
+class ValidateBatch(Resource):
+    @neuroconv_namespace.doc(
+        description="Validate the Subject and NWBFile metadata with all (or the specified) NWB Inspector checks at once.",
+        responses={200: "Success", 400: "Bad Request", 500: "Internal server error"},
+    )
+    def post(self):
+        payload = neuroconv_namespace.payload
+        return json_response(
+            validate_metadata_batch(
+                payload["metadata"],
+                checks=payload.get("checks"),
+                timezone=payload.get("timezone"),
+                max_workers=payload.get("max_workers", 1),
+            )
+        )
+
+
+@neuroconv_namespace.route("/validate/checks")
+class ValidationChecks(Resource):
+    @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
+    def get(self):
+        return check_registry.info()
+
+    @neuroconv_namespace.doc(
+        description="Configure the NWB Inspector checks again on next use (e.g. after the configuration changed).",
+        responses={200: "Success", 400: "Bad Request", 500: "Internal server error"},
+    )
+    def delete(self):
+        check_registry.invalidate()
+        return check_registry.info()
 
 
 @neuroconv_namespace.route("/upload/project")
@@ -176,7 +300,7 @@ class InspectNWBFolder(Resource):
     @neuroconv_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
     def post(self):
         url = f"{request.url_root}neuroconv/announce/progress"
-        return inspect_all(url, neuroconv_namespace.payload)
+        return json_response(inspect_all(url, neuroconv_namespace.payload))
 
 
 @neuroconv_namespace.route("/html")
@@ -0,0 +1,180 @@
+"""Serialization of endpoint results directly into HTTP response bodies."""
+
+import json
+import math
+from datetime import date, datetime
+from enum import Enum
+from pathlib import PurePath
+from typing import Any, Iterable, Iterator, Optional
+
+from flask import Response
+
+# Many of the pieces produced by the encoder are tiny (single tokens), so they are grouped before being sent
+RESPONSE_CHUNK_SIZE = 64 * 1024
+
+# The number of levels of containers that are always encoded piece by piece
+STREAMING_DEPTH = 3
+
+
+def encode_float(value: float) -> str:
+    """Represent non-finite values as `null` instead of the non-standard `NaN` and `Infinity` literals."""
+    if math.isnan(value) or math.isinf(value):
+        return "null"
+    return float.__repr__(value)
+
+
+class GuideJSONEncoder(json.JSONEncoder):
+    """
+    A single JSON encoder for all results returned by the NeuroConv endpoints.
+
+    Combines the behavior of the NeuroConv `NWBMetaDataEncoder` (numpy types, datetimes, paths) and the NWB Inspector
+    `InspectorOutputJSONEncoder` (messages, enums, versions), and writes NaN and infinite values as `null` so that
+    results never have to be cleaned up in an additional pass before serialization. Indentation is not supported.
+    """
+
+    def default(self, obj: Any) -> Any:
+        import numpy as np
+
+        if isinstance(obj, np.ndarray):
+            return obj.tolist()
+
+        if isinstance(obj, np.generic):
+            return obj.item()
+
+        if isinstance(obj, np.dtype):
+            return str(obj)
+
+        if isinstance(obj, (datetime, date)):
+            return obj.isoformat()
+
+        if isinstance(obj, PurePath):
+            return str(obj)
+
+        if isinstance(obj, Enum):
+            return obj.name
+
+        if isinstance(obj, (set, frozenset)):
+            return list(obj)
+
+        from nwbinspector import InspectorMessage
+        from packaging.version import Version
+
+        if isinstance(obj, InspectorMessage):
+            return obj.__dict__
+
+        if isinstance(obj, Version):
+            return str(obj)
+
+        return super().default(obj)
+
+    def iterencode(self, obj: Any, _one_shot: bool = False) -> Iterator[str]:
+        """
+        Encode an object into a compact JSON representation, piece by piece.
+
+        The first `STREAMING_DEPTH` levels of containers are always walked in Python, so that the body is produced in
+        pieces. Anything deeper is encoded at once by the (much faster) C encoder of the standard library, which does
+        not allow replacing NaN: if a container turns out to hold a non-finite value, its items are walked instead.
+        """
+        finite_encoder = json.JSONEncoder(
+            skipkeys=self.skipkeys,
+            ensure_ascii=self.ensure_ascii,
+            check_circular=self.check_circular,
+            allow_nan=False,
+            sort_keys=self.sort_keys,
+            separators=(self.item_separator, self.key_separator),
+            default=self.default,
+        )
+        encode_string = json.encoder.encode_basestring_ascii if self.ensure_ascii else json.encoder.encode_basestring
+
+        def encode_key(key: Any) -> Optional[str]:
+            if isinstance(key, str):
+                return key
+            if isinstance(key, float):
+                return encode_float(key)
+            if key is True:
+                return "true"
+            if key is False:
+                return "false"
+            if key is None:
+                return "null"
+            if isinstance(key, int):
+                return int.__repr__(key)
+            if self.skipkeys:
+                return None
+            raise TypeError(f"keys must be str, int, float, bool or None, not {key.__class__.__name__}")
+
+        def encode_recursive(obj: Any, depth: int) -> Iterator[str]:
+            if isinstance(obj, float):
+                yield encode_float(obj)
+                return
+
+            is_container = isinstance(obj, (dict, list, tuple))
+            if not is_container or depth >= STREAMING_DEPTH:
+                try:
+                    yield finite_encoder.encode(obj)
+                    return
+                except ValueError:
+                    pass  # Contains a non-finite value
+
+            if isinstance(obj, dict):
+                yield "{"
+                first = True
+                items = sorted(obj.items()) if self.sort_keys else obj.items()
+                for key, value in items:
+                    key = encode_key(key)
+                    if key is None:
+                        continue
+
+                    if not first:
+                        yield self.item_separator
+                    first = False
+
+                    yield encode_string(key)
+                    yield self.key_separator
+                    yield from encode_recursive(value, depth=depth + 1)
+                yield "}"
+            elif isinstance(obj, (list, tuple)):
+                yield "["
+                for index, item in enumerate(obj):
+                    if index:
+                        yield self.item_separator
+                    yield from encode_recursive(item, depth=depth + 1)
+                yield "]"
+            else:
+                yield from encode_recursive(self.default(obj), depth=depth)
+
+        return encode_recursive(obj, depth=0)
+
+
+def iterencode_json(obj: Any, chunk_size: int = RESPONSE_CHUNK_SIZE) -> Iterator[str]:
+    """Encode an object as JSON, yielding chunks of (approximately) the specified number of characters."""
+    chunks = list()
+    size = 0
+    for chunk in GuideJSONEncoder(separators=(",", ":")).iterencode(obj):
+        chunks.append(chunk)
+        size += len(chunk)
+        if size >= chunk_size:
+            yield "".join(chunks)
+            chunks.clear()
+            size = 0
+
+    if chunks:
+        yield "".join(chunks)
+
+
+def encode_json(obj: Any) -> str:
+    """Encode an object as a JSON string."""
+    return "".join(iterencode_json(obj))
+
+
+def json_response(obj: Any, status: int = 200, stream: bool = False) -> Response:
+    """
+    Serialize the result of an endpoint directly into the body of a JSON response.
+
+    By default, the body is encoded before the response is created, so that unsupported types raise within the endpoint
+    and are reported by the error handler. When streaming, the body is encoded while it is being sent, so neither a copy
+    of the result nor the full JSON text is ever held in memory; an unsupported type then truncates a response that has
+    already started with its status. Only stream results whose types are known to be supported (e.g. parsed JSON).
+    """
+    body: Iterable[str] = iterencode_json(obj) if stream else encode_json(obj)
+    return Response(body, status=status, mimetype="application/json")
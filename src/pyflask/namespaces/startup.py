@@ -1,6 +1,9 @@
 """API endpoint definitions for startup operations."""
 
 from flask_restx import Namespace, Resource
+from manageNeuroconv import warm_up
+from manageNeuroconv.warmup import INSPECTOR_STAGE
+from startup_profiler import startup_profiler
 
 startup_namespace = Namespace("startup", description="API for startup commands related to the NWB GUIDE.")
 
@@ -19,9 +22,21 @@ class Echo(Resource):
     @startup_namespace.expect(parser)
     def get(self):
         args = parser.parse_args()
+        startup_profiler.mark("first echo", once=True)
         return args["arg"]
 
 
+def on_warm_up_stage_complete(name: str, stage: dict) -> None:
+    startup_profiler.mark(f"warm-up stage '{name}' {stage['status']}")
+
+    # The startup timeline covers everything up to the last stage scheduled on startup
+    if name == INSPECTOR_STAGE:
+        startup_profiler.finish()
+
+
+warm_up.add_listener(on_warm_up_stage_complete)
+
+
 @startup_namespace.route("/preload-imports")
 class PreloadImports(Resource):
     """
@@ -30,10 +45,75 @@ class PreloadImports(Resource):
     Python caches all modules that have been imported at least once in the same kernel,
     even if their namespace is not always exposed to a given scope. This means that later imports
     simply expose the cached namespaces to their scope instead of retriggering the entire import.
+
+    The warm-up runs in stages on a background thread; this request only waits for the core libraries,
+    while the remaining stages can be tracked through `/startup/readiness`.
     """
 
     @startup_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
     def get(self):
-        import neuroconv
+        startup_profiler.mark("preload imports requested", once=True)
+
+        stage = warm_up.start().result()
+        if stage["status"] != "ready":
+            raise RuntimeError(f"Unable to preload the core libraries: {stage['error']}")
 
         return True
+
+
+warmup_parser = startup_namespace.parser()
+warmup_parser.add_argument(
+    "interfaces",
+    type=str,
+    action="split",
+    required=True,
+    help="Comma-separated names of the interfaces or converters used by the open project",
+    location="args",
+)
+
+
+@startup_namespace.route("/readiness")
+class Readiness(Resource):
+    """Report the status and timing of each warm-up stage, so that pages can be enabled as they become ready."""
+
+    @startup_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
+    def get(self):
+        return warm_up.get_readiness()
+
+
+@startup_namespace.route("/warmup")
+class WarmUpInterfaces(Resource):
+    """Warm up the format-specific modules for the interfaces of the open project in the background."""
+
+    @startup_namespace.expect(warmup_parser)
+    @startup_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
+    def post(self):
+        args = warmup_parser.parse_args()
+        warm_up.warm_interfaces(args["interfaces"])
+        return warm_up.get_readiness()
+
+
+timeline_parser = startup_namespace.parser()
+timeline_parser.add_argument(
+    "top",
+    type=int,
+    required=False,
+    help="Only return the modules with the highest cumulative import time",
+    location="args",
+)
+
+
+@startup_namespace.route("/timeline")
+class Timeline(Resource):
+    """
+    Report the startup timeline of the backend.
+
+    This includes the per-module import timeline (similar to `python -X importtime`) and wall-clock markers for each
+    phase of the startup sequence. The full timeline is also written to the log folder once startup completes.
+    """
+
+    @startup_namespace.expect(timeline_parser)
+    @startup_namespace.doc(responses={200: "Success", 400: "Bad Request", 500: "Internal server error"})
+    def get(self):
+        args = timeline_parser.parse_args()
+        return startup_profiler.get_timeline(top=args.get("top"))
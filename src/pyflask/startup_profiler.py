@@ -0,0 +1,236 @@
+"""
+In-process startup profiler for the Python backend.
+
+This module must stay free of third-party imports, since it is imported first by `app.py` in order to observe
+everything that is imported afterwards. It records two things:
+
+- A per-module import timeline (equivalent to `python -X importtime`, but captured in-process so that it also works
+  inside the PyInstaller build), with the cumulative and self time spent executing each module.
+- Wall-clock phase markers placed at notable points of the startup sequence.
+"""
+
+import json
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+
+class _TimedLoader:
+    """Proxy around a module loader that times the execution of the module it loads."""
+
+    def __init__(self, loader, profiler: "StartupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def __getattr__(self, name):
+        return getattr(self._loader, name)
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        # Restore the original loader so that nothing downstream (e.g. `pkg_resources` adapters) ever sees the proxy
+        spec = getattr(module, "__spec__", None)
+        if spec is not None and spec.loader is self:
+            spec.loader = self._loader
+        if getattr(module, "__loader__", None) is self:
+            module.__loader__ = self._loader
+
+        self._profiler._enter_import(module.__name__)
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler._exit_import()
+
+
+class _ImportTimer:
+    """A `sys.meta_path` finder that wraps the loader found by all other finders."""
+
+    def __init__(self, profiler: "StartupProfiler"):
+        self._profiler = profiler
+        self._local = threading.local()
+
+    def find_spec(self, fullname, path=None, target=None):
+        # Avoid recursing into ourselves while delegating to the remaining finders
+        if getattr(self._local, "searching", False):
+            return None
+
+        self._local.searching = True
+        try:
+            for finder in sys.meta_path:
+                if finder is self:
+                    continue
+
+                find_spec = getattr(finder, "find_spec", None)
+                if find_spec is None:
+                    continue
+
+                spec = find_spec(fullname, path, target)
+                if spec is None:
+                    continue
+
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = _TimedLoader(spec.loader, self._profiler)
+
+                return spec
+        finally:
+            self._local.searching = False
+
+        return None
+
+
+class StartupProfiler:
+    """Collects the import timeline and phase markers of the backend process."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._finder = None
+
+        self.started_at = datetime.now()
+        self._start_time = time.perf_counter()
+        self._start_wall_time = time.time()
+
+        self.imports: List[Dict[str, Union[str, float, int]]] = []
+        self.phases: List[Dict[str, Union[str, float]]] = []
+        self.finished = False
+
+        # Configured by the application once the log folder and release version are known
+        self.log_folder_path: Optional[Path] = None
+        self.version: Optional[str] = None
+
+    @property
+    def elapsed(self) -> float:
+        return time.perf_counter() - self._start_time
+
+    @property
+    def is_recording_imports(self) -> bool:
+        return self._finder is not None
+
+    def start(self) -> None:
+        """Begin recording the import timeline."""
+        if self._finder is not None:
+            return
+
+        self._finder = _ImportTimer(self)
+        sys.meta_path.insert(0, self._finder)
+
+    def stop(self) -> None:
+        """Stop recording the import timeline; phase markers can still be added."""
+        if self._finder is None:
+            return
+
+        if self._finder in sys.meta_path:
+            sys.meta_path.remove(self._finder)
+        self._finder = None
+
+    def mark(self, name: str, once: bool = False) -> None:
+        """Add a wall-clock phase marker relative to the creation of the profiler."""
+        with self._lock:
+            if once and any(phase["name"] == name for phase in self.phases):
+                return
+
+            self.phases.append(dict(name=name, time=round(self.elapsed, 6), thread=threading.current_thread().name))
+
+    def _enter_import(self, module_name: str) -> None:
+        stack = self._local.__dict__.setdefault("stack", [])
+        stack.append([module_name, time.perf_counter(), 0.0])
+
+    def _exit_import(self) -> None:
+        stack = self._local.stack
+        module_name, start, children = stack.pop()
+
+        cumulative = time.perf_counter() - start
+        if stack:
+            stack[-1][2] += cumulative
+
+        with self._lock:
+            self.imports.append(
+                dict(
+                    module=module_name,
+                    start=round(start - self._start_time, 6),
+                    cumulative=round(cumulative, 6),
+                    self=round(cumulative - children, 6),
+                    depth=len(stack),
+                    thread=threading.current_thread().name,
+                )
+            )
+
+    def get_process_launch_offset(self) -> Optional[float]:
+        """Seconds between the launch of the process and the creation of this profiler, if available."""
+        try:
+            import psutil
+
+            return round(self._start_wall_time - psutil.Process(os.getpid()).create_time(), 6)
+        except Exception:
+            return None
+
+    def get_timeline(self, top: Optional[int] = None) -> dict:
+        """
+        Summarize the startup timeline.
+
+        Parameters
+        ----------
+        top : int, optional
+            If specified, only include the modules with the highest cumulative import time.
+            By default, all imports are returned in the order they finished.
+        """
+        with self._lock:
+            imports = list(self.imports)
+            phases = list(self.phases)
+
+        top_level_import_time = sum(entry["cumulative"] for entry in imports if entry["depth"] == 0)
+        number_of_imports = len(imports)
+
+        if top is not None:
+            imports = sorted(imports, key=lambda entry: entry["cumulative"], reverse=True)[:top]
+
+        return dict(
+            started_at=self.started_at.isoformat(),
+            process_launch_offset=self.get_process_launch_offset(),
+            version=self.version,
+            elapsed=round(self.elapsed, 6),
+            finished=self.finished,
+            recording_imports=self.is_recording_imports,
+            total_import_time=round(top_level_import_time, 6),
+            number_of_imports=number_of_imports,
+            python_version=sys.version,
+            frozen=hasattr(sys, "_MEIPASS"),
+            phases=phases,
+            imports=imports,
+        )
+
+    def save(self, folder_path: Union[str, Path, None] = None) -> Path:
+        """Write the full timeline to a JSON file in the specified folder (defaults to the log folder)."""
+        folder_path = Path(folder_path or self.log_folder_path)
+        folder_path.mkdir(exist_ok=True, parents=True)
+
+        timeline = self.get_timeline()
+
+        timestamp = self.started_at.strftime("%Y-%m-%d_%H-%M-%S")
+        file_path = folder_path / f"{timestamp}_startup_timeline.json"
+        with open(file=file_path, mode="w") as fp:
+            json.dump(obj=timeline, fp=fp, indent=2)
+
+        return file_path
+
+    def finish(self) -> Optional[Path]:
+        """Mark the end of startup, stop recording imports, and save the timeline if a log folder is configured."""
+        with self._lock:
+            if self.finished:
+                return None
+            self.finished = True
+
+        self.mark("startup complete")
+        self.stop()
+
+        if self.log_folder_path is not None:
+            return self.save()
+
+
+startup_profiler = StartupProfiler()
+startup_profiler.start()
@@ -22,6 +22,26 @@ def client(request):
         return app.test_client()
 
 
+@pytest.fixture(scope="session")
+def spikeglx_phy_info(tmp_path_factory):
+    """The source data and interfaces of a SpikeGLX + Phy session from the generated tutorial data."""
+    from manageNeuroconv import generate_test_data
+
+    output_path = tmp_path_factory.mktemp("tutorial_data")
+    generate_test_data(output_path=str(output_path))
+
+    return dict(
+        source_data=dict(
+            SpikeGLX=dict(
+                folder_path=str(output_path / "spikeglx" / "Session1_g0" / "Session1_g0_imec0"),
+                stream_id="imec0.ap",
+            ),
+            Phy=dict(folder_path=str(output_path / "phy")),
+        ),
+        interfaces=dict(SpikeGLX="SpikeGLXRecordingInterface", Phy="PhySortingInterface"),
+    )
+
+
 @pytest.fixture()
 def runner(app):
     return app.test_cli_runner()
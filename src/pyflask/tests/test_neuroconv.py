@@ -1,3 +1,5 @@
+import json
+
 from jsonschema import validate
 from utils import get, get_converter_output_schema, post
 
@@ -37,3 +39,802 @@ def test_multiple_schema_request(client):
     interfaces = {"myname": "SpikeGLXRecordingInterface", "myphyinterface": "PhySortingInterface"}
     data = post("/neuroconv/schema", interfaces, client)
     validate(data, schema=get_converter_output_schema(interfaces))
+
+
+def test_interface_catalog_snapshot(client):
+    """The interface catalog is persisted per NeuroConv version and served from that snapshot."""
+    from manageNeuroconv.manage_neuroconv import (
+        INTERFACE_CATALOG_FOLDER_PATH,
+        get_all_converter_info,
+        get_all_interface_info,
+    )
+
+    catalog = get("neuroconv", client)
+    assert catalog == json.loads(json.dumps({**get_all_interface_info(), **get_all_converter_info()}))
+
+    snapshots = list(INTERFACE_CATALOG_FOLDER_PATH.glob("neuroconv-*.json"))
+    assert len(snapshots) == 1
+
+
+def test_source_schema_cache(client):
+    """Source schemas are cached in memory and on disk, along with their resolved form."""
+    from manageNeuroconv.manage_neuroconv import (
+        SOURCE_SCHEMA_CACHE_FOLDER_PATH,
+        get_source_schema,
+        source_schema_cache,
+    )
+
+    interfaces = {"myname": "SpikeGLXRecordingInterface", "myphyinterface": "PhySortingInterface"}
+    schema = post("/neuroconv/schema", interfaces, client)
+
+    hits = source_schema_cache.hits
+    assert get_source_schema(dict(interfaces)) == schema
+    assert source_schema_cache.hits == hits + 1
+
+    # The forms of the interfaces are shown in the order of the schema
+    reversed_schema = get_source_schema(dict(reversed(interfaces.items())))
+    assert list(reversed_schema["properties"]) == ["myphyinterface", "myname"]
+
+    resolved = get_source_schema(interfaces, resolved=True)
+    assert "$ref" not in json.dumps(resolved)
+
+    cached_entries = [json.loads(path.read_text()) for path in SOURCE_SCHEMA_CACHE_FOLDER_PATH.glob("*.json")]
+    assert any(entry["schema"] == schema and entry["resolved"] == resolved for entry in cached_entries)
+
+
+def test_custom_converter_class_reuse():
+    """The same converter class is reused for the same (ordered) interfaces, independently of each instance."""
+    from manageNeuroconv.manage_neuroconv import get_custom_converter
+
+    interfaces = {"myname": "SpikeGLXRecordingInterface", "myphyinterface": "PhySortingInterface"}
+    CustomNWBConverter = get_custom_converter(interfaces)
+
+    assert get_custom_converter(dict(interfaces)) is CustomNWBConverter
+
+    # Metadata is merged and data is written in the order of the interfaces
+    ReversedNWBConverter = get_custom_converter(dict(reversed(interfaces.items())))
+    assert list(ReversedNWBConverter.data_interface_classes) == ["myphyinterface", "myname"]
+    assert get_custom_converter({"myname": "SpikeGLXRecordingInterface"}) is not CustomNWBConverter
+
+
+def test_resolve_references_shares_subschemas_and_stops_on_cycles():
+    """Repeated references resolve to a shared subschema, and recursive definitions do not loop forever."""
+    from manageNeuroconv.schemas import resolve_references
+
+    schema = {
+        "type": "object",
+        "properties": {
+            "first": {"$ref": "#/definitions/Device"},
+            "second": {"$ref": "#/definitions/Device"},
+            "tree": {"$ref": "#/$defs/Node"},
+        },
+        "definitions": {"Device": {"type": "object", "properties": {"name": {"type": "string"}}}},
+        "$defs": {"Node": {"type": "object", "properties": {"children": {"items": {"$ref": "#/$defs/Node"}}}}},
+    }
+    original = json.loads(json.dumps(schema))
+
+    resolved = resolve_references(schema)
+
+    assert schema == original  # The input is never modified
+    assert resolved["properties"]["first"] == schema["definitions"]["Device"]
+    assert resolved["properties"]["first"] is resolved["properties"]["second"]
+
+    children = resolved["properties"]["tree"]["properties"]["children"]
+    assert children["items"] == {"$ref": "#/$defs/Node"}
+
+
+def test_replace_none_with_nan_uses_cached_plan():
+    """Payloads are coerced on a copy, and the compiled plan is reused for identical schemas."""
+    import math
+
+    from manageNeuroconv.manage_neuroconv import replace_none_with_nan
+    from manageNeuroconv.schemas import coercion_plan_cache
+
+    schema = {
+        "type": "object",
+        "properties": {
+            "Ecephys": {
+                "type": "object",
+                "patternProperties": {"^Electrodes": {"type": "array", "items": {"$ref": "#/definitions/Row"}}},
+            },
+            "rate": {"type": "number"},
+        },
+        "definitions": {"Row": {"type": "object", "properties": {"x": {"type": "number"}}}},
+    }
+    payload = {"Ecephys": {"Electrodes": [{"x": None}, {"x": "2"}]}, "rate": "NaN", "name": "NaN"}
+
+    misses = coercion_plan_cache.misses
+    coerced = replace_none_with_nan(payload, schema, nan_strings=True)
+    replace_none_with_nan(payload, json.loads(json.dumps(schema)))
+
+    assert coercion_plan_cache.misses == misses + 1
+    assert payload["Ecephys"]["Electrodes"][0]["x"] is None  # The input is never modified
+    assert math.isnan(coerced["Ecephys"]["Electrodes"][0]["x"])
+    assert coerced["Ecephys"]["Electrodes"][1]["x"] == 2.0
+    assert math.isnan(coerced["rate"]) and math.isnan(coerced["name"])
+
+
+def test_json_response_encoding():
+    """Results are encoded in a single pass, with numpy types converted and non-finite values written as null."""
+    import math
+    from pathlib import Path
+
+    import numpy as np
+    from namespaces.responses import encode_json
+
+    result = dict(
+        table=[{"row": {"cells": {"values": np.array([1.5, np.nan]), "count": np.int64(2)}}}],
+        path=Path("file.nwb"),
+        missing=math.nan,
+        pair=(np.float32(np.inf), "NaN"),
+    )
+
+    assert json.loads(encode_json(result)) == dict(
+        table=[{"row": {"cells": {"values": [1.5, None], "count": 2}}}],
+        path="file.nwb",
+        missing=None,
+        pair=[None, "NaN"],
+    )
+
+
+def test_json_response_reports_unsupported_types():
+    """Responses are encoded eagerly by default, so that unsupported types raise before the status is sent."""
+    import pytest
+    from namespaces.responses import json_response
+
+    with pytest.raises(TypeError):
+        json_response(dict(value=object()))
+
+    response = json_response(dict(value=object()), stream=True)  # Only fails once the body is iterated
+    assert response.status_code == 200
+    with pytest.raises(TypeError):
+        response.get_data()
+
+
+def test_snapshot_writer_rotates_files(tmp_path):
+    """Sampled snapshots are written in the background, keeping only the most recent files."""
+    from manageNeuroconv.snapshots import SnapshotWriter
+
+    assert not SnapshotWriter(folder_path=tmp_path, sample_rate=0).should_sample()
+
+    writer = SnapshotWriter(folder_path=tmp_path, sample_rate=1, max_files=4, max_queue_size=16)
+    assert writer.should_sample()
+
+    for index in range(5):
+        assert writer.submit("metadata", dict(schema=dict(index=index), results=dict(index=index)))
+    writer.flush()
+
+    file_paths = sorted(tmp_path.glob("*.json"))
+    assert len(file_paths) == 4
+    assert json.loads(file_paths[-1].read_text()) == dict(index=4)
+    assert writer.info()["written"] == 5
+
+
+def test_converter_cache(client, spikeglx_phy_info):
+    """Converters are reused across requests until their source files change or the cache is invalidated."""
+    import os
+
+    from manageNeuroconv.manage_neuroconv import converter_cache
+
+    converter_cache.clear()
+    hits = converter_cache.hits
+
+    first = post("/neuroconv/metadata", spikeglx_phy_info, client)
+    second = post("/neuroconv/metadata", spikeglx_phy_info, client)
+    assert first["results"]["Ecephys"] == second["results"]["Ecephys"]
+    assert converter_cache.hits == hits + 1
+
+    # A repeated alignment is only applied once to the cached converter
+    alignment_info = dict(spikeglx_phy_info, alignment=dict(SpikeGLX=dict(selected="start", values=dict(start=10.0))))
+    first = post("/neuroconv/alignment", alignment_info, client)
+    second = post("/neuroconv/alignment", alignment_info, client)
+    assert first["timestamps"]["SpikeGLX"]["first"] == second["timestamps"]["SpikeGLX"]["first"] == 10.0
+
+    # Modifying a source file invalidates the entry
+    phy_folder_path = spikeglx_phy_info["source_data"]["Phy"]["folder_path"]
+    params_file_path = os.path.join(phy_folder_path, "params.py")
+    os.utime(params_file_path, ns=(0, os.stat(params_file_path).st_mtime_ns + 1))
+    misses = converter_cache.misses
+    post("/neuroconv/metadata", spikeglx_phy_info, client)
+    assert converter_cache.misses == misses + 1
+
+    size = len(converter_cache)
+    assert client.delete("/neuroconv/cache").json["removed"] == size > 0
+    assert get("neuroconv/cache", client)["converters"]["size"] == 0
+
+
+def test_converter_release(client, spikeglx_phy_info, tmp_path):
+    """Converters are released once idle, or once their source files have been converted."""
+    import time
+
+    from manageNeuroconv.caching import LRUCache
+    from manageNeuroconv.manage_neuroconv import (
+        converter_cache,
+        invalidate_converter_cache,
+    )
+
+    cache = LRUCache(max_idle_time=0.05)
+    cache.set("idle", 1)
+    time.sleep(0.1)
+    cache.set("used", 2)
+    assert cache.items() == [("used", 2)]
+    assert cache.get("idle") is None and cache.evictions == 1
+
+    converter_cache.clear()
+    post("/neuroconv/metadata", spikeglx_phy_info, client)
+    assert len(converter_cache) == 1
+
+    assert invalidate_converter_cache(source_data=dict(Phy=dict(folder_path=str(tmp_path)))) == 0
+    assert invalidate_converter_cache(source_data=spikeglx_phy_info["source_data"]) == 1
+    assert len(converter_cache) == 0
+
+
+def test_columnar_tables(client, spikeglx_phy_info):
+    """Columnar electrode and unit tables hold the same rows, and are accepted wherever rows are."""
+    from manageNeuroconv.manage_neuroconv import (
+        get_metadata_with_table_rows,
+        get_table_rows,
+    )
+
+    rows = post("/neuroconv/metadata", spikeglx_phy_info, client)["results"]
+    columnar = post("/neuroconv/metadata", dict(spikeglx_phy_info, table_format="columnar"), client)["results"]
+
+    for key in ("Electrodes", "Units"):
+        for name, table in columnar["Ecephys"][key].items():
+            assert len(table["columns"]) == len(table["data_types"]) == len(table["values"])
+            assert get_table_rows(table) == rows["Ecephys"][key][name]
+
+    converted = get_metadata_with_table_rows(columnar)
+    assert converted["Ecephys"]["Electrodes"] == rows["Ecephys"]["Electrodes"]
+    assert converted["Ecephys"]["Units"] == rows["Ecephys"]["Units"]
+    assert "columns" in columnar["Ecephys"]["Electrodes"]["SpikeGLX"]  # The input is never modified
+    assert get_metadata_with_table_rows(rows) is rows
+
+    response = client.post("/neuroconv/metadata", json=dict(spikeglx_phy_info, table_format="cells"))
+    assert response.status_code >= 400
+
+
+def test_table_windows(client, spikeglx_phy_info):
+    """Table summaries only describe the tables, whose rows are then served in sorted and filtered windows."""
+    from manageNeuroconv.manage_neuroconv import get_metadata_with_table_rows
+
+    rows = post("/neuroconv/metadata", spikeglx_phy_info, client)["results"]["Ecephys"]["Electrodes"]["SpikeGLX"]
+    summary = post("/neuroconv/metadata", dict(spikeglx_phy_info, table_format="summary"), client)["results"]
+    assert summary["Ecephys"]["Electrodes"]["SpikeGLX"]["row_count"] == len(rows)
+    assert "values" not in summary["Ecephys"]["Electrodes"]["SpikeGLX"]
+
+    converted = get_metadata_with_table_rows(summary)  # Unedited tables are left to the interfaces
+    assert converted["Ecephys"]["Electrodes"] == converted["Ecephys"]["Units"] == {}
+
+    window_info = dict(spikeglx_phy_info, table="electrodes", interface="SpikeGLX", offset=2, limit=3)
+    window = post("/neuroconv/table", window_info, client)
+    assert window["row_count"] == window["filtered_row_count"] == len(rows)
+    assert window["indices"] == [2, 3, 4]
+    assert window["rows"] == rows[2:5]
+
+    sorted_rows = sorted(rows, key=lambda row: row["channel_name"], reverse=True)
+    window = post("/neuroconv/table", dict(window_info, sort_by="channel_name", descending=True), client)
+    assert window["rows"] == sorted_rows[2:5]
+
+    window = post("/neuroconv/table", dict(window_info, offset=0, filters=dict(channel_name="ap1")), client)
+    matching_rows = [row for row in rows if "ap1" in row["channel_name"].lower()]
+    assert window["filtered_row_count"] == len(matching_rows)
+    assert window["rows"] == matching_rows[:3]
+
+    response = client.post("/neuroconv/table", json=dict(window_info, sort_by="unknown"))
+    assert response.status_code >= 400
+
+    # As on the metadata page, which requests the rows of each summarized table one page at a time
+    page_info = dict(spikeglx_phy_info, table="electrodes", interface="SpikeGLX", limit=50)
+    row_count = summary["Ecephys"]["Electrodes"]["SpikeGLX"]["row_count"]
+    pages = [post("/neuroconv/table", dict(page_info, offset=offset), client) for offset in range(0, row_count, 50)]
+    assert [row for page in pages for row in page["rows"]] == rows
+    assert all(page["row_count"] == row_count for page in pages)
+
+    mixed = post("/neuroconv/metadata", dict(spikeglx_phy_info, table_format=dict(units="summary")), client)["results"]
+    assert mixed["Ecephys"]["Electrodes"]["SpikeGLX"] == rows
+    assert mixed["Ecephys"]["Units"]["Phy"] == summary["Ecephys"]["Units"]["Phy"]
+
+    response = client.post("/neuroconv/metadata", json=dict(spikeglx_phy_info, table_format=dict(spikes="summary")))
+    assert response.status_code >= 400
+
+
+def test_timestamp_summaries(client, spikeglx_phy_info):
+    """Only summaries of the timestamps are returned for the alignment, with full-resolution windows on request."""
+    import numpy as np
+    import pytest
+    from manageNeuroconv.timestamps import get_timestamp_summary
+
+    timestamps = np.concatenate([np.arange(1000) / 100.0, 20.0 + np.arange(500) / 100.0])
+    summary = get_timestamp_summary(timestamps, max_bins=64, min_bins=8)
+    assert (summary["count"], summary["first"], summary["last"]) == (1500, 0.0, timestamps[-1])
+    assert summary["interval"] == pytest.approx(0.01) and summary["rate"] is None  # Not regular, due to the gap
+    assert summary["gaps"] == [dict(index=1000, start=9.99, stop=20.0)] and summary["gap_count"] == 1
+    assert [len(level["min"]) for level in summary["levels"]] == [8, 16, 32, 63]
+    assert summary["levels"][0]["min"][0] == 0.0 and summary["levels"][0]["max"][-1] == timestamps[-1]
+
+    assert get_timestamp_summary(timestamps[:1000])["rate"] == pytest.approx(100.0)
+    assert get_timestamp_summary(None)["count"] == 0
+
+    alignment = post("/neuroconv/alignment", spikeglx_phy_info, client)
+    summary = alignment["timestamps"]["SpikeGLX"]
+    assert summary["count"] > 0 and summary["rate"] is not None and summary["gap_count"] == 0
+    assert alignment["timestamps"]["Phy"]["count"] == 0
+
+    window_info = dict(spikeglx_phy_info, interface="SpikeGLX", offset=10, limit=5)
+    window = post("/neuroconv/alignment/timestamps", window_info, client)
+    assert window["count"] == summary["count"] and window["offset"] == 10
+    assert np.allclose(window["timestamps"], summary["first"] + np.arange(10, 15) / summary["rate"])
+
+    start_time = window["timestamps"][2]
+    del window_info["offset"]
+    window = post("/neuroconv/alignment/timestamps", dict(window_info, start_time=start_time), client)
+    assert window["offset"] == 12 and window["timestamps"][0] == start_time and len(window["timestamps"]) == 5
+
+
+def test_compatibility_matrix(client, spikeglx_phy_info):
+    """Recording and sorting interfaces are only checked for compatibility once per source files."""
+    from manageNeuroconv.manage_neuroconv import (
+        compatibility_cache,
+        get_compatibility_matrix,
+    )
+
+    compatibility_cache.clear()
+
+    first = post("/neuroconv/alignment", spikeglx_phy_info, client)
+    second = post("/neuroconv/alignment", dict(spikeglx_phy_info, alignment=dict()), client)
+    assert first["metadata"]["Phy"]["compatible"] == second["metadata"]["Phy"]["compatible"] == ["SpikeGLX"]
+    assert "compatible" not in first["metadata"]["SpikeGLX"]
+
+    assert first["compatibility"]["cached"] is False and second["compatibility"]["cached"] is True
+    assert list(first["compatibility"]["timings"]) == ["Phy"]
+    assert first["compatibility"]["timings"]["Phy"]["SpikeGLX"] >= 0
+
+    # The order of the interfaces is part of the key, as for the converters
+    reversed_info = dict(spikeglx_phy_info, interfaces=dict(reversed(spikeglx_phy_info["interfaces"].items())))
+    assert get_compatibility_matrix(spikeglx_phy_info)["cached"] is False
+    assert get_compatibility_matrix(reversed_info)["cached"] is False
+    assert get_compatibility_matrix(reversed_info)["cached"] is True
+
+
+def test_regular_rate_alignment(client, spikeglx_phy_info, tmp_path):
+    """Regular timestamps of recordings are replaced by a starting time, so that they are never written in full."""
+    import numpy as np
+    from manageNeuroconv.timestamps import is_regular_grid
+
+    def align(**alignment):
+        return post("/neuroconv/alignment", dict(spikeglx_phy_info, alignment=alignment), client)
+
+    report = align(SpikeGLX=dict(selected="start", values=dict(start=2.0)))["regular_rates"]["SpikeGLX"]
+    assert report["regular"] is True and report["starting_time"] == 2.0 and report["rate"] == 30000.0
+
+    count = report["saved_bytes"] // 8
+    timestamps = 3.0 + np.arange(count) / 30000.0
+    jittered_timestamps = timestamps + np.random.default_rng(0).uniform(-0.1, 0.1, count) / 30000.0
+    assert is_regular_grid(timestamps, rate=30000.0) and not is_regular_grid(jittered_timestamps, rate=30000.0)
+
+    for file_name, array, is_regular in [
+        ("regular.npy", timestamps, True),
+        ("jittered.npy", jittered_timestamps, False),
+    ]:
+        np.save(tmp_path / file_name, array)
+        alignment = align(SpikeGLX=dict(selected="timestamps", values=dict(timestamps=str(tmp_path / file_name))))
+        assert alignment["errors"] == dict()
+        assert alignment["regular_rates"]["SpikeGLX"]["regular"] is is_regular
+        assert alignment["timestamps"]["SpikeGLX"]["first"] == array[0]
+        assert alignment["timestamps"]["SpikeGLX"]["count"] == count
+
+
+def test_backend_configuration_cache(client, spikeglx_phy_info):
+    """Default backend configurations are computed once per converter and metadata shape; overrides apply to copies."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from manageNeuroconv.manage_neuroconv import (
+        backend_configuration_cache,
+        get_metadata_shape,
+        update_backend_configuration,
+    )
+
+    metadata = post("/neuroconv/metadata", spikeglx_phy_info, client)["results"]
+    metadata["NWBFile"]["session_start_time"] = "2024-01-01T10:00:00"
+    metadata["Subject"] = dict(subject_id="mouse", species="Mus musculus", sex="M", age="P30D")
+    info = dict(spikeglx_phy_info, metadata=metadata, nwbfile_path="cache.nwb", project_name="cache", timezone="UTC")
+
+    backend_configuration_cache.clear()
+    hits, misses = backend_configuration_cache.hits, backend_configuration_cache.misses
+
+    default = post("/neuroconv/configuration", info, client)["results"]
+    metadata["NWBFile"]["session_description"] = "Only the names of objects are part of the metadata shape."
+    assert post("/neuroconv/configuration", info, client)["results"] == default
+    assert (backend_configuration_cache.hits, backend_configuration_cache.misses) == (hits + 1, misses + 1)
+
+    location = "acquisition/ElectricalSeriesAP/data"
+    assert default[location]["compression_method"] == "gzip"
+    overrides = dict(backend="hdf5", results=dict(hdf5={location: dict(compression_method="lzf")}))
+    assert post("/neuroconv/configuration", dict(info, configuration=overrides), client)["results"][location] == dict(
+        default[location], compression_method="lzf"
+    )
+    assert post("/neuroconv/configuration", info, client)["results"] == default
+
+    # Concurrent requests share the cached converter, whose data is only added to an NWB file by one of them
+    backend_configuration_cache.clear()
+    misses = backend_configuration_cache.misses
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(lambda _: update_backend_configuration(info), range(4)))
+    assert all(result == results[0] for result in results)
+    assert len(backend_configuration_cache) == 1
+
+    shape = get_metadata_shape(dict(Ecephys=dict(Device=[dict(name="Neuropixels", description="A probe")])))
+    assert shape == dict(Ecephys=dict(Device=[dict(name="Neuropixels", description="str")]))
+
+
+def test_load_timestamps(tmp_path):
+    """Timestamp files are memory-mapped, and text files are only parsed once (within the size of their cache)."""
+    import numpy as np
+    import pytest
+    from manageNeuroconv.timestamps import TimestampCache, load_timestamps
+
+    timestamps = 5.0 + np.arange(1000) / 30000.0
+    cache = TimestampCache(folder_path=tmp_path / "cache", max_bytes=10_000)
+
+    text_file_path = tmp_path / "timestamps.txt"
+    text_file_path.write_text("\n".join(map(repr, timestamps.tolist())) + "\n")
+    loaded = load_timestamps(text_file_path, cache=cache)
+    assert np.array_equal(loaded, timestamps)
+    assert cache.info()["size"] == 1
+
+    # Later loads map the cached file in
+    loaded = load_timestamps(text_file_path, cache=cache)
+    assert isinstance(loaded, np.memmap) and np.array_equal(loaded, timestamps)
+    assert cache.hits == 1
+
+    # The least recently parsed files are evicted to keep the cache under its maximum size
+    other_text_file_path = tmp_path / "other_timestamps.txt"
+    other_text_file_path.write_text("\n".join(map(repr, timestamps[::-1].tolist())) + "\n")
+    assert np.array_equal(load_timestamps(other_text_file_path, cache=cache), timestamps[::-1])
+    assert cache.evictions == 1 and cache.info()["size"] == 1
+
+    np.save(tmp_path / "timestamps.npy", timestamps[:, np.newaxis])
+    assert np.array_equal(load_timestamps(tmp_path / "timestamps.npy"), timestamps)
+
+    timestamps.astype("<f8").tofile(tmp_path / "timestamps.bin")
+    loaded = load_timestamps(tmp_path / "timestamps.bin")
+    assert isinstance(loaded, np.memmap) and np.array_equal(loaded, timestamps)
+
+    loaded[0] = 0.0  # Copy-on-write
+    assert load_timestamps(tmp_path / "timestamps.bin")[0] == 5.0
+
+    (tmp_path / "invalid.csv").write_text("time\n1.0\n")
+    with pytest.raises(ValueError):
+        load_timestamps(tmp_path / "invalid.csv", cache=cache)
+
+
+def test_interface_timestamp_cache(spikeglx_phy_info, tmp_path, monkeypatch):
+    """Original timestamps are computed once per source file, and the least recently used ones are evicted."""
+    import os
+
+    import numpy as np
+    from manageNeuroconv import manage_neuroconv
+    from manageNeuroconv.timestamps import TimestampCache
+    from neuroconv.basetemporalalignmentinterface import BaseTemporalAlignmentInterface
+    from neuroconv.datainterfaces import SpikeGLXRecordingInterface
+
+    cache = TimestampCache(folder_path=tmp_path / "cache", max_bytes=8_500)
+    monkeypatch.setattr(manage_neuroconv, "interface_timestamp_cache", cache)
+
+    class MockVideoInterface(BaseTemporalAlignmentInterface):
+        decoded = 0
+
+        def get_original_timestamps(self):
+            MockVideoInterface.decoded += 1
+            return [np.arange(float(os.path.getsize(self.source_data["file_path"])))]
+
+        def get_timestamps(self):
+            return self.get_original_timestamps()
+
+        def set_aligned_timestamps(self, aligned_timestamps):
+            pass
+
+        def add_to_nwbfile(self, nwbfile, metadata):
+            pass
+
+    file_path = tmp_path / "video.avi"
+    file_path.write_bytes(b"0" * 100)
+
+    for _ in range(2):
+        interface = MockVideoInterface(file_path=str(file_path))
+        manage_neuroconv.cache_original_timestamps(interface)
+        timestamps = interface.get_timestamps()
+        assert isinstance(timestamps, list) and np.array_equal(timestamps[0], np.arange(100.0))
+
+    assert MockVideoInterface.decoded == 1 and cache.hits == 1
+
+    # Modifying the file invalidates its entry
+    file_path.write_bytes(b"0" * 1000)
+    os.utime(file_path, ns=(0, os.stat(file_path).st_mtime_ns + 1))
+    assert len(interface.get_timestamps()[0]) == 1000
+    assert MockVideoInterface.decoded == 2
+
+    # The older entry is evicted to keep the cache under its maximum size
+    assert cache.evictions == 1 and cache.info()["size"] == 1
+
+    assert not cache.set("text", [np.array(["a"])])
+
+    # The timestamps of recordings without a time vector are cheap to compute, and thus not cached
+    recording_interface = SpikeGLXRecordingInterface(**spikeglx_phy_info["source_data"]["SpikeGLX"])
+    manage_neuroconv.cache_original_timestamps(recording_interface)
+    assert "get_original_timestamps" not in vars(recording_interface)
+
+
+def test_apply_json_patch():
+    """Patches are applied to a copy that shares all unmodified parts with the original document."""
+    import pytest
+    from manageNeuroconv.sessions import apply_json_patch
+
+    document = dict(metadata=dict(rows=[dict(a=1), dict(a=2)], name="x"), source_data=dict(path="p"))
+    patched = apply_json_patch(
+        document,
+        [
+            dict(op="replace", path="/metadata/rows/1/a", value=3),
+            dict(op="add", path="/metadata/rows/-", value=dict(a=4)),
+            dict(op="copy", **{"from": "/metadata/name"}, path="/metadata/copied~1name"),
+            dict(op="move", **{"from": "/metadata/name"}, path="/metadata/moved"),
+            dict(op="remove", path="/metadata/rows/0"),
+            dict(op="test", path="/metadata/rows/0/a", value=3),
+        ],
+    )
+
+    assert patched == dict(
+        metadata={"rows": [dict(a=3), dict(a=4)], "copied/name": "x", "moved": "x"}, source_data=dict(path="p")
+    )
+    assert document == dict(metadata=dict(rows=[dict(a=1), dict(a=2)], name="x"), source_data=dict(path="p"))
+    assert patched["source_data"] is document["source_data"]
+
+    for invalid_patch in (
+        [dict(op="remove", path="/metadata/missing")],
+        [dict(op="replace", path="/metadata/rows/01/a", value=0)],
+        [dict(op="test", path="/metadata/name", value="y")],
+        [dict(op="add", path="/metadata/name/child", value=0)],
+    ):
+        with pytest.raises(ValueError):
+            apply_json_patch(document, invalid_patch)
+
+
+def test_session_store(client, spikeglx_phy_info):
+    """Requests can refer to a stored session, which is updated with patches against its latest version."""
+    session = post("/neuroconv/sessions", spikeglx_phy_info, client)
+    assert session["version"] == 0
+
+    patch = [dict(op="add", path="/alignment", value=dict(SpikeGLX=dict(selected="start", values=dict(start=5.0))))]
+    session_path = f"/neuroconv/sessions/{session['session_id']}"
+    assert client.patch(session_path, json=dict(version=0, patch=patch)).json["version"] == 1
+    assert client.patch(session_path, json=dict(version=0, patch=patch)).json["type"] == "SessionVersionConflictError"
+    assert client.patch(session_path, json=dict(version=1, patch=[dict(op="remove", path="/x")])).json["type"] == (
+        "ValueError"
+    )
+    assert get(session_path[1:], client)["document"]["alignment"]["SpikeGLX"]["values"]["start"] == 5.0
+
+    # Incomplete patches are rejected as bad requests
+    response = client.patch(session_path, json=dict(patch=patch))
+    assert response.status_code == 400 and "'version'" in response.json["message"]
+    assert client.patch(session_path, json=dict(version="1", patch=patch)).status_code == 400
+
+    alignment = post("/neuroconv/alignment", dict(session_id=session["session_id"], session_version=1), client)
+    assert alignment["timestamps"]["SpikeGLX"]["first"] == 5.0
+
+    assert client.delete(session_path).json["removed"]
+    assert client.get(session_path).json["type"] == "SessionNotFoundError"
+
+
+def test_metadata_layers():
+    """Layered metadata is coerced per layer, and the shared layers are only coerced once per worker."""
+    from manageNeuroconv.manage_neuroconv import (
+        coerced_metadata_layer_cache,
+        get_metadata_layers,
+        replace_none_with_nan,
+        resolve_metadata_layers,
+        set_metadata_layers,
+    )
+
+    schema = {
+        "type": "object",
+        "properties": {
+            "Subject": {"type": "object", "properties": {"weight": {"type": "number"}}},
+            "NWBFile": {"type": "object", "properties": {"rate": {"type": "number"}}},
+        },
+    }
+    project = dict(NWBFile=dict(rate=None, lab="lab"), Subject=dict(species="Mus musculus", weight="NaN"))
+    subjects = dict(m1=dict(Subject=dict(subject_id="m1", weight="2.5")))
+
+    set_metadata_layers(dict(project=project, subjects=subjects))
+    try:
+        session_info = dict(subject="m1", metadata=dict(NWBFile=dict(session_description="first")))
+        first = resolve_metadata_layers(get_metadata_layers(session_info), schema)
+        hits = coerced_metadata_layer_cache.hits
+        second = resolve_metadata_layers(get_metadata_layers(session_info), schema)
+        assert coerced_metadata_layer_cache.hits == hits + 1
+    finally:
+        set_metadata_layers(None)
+
+    merged = dict(
+        NWBFile=dict(rate=None, lab="lab", session_description="first"),
+        Subject=dict(species="Mus musculus", weight="2.5", subject_id="m1"),
+    )
+    expected = replace_none_with_nan(merged, schema, nan_strings=True)
+    assert str(first) == str(second) == str(expected)  # NaN values are not equal to themselves
+
+    # The resolved metadata can be modified without affecting the shared layers
+    first["Subject"]["weight"] = 0
+    assert second["Subject"]["weight"] == 2.5
+    assert project["Subject"]["weight"] == "NaN"
+
+    # Layers provided with a request are used as-is
+    request_info = dict(metadata_layers=dict(project=project), metadata=dict())
+    assert [key for key, _ in get_metadata_layers(request_info)] == [None, None]
+
+
+def test_check_registry(client, tmp_path):
+    """The inspector checks are configured once, until invalidated or until their configuration file changes."""
+    import os
+
+    from manageNeuroconv.checks import CheckRegistry
+    from manageNeuroconv.manage_neuroconv import check_registry
+
+    metadata = dict(subject_id="m1", species="Mus musculus", sex="M", age="P30D")
+    validate_info = dict(parent=metadata, function_name="check_subject_species_exists")
+    post("/neuroconv/validate", validate_info, client)
+    builds = check_registry.builds
+    post("/neuroconv/validate", validate_info, client)
+    assert check_registry.builds == builds
+
+    assert client.delete("/neuroconv/validate/checks").json["configured"] is False
+    post("/neuroconv/validate", validate_info, client)
+    assert get("neuroconv/validate/checks", client)["builds"] == builds + 1
+
+    config_file_path = tmp_path / "config.yaml"
+    config_file_path.write_text("CRITICAL:\n  - check_subject_species_exists\n")
+    registry = CheckRegistry(config=str(config_file_path))
+    assert registry.get("check_subject_species_exists").importance.name == "CRITICAL"
+    registry.get_checks()
+    assert registry.builds == 1
+
+    config_file_path.write_text("SKIP:\n  - check_subject_species_exists\n")
+    os.utime(config_file_path, ns=(0, os.stat(config_file_path).st_mtime_ns + 1))
+    assert "check_subject_species_exists" not in registry.get_checks()
+    assert registry.builds == 2
+
+
+def test_batch_validation(client):
+    """A batch validation returns the same messages as validating each check separately, grouped by field."""
+    subject = dict(subject_id="m1", species="mouse", sex="X", age="30 days")
+    nwbfile = dict(session_start_time="2024-01-01T10:00:00", experimenter=["Smith"], institution="")
+
+    field_checks = dict(
+        Subject=dict(
+            sex=["check_subject_sex"], species=["check_subject_species_form"], subject_id="check_subject_id_exists"
+        ),
+        NWBFile=dict(
+            experimenter=["check_experimenter_form"], institution=["check_institution"], description="check_description"
+        ),
+    )
+    metadata = dict(Subject=subject, NWBFile=nwbfile)
+    results = post("/neuroconv/validate/batch", dict(metadata=metadata, checks=field_checks, timezone="UTC"), client)
+
+    for section, fields in field_checks.items():
+        assert set(results[section]) == set(fields)
+        for field, check_names in fields.items():
+            expected = list()
+            for check_name in [check_names] if isinstance(check_names, str) else check_names:
+                if check_name == "check_description":  # Not supported by the single validation
+                    continue
+                validate_info = dict(parent=metadata[section], function_name=check_name, timezone="UTC")
+                output = post("/neuroconv/validate", validate_info, client)
+                expected.extend([] if output is None else output if isinstance(output, list) else [output])
+            assert [message["message"] for message in results[section][field]] == [
+                message["message"] for message in expected
+            ]
+
+    assert results["Subject"]["sex"] and not results["Subject"]["subject_id"]
+
+    # All DANDI-configured checks of each section are run by default, grouped by check name
+    threaded = post("/neuroconv/validate/batch", dict(metadata=metadata, max_workers=4), client)
+    assert "check_subject_age" in threaded["Subject"] and "check_session_start_time_old_date" in threaded["NWBFile"]
+    assert threaded == post("/neuroconv/validate/batch", dict(metadata=metadata), client)
+
+
+def test_validation_result_cache(monkeypatch):
+    """Repeated validations of the same metadata are served from the cache, without building any pynwb object."""
+    import manageNeuroconv.manage_neuroconv as manage_neuroconv
+    import pytest
+    from manageNeuroconv.manage_neuroconv import (
+        validate_metadata,
+        validate_metadata_batch,
+        validation_result_cache,
+    )
+
+    validation_result_cache.clear()
+    subject = dict(subject_id="m1", species="mouse", sex="M", age="P30D")
+    first = validate_metadata(subject, "check_subject_species_form", "UTC")
+    assert first is not None
+
+    def fail(*args, **kwargs):
+        raise AssertionError("A pynwb object was built for cached results.")
+
+    monkeypatch.setattr(manage_neuroconv, "create_subject", fail)
+
+    hits = validation_result_cache.hits
+    reordered_subject = dict(reversed(list(subject.items())))
+    assert validate_metadata(reordered_subject, "check_subject_species_form", "UTC") is first
+    assert validation_result_cache.hits == hits + 1
+
+    # The batch validation shares the same results
+    results = validate_metadata_batch(
+        dict(Subject=subject), checks=dict(Subject=["check_subject_species_form"]), timezone="UTC"
+    )
+    assert results["Subject"]["check_subject_species_form"] == [first]
+
+    # Other timezones are separate entries
+    with pytest.raises(AssertionError):
+        validate_metadata(subject, "check_subject_species_form", "Europe/Paris")
+
+
+def test_electrode_table_from_columns():
+    """Electrode tables are assembled from whole property columns, with defaults for the overridden properties."""
+    from types import SimpleNamespace
+
+    import numpy as np
+    from manageNeuroconv.manage_neuroconv import (
+        get_electrode_columns_json,
+        get_electrode_table_json,
+    )
+    from spikeinterface.core import NumpyRecording
+
+    recording = NumpyRecording(traces_list=[np.zeros((10, 3), dtype="int16")], sampling_frequency=30_000.0)
+    recording.set_property(key="gain_to_uV", values=np.array([0.5, 1.0, np.nan]))
+    recording.set_property(key="group_name", values=np.array(["a", "b", "c"]))
+    interface = SimpleNamespace(recording_extractor=recording)
+
+    columns = {column["name"]: column["data_type"] for column in get_electrode_columns_json(interface)}
+    assert columns == dict(gain_to_uV="float64", group_name="str", brain_area="str")
+
+    table = get_electrode_table_json(interface)
+    assert table[:2] == [
+        dict(gain_to_uV=0.5, group_name="a", brain_area="unknown"),
+        dict(gain_to_uV=1.0, group_name="b", brain_area="unknown"),
+    ]
+    assert np.isnan(table[2]["gain_to_uV"])
+
+
+def test_electrode_table_write_back_skips_unchanged_columns():
+    """Edited electrode tables are written back with one call per changed column, including partial columns."""
+    from types import SimpleNamespace
+
+    import numpy as np
+    from manageNeuroconv.manage_neuroconv import (
+        update_recording_properties_from_table_as_json,
+    )
+    from spikeinterface.core import NumpyRecording
+
+    recording = NumpyRecording(traces_list=[np.zeros((10, 3), dtype="int16")], sampling_frequency=30_000.0)
+    recording.set_property(key="gain_to_uV", values=np.array([0.5, 1.0, np.nan]))
+    recording.set_property(key="group_name", values=np.array(["a", "b", "c"]))
+    interface = SimpleNamespace(recording_extractor=recording)
+
+    column_info = [
+        dict(name="gain_to_uV", data_type="float64"),
+        dict(name="group_name", data_type="str"),
+        dict(name="brain_area", data_type="str"),
+    ]
+    table = [
+        dict(gain_to_uV=0.5, group_name="a", brain_area="CA1"),
+        dict(gain_to_uV=1.0, group_name="b", brain_area="CA3"),
+        dict(gain_to_uV=None, group_name="renamed"),  # Missing cells are left untouched
+    ]
+
+    written = update_recording_properties_from_table_as_json(
+        interface, electrode_column_info=column_info, electrode_table_json=table
+    )
+
+    assert written == ["group_name", "brain_area"]
+    assert recording.get_property("group_name").tolist() == ["a", "b", "renamed"]
+    assert recording.get_property("brain_area").tolist()[:2] == ["CA1", "CA3"]
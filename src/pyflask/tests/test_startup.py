@@ -1,7 +1,67 @@
+import time
+
 from utils import get, get_converter_output_schema, post
 
 
+def wait_for_readiness(client, timeout: float = 120.0) -> dict:
+    start = time.time()
+    readiness = get("startup/readiness", client)
+    while not readiness["ready"] and time.time() - start < timeout:
+        if any(stage["status"] == "failed" for stage in readiness["stages"].values()):
+            break
+        time.sleep(0.1)
+        readiness = get("startup/readiness", client)
+
+    return readiness
+
+
 def test_preload_imports(client):
     """Verify that the preload import endpoint returned good status."""
     result = get("startup/preload-imports", client)
     assert result == True
+
+
+def test_readiness(client):
+    """Verify that each warm-up stage becomes ready."""
+    get("startup/preload-imports", client)
+    post("startup/warmup?interfaces=SpikeGLXRecordingInterface,PhySortingInterface", None, client)
+
+    readiness = wait_for_readiness(client)
+    assert readiness["ready"] == True
+    assert set(readiness["stages"]) == {"core", "interfaces", "inspector"}
+    assert readiness["stages"]["interfaces"]["details"]["interfaces"] == [
+        "SpikeGLXRecordingInterface",
+        "PhySortingInterface",
+    ]
+
+
+def test_interface_warm_up_retries_failures():
+    """Interfaces are only marked as warmed once imported, and the results of each call are merged."""
+    from manageNeuroconv.warmup import WarmUp
+
+    warm_up = WarmUp()
+    stage = warm_up.warm_interfaces(["SpikeGLXRecordingInterface", "UnknownInterface"]).result()
+    assert stage["details"]["interfaces"] == ["SpikeGLXRecordingInterface"]
+    assert "UnknownInterface" in stage["details"]["errors"]
+
+    # Failed interfaces are retried, while the ones already warmed are kept in the results
+    future = warm_up.warm_interfaces(["UnknownInterface"])
+    assert future.result()["details"]["interfaces"] == ["SpikeGLXRecordingInterface"]
+    assert "UnknownInterface" in future.result()["details"]["errors"]
+
+    assert warm_up.warm_interfaces(["SpikeGLXRecordingInterface"]) is future
+
+
+def test_startup_timeline(client):
+    """Verify that the startup timeline reports the phases and imports of the backend."""
+    get("startup/preload-imports", client)
+    wait_for_readiness(client)
+
+    result = get("startup/timeline?top=10", client)
+    assert result["finished"] == True
+    assert len(result["imports"]) <= 10
+    assert result["number_of_imports"] >= len(result["imports"])
+
+    phase_names = [phase["name"] for phase in result["phases"]]
+    assert "namespaces imported" in phase_names
+    assert "startup complete" in phase_names
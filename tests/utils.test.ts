@@ -303,6 +303,19 @@ describe('Type Check Utilities', () => {
       expect(typecheck.isObject(Symbol('symbol'))).toBe(false);
     });
   })
+  describe('isTableSummary', () => {
+
+    it('should return true for table summaries', () => {
+      expect(typecheck.isTableSummary({ columns: ['channel_name'], data_types: ['str'], row_count: 384 })).toBe(true);
+      expect(typecheck.isTableSummary({ columns: [], data_types: [], row_count: 0 })).toBe(true);
+    });
+
+    it('should return false for rows and columnar tables', () => {
+      expect(typecheck.isTableSummary([{ channel_name: 'AP0' }])).toBe(false);
+      expect(typecheck.isTableSummary({ columns: ['channel_name'], values: [['AP0']], row_count: 1 })).toBe(false);
+      expect(typecheck.isTableSummary(undefined)).toBe(false);
+    });
+  })
 
 
 })